@@ -9,15 +9,47 @@ Responsabilidade:
 Padrão: Interface (ABC) + Implementação concreta.
 """
 
-from app.adaptadores.email_adaptador import EmailAdaptador, FormspreeEmailAdaptador
-from app.adaptadores.repositorio import RepositorioPortfolio, RepositorioJSON
+from app.adaptadores.email_adaptador import (
+    EmailAdaptador,
+    FormspreeEmailAdaptador,
+    DisjuntorEmailAdaptador,
+    MultiProvedorEmailAdaptador,
+)
+from app.adaptadores.caixa_saida import CaixaSaida, CaixaSaidaMemoria, ItemCaixaSaida
+from app.adaptadores.caixa_saida_sqlite import CaixaSaidaSQLite
+from app.adaptadores.repositorio import (
+    RepositorioPortfolio,
+    RepositorioEmMemoria,
+    RepositorioJSON,
+    SnapshotPortfolio,
+    EstatisticasCache,
+)
+from app.adaptadores.repositorio_bundle import RepositorioBundle
+from app.adaptadores.repositorio_sqlite import RepositorioSQLite
+from app.adaptadores.repositorio_assincrono import (
+    RepositorioPortfolioAssincrono,
+    RepositorioAssincrono,
+)
 from app.adaptadores.logger_adaptador import LoggerAdaptador, LoggerEstruturado
 
 __all__ = [
     "EmailAdaptador",
     "FormspreeEmailAdaptador",
+    "DisjuntorEmailAdaptador",
+    "MultiProvedorEmailAdaptador",
+    "CaixaSaida",
+    "CaixaSaidaMemoria",
+    "CaixaSaidaSQLite",
+    "ItemCaixaSaida",
     "RepositorioPortfolio",
+    "RepositorioEmMemoria",
     "RepositorioJSON",
+    "RepositorioBundle",
+    "RepositorioSQLite",
+    "SnapshotPortfolio",
+    "EstatisticasCache",
+    "RepositorioPortfolioAssincrono",
+    "RepositorioAssincrono",
     "LoggerAdaptador",
     "LoggerEstruturado",
 ]
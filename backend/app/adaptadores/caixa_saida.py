@@ -0,0 +1,223 @@
+"""
+Adaptador de caixa de saída (outbox) para mensagens de contato.
+
+O endpoint de contato só grava a mensagem aqui e responde 202; workers
+de entrega (EntregarContatoUseCase) reservam mensagens vencidas, tentam
+o envio e concluem ou reagendam com backoff.
+
+Interface abstrata + implementação em memória (perde mensagens
+pendentes se o processo morrer). A versão durável fica em
+caixa_saida_sqlite.py.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+
+from app.core.excecoes import ErroServicoIndisponivel
+from app.entidades.mensagem import Mensagem
+
+
+@dataclass(eq=False)
+class ItemCaixaSaida:
+    """
+    Mensagem na caixa de saída com seu estado de entrega.
+
+    Attributes:
+        mensagem: Mensagem a entregar.
+        tentativas: Tentativas de envio já feitas.
+        criado_em: Instante em que entrou na caixa (epoch, segundos).
+        proxima_tentativa: Quando pode ser reservada de novo (epoch); em
+            um item reservado, o fim da reserva.
+    """
+
+    mensagem: Mensagem
+    tentativas: int = 0
+    criado_em: float = field(default_factory=time.time)
+    proxima_tentativa: float = field(default_factory=time.time)
+
+
+class CaixaSaida(ABC):
+    """
+    Interface da caixa de saída.
+
+    Ciclo de um item: adicionar → reservar → concluir | reagendar |
+    descartar. Itens reservados não voltam a ser reservados até serem
+    reagendados.
+
+    Attributes:
+        duravel: Se os itens sobrevivem ao fim do processo (os que ficam
+            em backoff no shutdown são entregues no próximo início).
+    """
+
+    duravel = False
+
+    @abstractmethod
+    async def adicionar(self, mensagem: Mensagem) -> None:
+        """
+        Grava mensagem para entrega.
+
+        Args:
+            mensagem: Mensagem validada.
+
+        Raises:
+            ErroServicoIndisponivel: Se a caixa está cheia.
+        """
+        pass
+
+    @abstractmethod
+    async def reservar(self, maximo: int) -> list[ItemCaixaSaida]:
+        """
+        Reserva até `maximo` itens com tentativa vencida.
+
+        Args:
+            maximo: Tamanho máximo do lote.
+
+        Returns:
+            list[ItemCaixaSaida]: Itens reservados (vazio se nenhum vencido).
+        """
+        pass
+
+    @abstractmethod
+    async def concluir(self, item: ItemCaixaSaida) -> None:
+        """Remove item entregue."""
+        pass
+
+    @abstractmethod
+    async def reagendar(
+        self, item: ItemCaixaSaida, atraso: float, contar_tentativa: bool = True
+    ) -> None:
+        """
+        Devolve item para nova tentativa após `atraso` segundos.
+
+        Args:
+            item: Item reservado.
+            atraso: Segundos até a próxima tentativa.
+            contar_tentativa: False quando o envio nem foi tentado
+                (ex.: disjuntor aberto).
+        """
+        pass
+
+    @abstractmethod
+    async def descartar(self, item: ItemCaixaSaida) -> None:
+        """Remove item que esgotou as tentativas."""
+        pass
+
+    @abstractmethod
+    async def aguardar(self, timeout: float) -> None:
+        """
+        Espera um item vencer ou chegar, até `timeout` segundos.
+
+        Args:
+            timeout: Espera máxima.
+        """
+        pass
+
+    @abstractmethod
+    def profundidade(self) -> int:
+        """Itens pendentes ou em entrega (chamado no event loop: sem I/O)."""
+        pass
+
+    @abstractmethod
+    def idade_mais_antiga(self) -> float:
+        """Segundos desde a criação do pendente mais antigo (0 se vazia; sem I/O)."""
+        pass
+
+    async def recuperar(self) -> int:
+        """
+        Prepara a caixa no startup.
+
+        Returns:
+            int: Mensagens herdadas de execuções anteriores (0 em memória).
+        """
+        return 0
+
+    async def fechar(self) -> None:
+        """Libera recursos no shutdown (nada a fazer em memória)."""
+        pass
+
+
+class CaixaSaidaMemoria(CaixaSaida):
+    """
+    Caixa de saída em memória, limitada, para uso no event loop.
+
+    Pendentes ficam em um heap por próxima tentativa; os reservados, em
+    um conjunto até serem concluídos ou reagendados.
+
+    Attributes:
+        maximo: Capacidade (pendentes + em entrega).
+    """
+
+    def __init__(self, maximo: int = 1000):
+        """
+        Inicializa caixa vazia.
+
+        Args:
+            maximo: Capacidade (pendentes + em entrega).
+        """
+        self.maximo = maximo
+        self._pendentes: list[tuple[float, int, ItemCaixaSaida]] = []
+        self._reservados: set[ItemCaixaSaida] = set()
+        self._sequencia = itertools.count()
+        self._novo = asyncio.Event()
+
+    def _empilhar(self, item: ItemCaixaSaida) -> None:
+        heapq.heappush(
+            self._pendentes, (item.proxima_tentativa, next(self._sequencia), item)
+        )
+        self._novo.set()
+
+    async def adicionar(self, mensagem: Mensagem) -> None:
+        if self.profundidade() >= self.maximo:
+            raise ErroServicoIndisponivel(
+                "Caixa de saída de contato cheia",
+                codigo="FILA_CONTATO_CHEIA",
+                origem="caixa_saida",
+            )
+        self._empilhar(ItemCaixaSaida(mensagem))
+
+    async def reservar(self, maximo: int) -> list[ItemCaixaSaida]:
+        agora = time.time()
+        itens: list[ItemCaixaSaida] = []
+        while self._pendentes and len(itens) < maximo and self._pendentes[0][0] <= agora:
+            _, _, item = heapq.heappop(self._pendentes)
+            self._reservados.add(item)
+            itens.append(item)
+        return itens
+
+    async def concluir(self, item: ItemCaixaSaida) -> None:
+        self._reservados.discard(item)
+
+    async def reagendar(
+        self, item: ItemCaixaSaida, atraso: float, contar_tentativa: bool = True
+    ) -> None:
+        self._reservados.discard(item)
+        item.tentativas += contar_tentativa
+        item.proxima_tentativa = time.time() + atraso
+        self._empilhar(item)
+
+    async def descartar(self, item: ItemCaixaSaida) -> None:
+        self._reservados.discard(item)
+
+    async def aguardar(self, timeout: float) -> None:
+        if self._pendentes:
+            timeout = min(timeout, max(self._pendentes[0][0] - time.time(), 0.0))
+        if timeout <= 0:
+            return
+        # Sem await entre a verificação acima e o clear: nenhum item novo se perde
+        self._novo.clear()
+        try:
+            await asyncio.wait_for(self._novo.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def profundidade(self) -> int:
+        return len(self._pendentes) + len(self._reservados)
+
+    def idade_mais_antiga(self) -> float:
+        criados = [item.criado_em for _, _, item in self._pendentes]
+        criados.extend(item.criado_em for item in self._reservados)
+        return time.time() - min(criados) if criados else 0.0
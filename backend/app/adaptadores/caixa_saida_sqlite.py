@@ -0,0 +1,356 @@
+"""
+Adaptador de caixa de saída de contato em SQLite.
+
+Implementação durável de CaixaSaida: cada mensagem vira uma linha (chave
+primária = Mensagem.id, a chave de idempotência) e só muda de status
+depois disso:
+
+    pendente → em_entrega → enviada | pendente (nova tentativa) | descartada
+
+Reservar é um único UPDATE ... RETURNING que marca as linhas como
+`em_entrega` e empurra `proxima_tentativa` para o fim da reserva de cada
+uma; esse valor identifica a reserva. O worker envia o lote em
+sequência, então a n-ésima linha recebe n × `reserva` segundos: cada
+item tem o prazo inteiro a partir da vez dele, não do início do lote.
+Concluir, reagendar e devolver só alteram a
+linha se ela ainda está `em_entrega` com a mesma reserva: quem perdeu a
+reserva (vencida e assumida por outro worker) não sobrescreve o novo
+dono. Se o processo morrer no meio do envio, a reserva vence e a linha
+volta a ser reservada por qualquer worker (entrega pelo menos uma vez).
+No shutdown normal, as reservas do processo são devolvidas na hora.
+
+Modo WAL com synchronous=NORMAL: o commit não espera fsync, então gravar
+no POST custa microssegundos e sobrevive a crash do processo (não a
+queda de energia). Vários processos (workers do uvicorn) podem dividir o
+mesmo arquivo.
+
+Nenhuma consulta roda no event loop: profundidade e idade vêm de um
+resumo guardado após cada escrita e relido (em thread) a cada `aguardar`,
+o que também traz o que outros processos gravaram.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import anyio.to_thread
+
+from app.adaptadores.caixa_saida import CaixaSaida, ItemCaixaSaida
+from app.core.excecoes import ErroServicoIndisponivel
+from app.entidades.mensagem import Mensagem
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS caixa_saida_contato (
+    id TEXT PRIMARY KEY,
+    nome TEXT NOT NULL,
+    email TEXT NOT NULL,
+    assunto TEXT NOT NULL,
+    mensagem TEXT NOT NULL,
+    status TEXT NOT NULL,
+    tentativas INTEGER NOT NULL,
+    criado_em REAL NOT NULL,
+    proxima_tentativa REAL NOT NULL,
+    atualizado_em REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_caixa_saida_contato_status
+    ON caixa_saida_contato (status, proxima_tentativa);
+"""
+
+# Pendentes e em entrega (a reserva vencida conta como pendente)
+_ATIVAS = "status IN ('pendente', 'em_entrega')"
+
+_SQL_CONTAR_ATIVAS = f"SELECT COUNT(*) FROM caixa_saida_contato WHERE {_ATIVAS}"
+_SQL_INSERIR = """
+    INSERT OR IGNORE INTO caixa_saida_contato
+        (id, nome, email, assunto, mensagem, status, tentativas,
+         criado_em, proxima_tentativa, atualizado_em)
+    VALUES (?, ?, ?, ?, ?, 'pendente', 0, ?, ?, ?)
+"""
+_SQL_RESERVAR = f"""
+    UPDATE caixa_saida_contato
+    SET status = 'em_entrega',
+        proxima_tentativa = :agora + :reserva * vencidas.posicao,
+        atualizado_em = :agora
+    FROM (
+        SELECT id, ROW_NUMBER() OVER (ORDER BY proxima_tentativa) AS posicao
+        FROM caixa_saida_contato
+        WHERE {_ATIVAS} AND proxima_tentativa <= :agora
+        ORDER BY proxima_tentativa
+        LIMIT :maximo
+    ) AS vencidas
+    WHERE caixa_saida_contato.id = vencidas.id
+    RETURNING caixa_saida_contato.id, nome, email, assunto, mensagem, tentativas,
+        criado_em, caixa_saida_contato.proxima_tentativa
+"""
+# Só com a reserva ainda nossa (id e fim da reserva são os últimos parâmetros)
+_DONO_DA_RESERVA = "id = ? AND status = 'em_entrega' AND proxima_tentativa = ?"
+
+_SQL_FINALIZAR = f"""
+    UPDATE caixa_saida_contato SET status = ?, atualizado_em = ?
+    WHERE {_DONO_DA_RESERVA}
+"""
+_SQL_REAGENDAR = f"""
+    UPDATE caixa_saida_contato
+    SET status = 'pendente', tentativas = ?, proxima_tentativa = ?, atualizado_em = ?
+    WHERE {_DONO_DA_RESERVA}
+"""
+_SQL_LIBERAR = f"""
+    UPDATE caixa_saida_contato
+    SET status = 'pendente', proxima_tentativa = ?, atualizado_em = ?
+    WHERE {_DONO_DA_RESERVA}
+"""
+_SQL_RESUMO = f"""
+    SELECT COUNT(*), MIN(criado_em), MIN(proxima_tentativa)
+    FROM caixa_saida_contato WHERE {_ATIVAS}
+"""
+_SQL_EXPURGAR = """
+    DELETE FROM caixa_saida_contato
+    WHERE status IN ('enviada', 'descartada') AND atualizado_em < ?
+"""
+
+
+class CaixaSaidaSQLite(CaixaSaida):
+    """
+    Caixa de saída persistida em SQLite.
+
+    Todo acesso ao banco usa uma conexão (serializada por trava) em
+    thread via anyio.to_thread. Profundidade e idade, usadas por /metrics
+    e pela drenagem no event loop, leem o último resumo guardado.
+
+    Attributes:
+        caminho_banco: Arquivo SQLite (criado na primeira gravação).
+        maximo: Capacidade (pendentes + em entrega).
+        reserva: Segundos até uma reserva sem conclusão voltar à fila.
+        retencao: Segundos que mensagens enviadas/descartadas ficam na
+            tabela antes do expurgo no startup (0 guarda para sempre).
+    """
+
+    duravel = True
+
+    def __init__(
+        self,
+        caminho_banco: str | Path = "dados/contato.db",
+        maximo: int = 1000,
+        reserva: float = 60.0,
+        retencao: float = 30 * 86400,
+    ):
+        """
+        Inicializa caixa (as conexões abrem sob demanda).
+
+        Args:
+            caminho_banco: Caminho do arquivo de banco.
+            maximo: Capacidade (pendentes + em entrega).
+            reserva: Segundos de posse de um item reservado, contados a
+                partir da vez dele no lote; deve passar com folga do pior
+                tempo de um envio.
+            retencao: Segundos de histórico de enviadas/descartadas.
+        """
+        self.caminho_banco = Path(caminho_banco)
+        self.maximo = maximo
+        self.reserva = reserva
+        self.retencao = retencao
+        self._escritor: sqlite3.Connection | None = None
+        self._trava = threading.Lock()
+        # Contagem, criação mais antiga e próxima tentativa das ativas
+        self._resumo: tuple[int, float | None, float | None] = (0, None, None)
+        # id → fim da reserva (o valor gravado em proxima_tentativa)
+        self._reservados: dict[str, float] = {}
+        self._novo = asyncio.Event()
+
+    def _abrir(self) -> sqlite3.Connection:
+        """Abre a conexão de escrita e cria o esquema (chamado com a trava)."""
+        if self._escritor is None:
+            self.caminho_banco.parent.mkdir(parents=True, exist_ok=True)
+            # check_same_thread=False: usada por threads do anyio, sempre
+            # sob self._trava
+            conexao = sqlite3.connect(
+                self.caminho_banco, isolation_level=None, check_same_thread=False
+            )
+            conexao.execute("PRAGMA journal_mode = WAL")
+            conexao.execute("PRAGMA synchronous = NORMAL")
+            conexao.execute("PRAGMA busy_timeout = 5000")
+            conexao.executescript(ESQUEMA)
+            self._escritor = conexao
+        return self._escritor
+
+    def _atualizar_resumo(self, conexao: sqlite3.Connection) -> None:
+        """Relê o resumo das ativas (chamado com a trava, em thread)."""
+        self._resumo = tuple(conexao.execute(_SQL_RESUMO).fetchone())
+
+    def _ler_resumo(self) -> tuple[int, float | None, float | None]:
+        with self._trava:
+            self._atualizar_resumo(self._abrir())
+            return self._resumo
+
+    def _adicionar(self, mensagem: Mensagem) -> None:
+        agora = time.time()
+        with self._trava:
+            conexao = self._abrir()
+            conexao.execute("BEGIN IMMEDIATE")
+            try:
+                if conexao.execute(_SQL_CONTAR_ATIVAS).fetchone()[0] >= self.maximo:
+                    raise ErroServicoIndisponivel(
+                        "Caixa de saída de contato cheia",
+                        codigo="FILA_CONTATO_CHEIA",
+                        origem="caixa_saida",
+                    )
+                # OR IGNORE: regravar o mesmo id não duplica a entrega
+                conexao.execute(
+                    _SQL_INSERIR,
+                    (
+                        mensagem.id,
+                        mensagem.nome,
+                        mensagem.email,
+                        mensagem.assunto,
+                        mensagem.mensagem,
+                        agora,
+                        agora,
+                        agora,
+                    ),
+                )
+            except BaseException:
+                conexao.execute("ROLLBACK")
+                raise
+            conexao.execute("COMMIT")
+            self._atualizar_resumo(conexao)
+
+    def _reservar(self, maximo: int) -> list[ItemCaixaSaida]:
+        agora = time.time()
+        with self._trava:
+            conexao = self._abrir()
+            linhas = conexao.execute(
+                _SQL_RESERVAR,
+                {"agora": agora, "reserva": self.reserva, "maximo": maximo},
+            ).fetchall()
+            self._reservados.update((linha[0], linha[-1]) for linha in linhas)
+            if linhas:
+                self._atualizar_resumo(conexao)
+        # Na ordem das reservas: a de prazo mais curto é enviada primeiro
+        linhas.sort(key=lambda linha: linha[-1])
+        return [
+            ItemCaixaSaida(
+                Mensagem(
+                    nome=nome, email=email, assunto=assunto, mensagem=texto, id=id_
+                ),
+                tentativas=tentativas,
+                criado_em=criado_em,
+                proxima_tentativa=expira,
+            )
+            for id_, nome, email, assunto, texto, tentativas, criado_em, expira in linhas
+        ]
+
+    def _atualizar(self, id_: str, reserva: float, sql: str, parametros: tuple) -> None:
+        """
+        Executa UPDATE de um item reservado, se a reserva ainda é dele.
+
+        Sem linha alterada, a reserva venceu e outro worker assumiu o
+        item; o resultado deste envio é ignorado.
+        """
+        with self._trava:
+            conexao = self._abrir()
+            conexao.execute(sql, (*parametros, id_, reserva))
+            self._reservados.pop(id_, None)
+            self._atualizar_resumo(conexao)
+
+    def _recuperar(self) -> int:
+        with self._trava:
+            conexao = self._abrir()
+            if self.retencao:
+                conexao.execute(_SQL_EXPURGAR, (time.time() - self.retencao,))
+            self._atualizar_resumo(conexao)
+            return self._resumo[0]
+
+    def _fechar(self) -> None:
+        agora = time.time()
+        with self._trava:
+            if self._escritor is not None:
+                # Devolve o que este processo reservou e não concluiu
+                self._escritor.executemany(
+                    _SQL_LIBERAR,
+                    [(agora, agora, id_, fim) for id_, fim in self._reservados.items()],
+                )
+                self._escritor.close()
+            self._escritor = None
+            self._reservados.clear()
+
+    async def adicionar(self, mensagem: Mensagem) -> None:
+        await anyio.to_thread.run_sync(self._adicionar, mensagem)
+        self._novo.set()
+
+    async def reservar(self, maximo: int) -> list[ItemCaixaSaida]:
+        return await anyio.to_thread.run_sync(self._reservar, maximo)
+
+    async def concluir(self, item: ItemCaixaSaida) -> None:
+        await anyio.to_thread.run_sync(
+            self._atualizar,
+            item.mensagem.id,
+            item.proxima_tentativa,
+            _SQL_FINALIZAR,
+            ("enviada", time.time()),
+        )
+
+    async def reagendar(
+        self, item: ItemCaixaSaida, atraso: float, contar_tentativa: bool = True
+    ) -> None:
+        agora = time.time()
+        reserva = item.proxima_tentativa
+        item.tentativas += contar_tentativa
+        item.proxima_tentativa = agora + atraso
+        await anyio.to_thread.run_sync(
+            self._atualizar,
+            item.mensagem.id,
+            reserva,
+            _SQL_REAGENDAR,
+            (item.tentativas, item.proxima_tentativa, agora),
+        )
+        self._novo.set()
+
+    async def descartar(self, item: ItemCaixaSaida) -> None:
+        await anyio.to_thread.run_sync(
+            self._atualizar,
+            item.mensagem.id,
+            item.proxima_tentativa,
+            _SQL_FINALIZAR,
+            ("descartada", time.time()),
+        )
+
+    async def aguardar(self, timeout: float) -> None:
+        # Itens gravados por outros processos só são vistos ao fim do
+        # timeout; a releitura vai para thread (a trava pode esperar o
+        # busy_timeout de uma escrita). O clear vem antes dela: um item
+        # adicionado durante a releitura deixa o evento ligado
+        self._novo.clear()
+        _, _, proxima = await anyio.to_thread.run_sync(self._ler_resumo)
+        if proxima is not None:
+            timeout = min(timeout, max(proxima - time.time(), 0.0))
+        if timeout <= 0:
+            return
+        try:
+            await asyncio.wait_for(self._novo.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def profundidade(self) -> int:
+        return self._resumo[0]
+
+    def idade_mais_antiga(self) -> float:
+        criado_em = self._resumo[1]
+        return time.time() - criado_em if criado_em is not None else 0.0
+
+    async def recuperar(self) -> int:
+        """
+        Cria o esquema, expurga o histórico vencido e conta as pendentes.
+
+        Mensagens gravadas antes de um crash ou redeploy continuam na
+        tabela e são entregues pelos workers normalmente.
+
+        Returns:
+            int: Mensagens pendentes ou em entrega.
+        """
+        return await anyio.to_thread.run_sync(self._recuperar)
+
+    async def fechar(self) -> None:
+        """Devolve as reservas deste processo à fila e fecha as conexões."""
+        await anyio.to_thread.run_sync(self._fechar)
@@ -1,11 +1,26 @@
 """
 Adaptador para envio de emails.
 
-Interface abstrata + implementação com Formspree.
+Interface abstrata + implementação com Formspree, um decorador com
+disjuntor (circuit breaker) que falha na hora quando o provedor está fora
+e um adaptador composto que envia por vários provedores com hedge.
+
+O adaptador Formspree usa um único httpx.AsyncClient por processo
+(criado no lifespan da aplicação): conexões keep-alive são reaproveitadas
+entre envios, sem novo handshake TCP+TLS por mensagem.
 """
 
+import asyncio
+import math
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from typing import Sequence
+
 import httpx
+from app.core.disjuntor import Disjuntor
+from app.core.excecoes import ErroCircuitoAberto
+from app.core.metricas import ENVIOS_EMAIL, ENVIOS_REDUNDANTES
 from app.entidades.mensagem import Mensagem
 
 
@@ -26,6 +41,10 @@ class EmailAdaptador(ABC):
 
         Returns:
             bool: True se enviado com sucesso, False caso contrário.
+
+        Raises:
+            ErroCircuitoAberto: Envio recusado sem tentativa (provedor
+                suspenso pelo disjuntor).
         """
         pass
 
@@ -39,17 +58,60 @@ class FormspreeEmailAdaptador(EmailAdaptador):
 
     Attributes:
         url_endpoint: URL completa do endpoint Formspree.
+        limites: Limites do pool de conexões do cliente HTTP.
+        timeout: Timeouts de conexão, leitura, escrita e pool.
+        http2: Se o cliente negocia HTTP/2 (requer o pacote `h2`).
+        nome: Rótulo `provedor` nas métricas.
     """
 
-    def __init__(self, formspree_url: str, form_id: str):
+    def __init__(
+        self,
+        formspree_url: str,
+        form_id: str,
+        limites: httpx.Limits | None = None,
+        timeout: httpx.Timeout | None = None,
+        http2: bool = False,
+        nome: str = "formspree",
+    ):
         """
-        Inicializa o adaptador Formspree.
+        Inicializa o adaptador Formspree (sem abrir conexões).
 
         Args:
             formspree_url: URL base do Formspree (ex: "https://formspree.io/f").
             form_id: ID do formulário Formspree.
+            limites: Pool de conexões (padrão: 10 conexões, 5 keep-alive).
+            timeout: Timeouts (padrão: 3 s para conectar, 10 s no restante).
+            http2: Negocia HTTP/2 com o servidor.
+            nome: Rótulo nas métricas (ex.: "formspree_reserva").
         """
         self.url_endpoint = f"{formspree_url}/{form_id}"
+        self.nome = nome
+        self.limites = limites or httpx.Limits(
+            max_connections=10, max_keepalive_connections=5
+        )
+        self.timeout = timeout or httpx.Timeout(10.0, connect=3.0)
+        self.http2 = http2
+        self._cliente: httpx.AsyncClient | None = None
+
+    def iniciar(self) -> None:
+        """
+        Cria o cliente HTTP compartilhado (chamado no startup).
+
+        Raises:
+            ImportError: Se http2=True e o pacote `h2` não está instalado.
+        """
+        if self._cliente is None:
+            self._cliente = httpx.AsyncClient(
+                limits=self.limites,
+                timeout=self.timeout,
+                http2=self.http2,
+            )
+
+    async def fechar(self) -> None:
+        """Fecha o cliente e suas conexões (chamado no shutdown)."""
+        cliente, self._cliente = self._cliente, None
+        if cliente is not None:
+            await cliente.aclose()
 
     async def enviar_mensagem(self, mensagem: Mensagem) -> bool:
         """
@@ -63,23 +125,277 @@ class FormspreeEmailAdaptador(EmailAdaptador):
 
         Raises:
             Não levanta exceções - captura erros e retorna False.
+
+        Cada tentativa conta em `email_envios_total{provedor=<nome>}`
+        com resultado sucesso, falha_http, erro_rede ou nao_configurado.
+
+        Sem `iniciar` prévio (ex.: fora do lifespan), o cliente é criado
+        no primeiro envio. O id da mensagem vai no cabeçalho
+        Idempotency-Key: reenvios da mesma mensagem levam a mesma chave.
         """
-        if not self.url_endpoint or "//" in self.url_endpoint[-2:]:
-            # Form ID vazio - URL termina com "//" ao invés de "/form_id"
+        if not self.url_endpoint or self.url_endpoint.endswith("/"):
+            # Form ID vazio - URL termina com "/" ao invés de "/form_id"
+            ENVIOS_EMAIL.incrementar(self.nome, "nao_configurado")
             return False
 
+        self.iniciar()
         try:
-            async with httpx.AsyncClient() as cliente:
-                resposta = await cliente.post(
-                    self.url_endpoint,
-                    json={
-                        "nome": mensagem.nome,
-                        "email": mensagem.email,
-                        "assunto": mensagem.assunto,
-                        "mensagem": mensagem.mensagem,
-                    },
-                    timeout=10.0,
-                )
-                return resposta.status_code in range(200, 300)
+            resposta = await self._cliente.post(
+                self.url_endpoint,
+                headers={"Idempotency-Key": mensagem.id},
+                json={
+                    "nome": mensagem.nome,
+                    "email": mensagem.email,
+                    "assunto": mensagem.assunto,
+                    "mensagem": mensagem.mensagem,
+                },
+            )
         except Exception:
+            ENVIOS_EMAIL.incrementar(self.nome, "erro_rede")
             return False
+
+        sucesso = resposta.status_code in range(200, 300)
+        ENVIOS_EMAIL.incrementar(self.nome, "sucesso" if sucesso else "falha_http")
+        return sucesso
+
+
+class DisjuntorEmailAdaptador(EmailAdaptador):
+    """
+    Decorador de EmailAdaptador com disjuntor.
+
+    Cada envio passa pelo disjuntor: falhas e envios lentos do adaptador
+    interno alimentam a janela; com o disjuntor aberto o envio é recusado
+    em microssegundos com ErroCircuitoAberto, sem I/O. Quem chama decide
+    o caminho alternativo (a caixa de saída adia a mensagem).
+
+    Attributes:
+        adaptador: Adaptador protegido.
+        disjuntor: Disjuntor do provedor.
+    """
+
+    def __init__(self, adaptador: EmailAdaptador, disjuntor: Disjuntor):
+        """
+        Inicializa decorador.
+
+        Args:
+            adaptador: Implementação de EmailAdaptador a proteger.
+            disjuntor: Disjuntor (um por provedor).
+        """
+        self.adaptador = adaptador
+        self.disjuntor = disjuntor
+
+    async def enviar_mensagem(self, mensagem: Mensagem) -> bool:
+        """
+        Envia pelo adaptador interno se o disjuntor permitir.
+
+        Args:
+            mensagem: Mensagem a ser enviada.
+
+        Returns:
+            bool: Resultado do adaptador interno.
+
+        Raises:
+            ErroCircuitoAberto: Disjuntor aberto (ou meio-aberto com o
+                teste em curso).
+        """
+        if not self.disjuntor.permitir():
+            ENVIOS_EMAIL.incrementar(self.disjuntor.nome, "circuito_aberto")
+            raise ErroCircuitoAberto(
+                "Envio de email suspenso pelo disjuntor",
+                codigo="EMAIL_CIRCUITO_ABERTO",
+                origem=self.disjuntor.nome,
+                tentar_apos=self.disjuntor.restante(),
+            )
+
+        inicio = time.perf_counter()
+        try:
+            sucesso = await self.adaptador.enviar_mensagem(mensagem)
+        except asyncio.CancelledError:
+            # Cancelado (ex.: perdeu o hedge): não diz nada sobre o provedor
+            self.disjuntor.cancelar()
+            raise
+        except Exception:
+            self.disjuntor.registrar(False, time.perf_counter() - inicio)
+            raise
+        self.disjuntor.registrar(sucesso, time.perf_counter() - inicio)
+        return sucesso
+
+
+class MultiProvedorEmailAdaptador(EmailAdaptador):
+    """
+    EmailAdaptador composto por provedores em ordem de preferência.
+
+    Envia pelo primeiro provedor. Se ele falhar, tenta o próximo na hora
+    (failover); se ele não responder dentro do atraso de hedge (percentil
+    das latências recentes dele), dispara o próximo em paralelo e fica
+    com o primeiro sucesso, cancelando o outro. Como o atraso é o p95, só
+    ~5% dos envios viram envio duplo.
+
+    Deduplicação por Mensagem.id: ids já entregues retornam True sem
+    novo envio e chamadas simultâneas do mesmo id aguardam o envio em
+    curso. O provedor cancelado pode já ter aceitado a mensagem; por
+    isso cada provedor recebe o id como chave de idempotência.
+
+    Provedores recusados pelo disjuntor (ErroCircuitoAberto) são pulados;
+    se todos recusarem, o erro sobe com o menor `tentar_apos`.
+
+    Attributes:
+        adaptadores: Provedores, do preferido ao último recurso.
+        percentil: Percentil da latência usado como atraso de hedge.
+        atraso_inicial: Atraso de hedge até haver amostras suficientes.
+        atraso_minimo: Menor atraso de hedge (segundos).
+        atraso_maximo: Maior atraso de hedge (segundos).
+    """
+
+    def __init__(
+        self,
+        adaptadores: Sequence[EmailAdaptador],
+        percentil: float = 95.0,
+        atraso_inicial: float = 2.0,
+        atraso_minimo: float = 0.05,
+        atraso_maximo: float = 5.0,
+        amostras: int = 100,
+        minimo_amostras: int = 20,
+        memoria_ids: int = 1000,
+    ):
+        """
+        Inicializa adaptador composto.
+
+        Args:
+            adaptadores: Provedores em ordem de preferência (ao menos um).
+            percentil: Percentil (0-100) das latências para o hedge.
+            atraso_inicial: Atraso usado com menos de `minimo_amostras`.
+            atraso_minimo: Piso do atraso de hedge.
+            atraso_maximo: Teto do atraso de hedge.
+            amostras: Latências recentes guardadas por provedor.
+            minimo_amostras: Amostras antes de usar o percentil.
+            memoria_ids: Ids entregues lembrados para deduplicação.
+        """
+        if not adaptadores:
+            raise ValueError("Informe ao menos um provedor de email")
+        self.adaptadores = list(adaptadores)
+        self.percentil = percentil
+        self.atraso_inicial = atraso_inicial
+        self.atraso_minimo = atraso_minimo
+        self.atraso_maximo = atraso_maximo
+        self.minimo_amostras = minimo_amostras
+        self.memoria_ids = memoria_ids
+        self._latencias = [deque(maxlen=amostras) for _ in self.adaptadores]
+        self._entregues: OrderedDict[str, None] = OrderedDict()
+        self._em_voo: dict[str, asyncio.Future] = {}
+
+    def atraso_hedge(self, indice: int) -> float:
+        """
+        Quanto esperar pelo provedor `indice` antes de acionar o próximo.
+
+        Args:
+            indice: Posição do provedor em `adaptadores`.
+
+        Returns:
+            float: Percentil das latências recentes, entre o piso e o teto.
+        """
+        latencias = self._latencias[indice]
+        if len(latencias) < self.minimo_amostras:
+            return self.atraso_inicial
+        ordenadas = sorted(latencias)
+        posicao = min(len(ordenadas), math.ceil(len(ordenadas) * self.percentil / 100))
+        return min(max(ordenadas[posicao - 1], self.atraso_minimo), self.atraso_maximo)
+
+    async def enviar_mensagem(self, mensagem: Mensagem) -> bool:
+        """
+        Envia pelos provedores com failover e hedge.
+
+        Args:
+            mensagem: Mensagem a ser enviada.
+
+        Returns:
+            bool: True se algum provedor aceitou (ou o id já foi entregue).
+
+        Raises:
+            ErroCircuitoAberto: Todos os provedores recusaram sem tentar.
+        """
+        if mensagem.id in self._entregues:
+            ENVIOS_REDUNDANTES.incrementar("duplicada_evitada")
+            return True
+        em_voo = self._em_voo.get(mensagem.id)
+        if em_voo is not None:
+            ENVIOS_REDUNDANTES.incrementar("duplicada_evitada")
+            return await asyncio.shield(em_voo)
+
+        em_voo = asyncio.get_running_loop().create_future()
+        self._em_voo[mensagem.id] = em_voo
+        sucesso = False
+        try:
+            sucesso = await self._enviar(mensagem)
+        finally:
+            del self._em_voo[mensagem.id]
+            em_voo.set_result(sucesso)
+            if sucesso:
+                self._entregues[mensagem.id] = None
+                if len(self._entregues) > self.memoria_ids:
+                    self._entregues.popitem(last=False)
+        return sucesso
+
+    async def _enviar(self, mensagem: Mensagem) -> bool:
+        """Dispara provedores em sequência até um sucesso (ver classe)."""
+        pendentes: dict[asyncio.Task, tuple[int, float]] = {}
+        recusas: list[ErroCircuitoAberto] = []
+        proximo = 0
+
+        def disparar() -> None:
+            nonlocal proximo
+            tarefa = asyncio.ensure_future(
+                self.adaptadores[proximo].enviar_mensagem(mensagem)
+            )
+            pendentes[tarefa] = (proximo, time.perf_counter())
+            proximo += 1
+
+        try:
+            while True:
+                if not pendentes:
+                    if proximo == len(self.adaptadores):
+                        break
+                    if proximo:
+                        ENVIOS_REDUNDANTES.incrementar("failover")
+                    disparar()
+
+                espera = None
+                if proximo < len(self.adaptadores):
+                    indice, inicio = max(pendentes.values())
+                    espera = max(inicio + self.atraso_hedge(indice) - time.perf_counter(), 0.0)
+                concluidas, _ = await asyncio.wait(
+                    pendentes, timeout=espera, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not concluidas:
+                    ENVIOS_REDUNDANTES.incrementar("hedge")
+                    disparar()
+                    continue
+
+                for tarefa in concluidas:
+                    indice, inicio = pendentes.pop(tarefa)
+                    try:
+                        sucesso = tarefa.result()
+                    except ErroCircuitoAberto as exc:
+                        recusas.append(exc)
+                        continue
+                    except Exception:
+                        sucesso = False
+                    if sucesso:
+                        self._latencias[indice].append(time.perf_counter() - inicio)
+                        return True
+        finally:
+            agora = time.perf_counter()
+            for tarefa, (indice, inicio) in pendentes.items():
+                # Perdeu o hedge: a latência dele é pelo menos esta
+                self._latencias[indice].append(agora - inicio)
+                tarefa.cancel()
+            await asyncio.gather(*pendentes, return_exceptions=True)
+
+        if len(recusas) == len(self.adaptadores):
+            raise ErroCircuitoAberto(
+                "Todos os provedores de email suspensos",
+                codigo="EMAIL_CIRCUITO_ABERTO",
+                origem="multiprovedor",
+                tentar_apos=min(exc.tentar_apos for exc in recusas),
+            )
+        return False
@@ -9,6 +9,13 @@ import sys
 from typing import Any
 import structlog
 
+from app.adaptadores.sink_log import (
+    FabricaLoggerFila,
+    encaminhar_para_fila,
+    obter_sink,
+)
+from app.configuracao import configuracoes
+
 
 def configurar_structlog() -> None:
     """
@@ -21,23 +28,44 @@ def configurar_structlog() -> None:
         - StackInfoRenderer: Renderiza stack traces
         - format_exc_info: Formata exceções
         - JSONRenderer (produção) ou ConsoleRenderer (dev)
+
+    Com LOG_ASSINCRONO (padrão) a renderização e a escrita saem da thread
+    que loga: o evento vai para SinkLogEmLote, que escreve em lotes numa
+    thread de fundo. Sem ele, cada log é escrito na hora em stdout.
     """
+    renderizador = (
+        structlog.dev.ConsoleRenderer()
+        if sys.stderr.isatty()
+        else structlog.processors.JSONRenderer()
+    )
+    processadores = [
+        structlog.contextvars.merge_contextvars,
+        structlog.stdlib.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+        structlog.processors.UnicodeDecoder(),
+    ]
+
+    if configuracoes.log_assincrono:
+        sink = obter_sink(
+            renderizador,
+            tamanho_fila=configuracoes.log_fila_tamanho,
+            politica=configuracoes.log_fila_politica,
+            lote_maximo=configuracoes.log_lote_maximo,
+        )
+        processadores.append(encaminhar_para_fila)
+        fabrica = FabricaLoggerFila(sink)
+    else:
+        # JSON para produção, Console para desenvolvimento
+        processadores.append(renderizador)
+        fabrica = structlog.PrintLoggerFactory()
+
     structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.stdlib.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            # JSON para produção, Console para desenvolvimento
-            structlog.dev.ConsoleRenderer()
-            if sys.stderr.isatty()
-            else structlog.processors.JSONRenderer(),
-        ],
+        processors=processadores,
         wrapper_class=structlog.make_filtering_bound_logger(20),  # INFO
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=fabrica,
         cache_logger_on_first_use=True,
     )
 
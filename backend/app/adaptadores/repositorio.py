@@ -2,16 +2,29 @@
 Adaptador para repositório de dados do portfólio.
 
 Interface abstrata + implementação com arquivos JSON.
+
+A implementação JSON mantém um snapshot imutável dos dados em memória
+e só relê um arquivo quando seu mtime/tamanho muda.
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, asdict
 import json
+import os
+import threading
+import time
 from pathlib import Path
 from datetime import date
+from types import MappingProxyType
+from typing import Any, Mapping
+
+import structlog
 
 from app.entidades.projeto import Projeto
 from app.entidades.experiencia import ExperienciaProfissional
 
+logger = structlog.get_logger(__name__)
+
 
 class RepositorioPortfolio(ABC):
     """
@@ -45,52 +58,260 @@ class RepositorioPortfolio(ABC):
         """Retorna lista de experiências profissionais."""
         pass
 
+    def versao_dados(self) -> int | None:
+        """
+        Retorna identificador da versão atual dos dados.
+
+        Muda sempre que os dados mudam; casos de uso usam o valor para
+        reaproveitar estruturas derivadas (índices, ordenações).
+        None indica que a implementação não versiona seus dados.
+        """
+        return None
+
+    def dados_em_memoria(self) -> bool:
+        """
+        Indica se a próxima leitura será servida da memória, sem I/O.
+
+        Usado por RepositorioAssincrono para decidir se pode responder
+        direto no event loop. Implementações sem cache retornam False.
+        """
+        return False
+
+    def fechar(self) -> None:
+        """Libera conexões abertas (shutdown); nada a fazer por padrão."""
+        pass
+
 
-class RepositorioJSON(RepositorioPortfolio):
+@dataclass(frozen=True)
+class SnapshotPortfolio:
     """
-    Implementação de RepositorioPortfolio usando arquivos JSON.
+    Cópia imutável e já parseada de todos os dados do portfólio.
 
-    Lê dados de arquivos na pasta backend/dados/.
+    Attributes:
+        versao: Número sequencial, incrementado a cada recarga.
+        sobre: Dados da seção Sobre (somente leitura).
+        projetos: Projetos na ordem do arquivo.
+        projetos_por_id: Índice id → Projeto (primeira ocorrência vence).
+        ids_duplicados: IDs de projeto que aparecem mais de uma vez.
+        stack: Tecnologias do stack (somente leitura).
+        experiencias: Experiências na ordem do arquivo.
+    """
+
+    versao: int
+    sobre: Mapping[str, Any]
+    projetos: tuple[Projeto, ...]
+    projetos_por_id: Mapping[str, Projeto]
+    ids_duplicados: tuple[str, ...]
+    stack: tuple[Mapping[str, Any], ...]
+    experiencias: tuple[ExperienciaProfissional, ...]
+
+
+@dataclass
+class EstatisticasCache:
+    """
+    Contadores de uso do snapshot em memória.
 
     Attributes:
-        diretorio_dados: Caminho para pasta com arquivos JSON.
+        acertos: Leituras servidas sem reparsear nenhum arquivo.
+        falhas: Leituras que exigiram parse (carga inicial ou alteração).
+        recargas: Arquivos reparseados após alteração detectada.
+    """
+
+    acertos: int = 0
+    falhas: int = 0
+    recargas: int = 0
+
+    def como_dict(self) -> dict[str, int]:
+        """Retorna contadores como dicionário (para logs e métricas)."""
+        return asdict(self)
+
+
+def indexar_projetos(
+    projetos: tuple[Projeto, ...],
+) -> tuple[Mapping[str, Projeto], tuple[str, ...]]:
+    """
+    Constrói índice id → Projeto para busca O(1).
+
+    Em caso de IDs repetidos mantém a primeira ocorrência (mesmo
+    resultado da antiga busca linear) e devolve os IDs duplicados
+    para que sejam reportados na carga.
+
+    Args:
+        projetos: Projetos na ordem de origem.
+
+    Returns:
+        Tupla (índice somente leitura, IDs duplicados em ordem).
+    """
+    indice: dict[str, Projeto] = {}
+    duplicados: list[str] = []
+    for projeto in projetos:
+        if projeto.id in indice:
+            if projeto.id not in duplicados:
+                duplicados.append(projeto.id)
+            continue
+        indice[projeto.id] = projeto
+    return MappingProxyType(indice), tuple(duplicados)
+
+
+class RepositorioEmMemoria(RepositorioPortfolio):
+    """
+    Base para repositórios que servem um SnapshotPortfolio em memória.
+
+    Subclasses informam seus arquivos de origem e como montar o snapshot.
+    A base verifica (mtime e tamanho) os arquivos no máximo uma vez por
+    intervalo_verificacao e só pede recarga dos que mudaram.
+
+    Attributes:
+        intervalo_verificacao: Segundos entre verificações de alteração.
+        estatisticas: Contadores de acertos, falhas e recargas.
     """
 
-    def __init__(self, diretorio_dados: str | Path = "dados"):
+    def __init__(self, intervalo_verificacao: float = 1.0):
         """
-        Inicializa repositório JSON.
+        Inicializa estado do cache.
 
         Args:
-            diretorio_dados: Caminho para pasta com dados JSON.
+            intervalo_verificacao: Intervalo mínimo (segundos) entre
+                verificações de mtime. 0 verifica a cada leitura.
         """
-        self.diretorio_dados = Path(diretorio_dados)
+        self.intervalo_verificacao = intervalo_verificacao
+        self.estatisticas = EstatisticasCache()
+        self._snapshot: SnapshotPortfolio | None = None
+        self._assinaturas: dict[str, tuple[int, int]] = {}
+        self._proxima_verificacao = 0.0
+        self._trava = threading.Lock()
 
-    def _ler_json(self, nome_arquivo: str) -> dict | list:
+    @abstractmethod
+    def _arquivos_origem(self) -> dict[str, Path]:
+        """Retorna chave → caminho dos arquivos monitorados."""
+        pass
+
+    @abstractmethod
+    def _recarregar(
+        self,
+        anterior: SnapshotPortfolio | None,
+        alterados: set[str],
+    ) -> SnapshotPortfolio:
         """
-        Lê arquivo JSON do diretório de dados.
+        Monta novo snapshot a partir dos arquivos alterados.
 
         Args:
-            nome_arquivo: Nome do arquivo (ex: "sobre.json").
+            anterior: Snapshot atual (None na carga inicial).
+            alterados: Chaves de _arquivos_origem que mudaram.
 
         Returns:
-            Conteúdo do JSON parseado.
+            SnapshotPortfolio: Novo snapshot com versão incrementada.
+        """
+        pass
+
+    @staticmethod
+    def _assinatura(caminho: Path) -> tuple[int, int]:
+        """
+        Retorna (mtime_ns, tamanho) do arquivo para detectar alterações.
 
         Raises:
             FileNotFoundError: Se arquivo não existe.
-            json.JSONDecodeError: Se JSON é inválido.
         """
-        caminho = self.diretorio_dados / nome_arquivo
-        with open(caminho, "r", encoding="utf-8") as arquivo:
-            return json.load(arquivo)
+        info = os.stat(caminho)
+        return info.st_mtime_ns, info.st_size
+
+    def dados_em_memoria(self) -> bool:
+        """
+        Indica se há snapshot carregado dentro do intervalo de verificação.
+
+        Returns:
+            bool: True se a próxima leitura não fará stat nem parse.
+        """
+        return (
+            self._snapshot is not None
+            and time.monotonic() < self._proxima_verificacao
+        )
+
+    def versao_dados(self) -> int:
+        """
+        Retorna a versão do snapshot atual.
+
+        Returns:
+            int: SnapshotPortfolio.versao.
+        """
+        return self.obter_snapshot().versao
+
+    def obter_snapshot(self) -> SnapshotPortfolio:
+        """
+        Retorna o snapshot atual, recarregando arquivos alterados.
+
+        Dentro do intervalo de verificação é uma leitura pura de memória.
+
+        Returns:
+            SnapshotPortfolio: Dados imutáveis do portfólio.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() < self._proxima_verificacao:
+            self.estatisticas.acertos += 1
+            return snapshot
+        return self._verificar_snapshot()
+
+    def _verificar_snapshot(self) -> SnapshotPortfolio:
+        """
+        Compara assinaturas dos arquivos e recarrega os que mudaram.
+
+        Serializado por trava para que requisições concorrentes não
+        reparseiem o mesmo arquivo em paralelo.
+
+        Se a recarga falhar (arquivo pela metade, JSON inválido), o erro é
+        logado e o snapshot anterior continua sendo servido até a próxima
+        verificação; só a carga inicial propaga o erro.
+        """
+        with self._trava:
+            snapshot = self._snapshot
+            if snapshot is not None and time.monotonic() < self._proxima_verificacao:
+                # Outra thread verificou enquanto esperávamos a trava
+                self.estatisticas.acertos += 1
+                return snapshot
+
+            try:
+                assinaturas = {
+                    chave: self._assinatura(caminho)
+                    for chave, caminho in self._arquivos_origem().items()
+                }
+                alterados = {
+                    chave
+                    for chave, assinatura in assinaturas.items()
+                    if self._assinaturas.get(chave) != assinatura
+                }
+
+                if snapshot is None or alterados:
+                    self.estatisticas.falhas += 1
+                    if snapshot is not None:
+                        self.estatisticas.recargas += len(alterados)
+                    novo = self._recarregar(snapshot, alterados)
+                    self._snapshot = snapshot = novo
+                    self._assinaturas = assinaturas
+                else:
+                    self.estatisticas.acertos += 1
+            except Exception as exc:
+                if snapshot is None:
+                    raise
+                # Arquivo pela metade ou inválido: segue com o último
+                # snapshot bom e tenta de novo no próximo intervalo
+                logger.error(
+                    "recarga_snapshot_falhou",
+                    erro=str(exc),
+                    tipo=type(exc).__name__,
+                    versao_servida=snapshot.versao,
+                )
+
+            self._proxima_verificacao = time.monotonic() + self.intervalo_verificacao
+            return snapshot
 
     def obter_sobre(self) -> dict:
         """
         Obtém informações da seção Sobre.
 
         Returns:
-            dict: Dados do arquivo sobre.json.
+            dict: Cópia dos dados da seção Sobre.
         """
-        return self._ler_json("sobre.json")
+        return dict(self.obter_snapshot().sobre)
 
     def obter_projetos(self) -> list[Projeto]:
         """
@@ -99,22 +320,7 @@ class RepositorioJSON(RepositorioPortfolio):
         Returns:
             list[Projeto]: Lista de entidades Projeto.
         """
-        dados = self._ler_json("projetos.json")
-        return [
-            Projeto(
-                id=p["id"],
-                nome=p["nome"],
-                descricao_curta=p["descricao_curta"],
-                descricao_completa=p["descricao_completa"],
-                tecnologias=p["tecnologias"],
-                funcionalidades=p["funcionalidades"],
-                aprendizados=p["aprendizados"],
-                repositorio=p.get("repositorio"),
-                demo=p.get("demo"),
-                destaque=p.get("destaque", False),
-            )
-            for p in dados
-        ]
+        return list(self.obter_snapshot().projetos)
 
     def obter_projeto_por_id(self, projeto_id: str) -> Projeto | None:
         """
@@ -126,20 +332,16 @@ class RepositorioJSON(RepositorioPortfolio):
         Returns:
             Projeto | None: Projeto encontrado ou None.
         """
-        projetos = self.obter_projetos()
-        for projeto in projetos:
-            if projeto.id == projeto_id:
-                return projeto
-        return None
+        return self.obter_snapshot().projetos_por_id.get(projeto_id)
 
     def obter_stack(self) -> list[dict]:
         """
         Obtém lista de tecnologias do stack.
 
         Returns:
-            list[dict]: Lista de tecnologias.
+            list[dict]: Cópia da lista de tecnologias.
         """
-        return self._ler_json("stack.json")
+        return [dict(item) for item in self.obter_snapshot().stack]
 
     def obter_experiencias(self) -> list[ExperienciaProfissional]:
         """
@@ -148,18 +350,154 @@ class RepositorioJSON(RepositorioPortfolio):
         Returns:
             list[ExperienciaProfissional]: Lista de entidades ExperienciaProfissional.
         """
-        dados = self._ler_json("experiencias.json")
-        return [
-            ExperienciaProfissional(
-                id=e["id"],
-                cargo=e["cargo"],
-                empresa=e["empresa"],
-                localizacao=e["localizacao"],
-                data_inicio=date.fromisoformat(e["data_inicio"]),
-                data_fim=date.fromisoformat(e["data_fim"]) if e.get("data_fim") else None,
-                descricao=e["descricao"],
-                tecnologias=e["tecnologias"],
-                atual=e.get("atual", False),
+        return list(self.obter_snapshot().experiencias)
+
+
+# Chave do snapshot → arquivo de origem
+_ARQUIVOS_DADOS = {
+    "sobre": "sobre.json",
+    "projetos": "projetos.json",
+    "stack": "stack.json",
+    "experiencias": "experiencias.json",
+}
+
+
+class RepositorioJSON(RepositorioEmMemoria):
+    """
+    Implementação de RepositorioPortfolio usando arquivos JSON.
+
+    Lê dados de arquivos na pasta backend/dados/ e os mantém em um
+    snapshot imutável em memória. Apenas os arquivos alterados desde a
+    última verificação são reparseados.
+
+    Attributes:
+        diretorio_dados: Caminho para pasta com arquivos JSON.
+    """
+
+    def __init__(
+        self,
+        diretorio_dados: str | Path = "dados",
+        intervalo_verificacao: float = 1.0,
+    ):
+        """
+        Inicializa repositório JSON.
+
+        Args:
+            diretorio_dados: Caminho para pasta com dados JSON.
+            intervalo_verificacao: Intervalo mínimo (segundos) entre
+                verificações de mtime. 0 verifica a cada leitura.
+        """
+        super().__init__(intervalo_verificacao)
+        self.diretorio_dados = Path(diretorio_dados)
+
+    def _ler_json(self, nome_arquivo: str) -> dict | list:
+        """
+        Lê arquivo JSON do diretório de dados.
+
+        Args:
+            nome_arquivo: Nome do arquivo (ex: "sobre.json").
+
+        Returns:
+            Conteúdo do JSON parseado.
+
+        Raises:
+            FileNotFoundError: Se arquivo não existe.
+            json.JSONDecodeError: Se JSON é inválido.
+        """
+        caminho = self.diretorio_dados / nome_arquivo
+        with open(caminho, "r", encoding="utf-8") as arquivo:
+            return json.load(arquivo)
+
+    def _arquivos_origem(self) -> dict[str, Path]:
+        """Retorna os quatro arquivos JSON monitorados."""
+        return {
+            chave: self.diretorio_dados / arquivo
+            for chave, arquivo in _ARQUIVOS_DADOS.items()
+        }
+
+    def _recarregar(
+        self,
+        anterior: SnapshotPortfolio | None,
+        alterados: set[str],
+    ) -> SnapshotPortfolio:
+        """
+        Monta novo snapshot reaproveitando as partes não alteradas.
+
+        Args:
+            anterior: Snapshot atual (None na carga inicial).
+            alterados: Chaves de _ARQUIVOS_DADOS que precisam ser relidas.
+
+        Returns:
+            SnapshotPortfolio: Novo snapshot com versão incrementada.
+        """
+        def precisa(chave: str) -> bool:
+            return anterior is None or chave in alterados
+
+        if precisa("projetos"):
+            projetos = tuple(
+                self._para_projeto(p) for p in self._ler_json("projetos.json")
             )
-            for e in dados
-        ]
+            projetos_por_id, ids_duplicados = indexar_projetos(projetos)
+            if ids_duplicados:
+                logger.warning(
+                    "projetos_com_id_duplicado",
+                    arquivo=str(self.diretorio_dados / "projetos.json"),
+                    ids=list(ids_duplicados),
+                )
+        else:
+            projetos = anterior.projetos
+            projetos_por_id = anterior.projetos_por_id
+            ids_duplicados = anterior.ids_duplicados
+
+        return SnapshotPortfolio(
+            versao=(anterior.versao + 1) if anterior else 1,
+            sobre=(
+                MappingProxyType(self._ler_json("sobre.json"))
+                if precisa("sobre") else anterior.sobre
+            ),
+            projetos=projetos,
+            projetos_por_id=projetos_por_id,
+            ids_duplicados=ids_duplicados,
+            stack=(
+                tuple(MappingProxyType(item) for item in self._ler_json("stack.json"))
+                if precisa("stack") else anterior.stack
+            ),
+            experiencias=(
+                tuple(
+                    self._para_experiencia(e)
+                    for e in self._ler_json("experiencias.json")
+                )
+                if precisa("experiencias") else anterior.experiencias
+            ),
+        )
+
+    @staticmethod
+    def _para_projeto(p: dict) -> Projeto:
+        """Converte registro JSON em entidade Projeto."""
+        return Projeto(
+            id=p["id"],
+            nome=p["nome"],
+            descricao_curta=p["descricao_curta"],
+            descricao_completa=p["descricao_completa"],
+            tecnologias=p["tecnologias"],
+            funcionalidades=p["funcionalidades"],
+            aprendizados=p["aprendizados"],
+            repositorio=p.get("repositorio"),
+            demo=p.get("demo"),
+            destaque=p.get("destaque", False),
+        )
+
+    @staticmethod
+    def _para_experiencia(e: dict) -> ExperienciaProfissional:
+        """Converte registro JSON em entidade ExperienciaProfissional."""
+        return ExperienciaProfissional(
+            id=e["id"],
+            cargo=e["cargo"],
+            empresa=e["empresa"],
+            localizacao=e["localizacao"],
+            data_inicio=date.fromisoformat(e["data_inicio"]),
+            data_fim=date.fromisoformat(e["data_fim"]) if e.get("data_fim") else None,
+            descricao=e["descricao"],
+            tecnologias=e["tecnologias"],
+            atual=e.get("atual", False),
+        )
@@ -0,0 +1,129 @@
+"""
+Adaptador assíncrono para repositório de dados do portfólio.
+
+Interface abstrata + implementação que adapta um RepositorioPortfolio
+síncrono para o event loop: leituras já em memória são respondidas
+diretamente e I/O real é enviado explicitamente para uma thread.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Callable, TypeVar
+
+import anyio.to_thread
+
+from app.adaptadores.repositorio import RepositorioPortfolio
+from app.core.tempos import medir
+from app.entidades.projeto import Projeto
+from app.entidades.experiencia import ExperienciaProfissional
+
+T = TypeVar("T")
+
+
+class RepositorioPortfolioAssincrono(ABC):
+    """
+    Interface abstrata assíncrona para acesso aos dados do portfólio.
+
+    Espelha RepositorioPortfolio para uso em handlers `async def`.
+    """
+
+    @abstractmethod
+    async def obter_sobre(self) -> dict:
+        """Retorna informações da seção Sobre."""
+        pass
+
+    @abstractmethod
+    async def obter_projetos(self) -> list[Projeto]:
+        """Retorna lista de projetos."""
+        pass
+
+    @abstractmethod
+    async def obter_projeto_por_id(self, projeto_id: str) -> Projeto | None:
+        """Retorna um projeto específico ou None se não encontrado."""
+        pass
+
+    @abstractmethod
+    async def obter_stack(self) -> list[dict]:
+        """Retorna lista de tecnologias do stack."""
+        pass
+
+    @abstractmethod
+    async def obter_experiencias(self) -> list[ExperienciaProfissional]:
+        """Retorna lista de experiências profissionais."""
+        pass
+
+    async def versao_dados(self) -> int | None:
+        """
+        Retorna identificador da versão atual dos dados.
+
+        None indica que a implementação não versiona seus dados.
+        """
+        return None
+
+
+class RepositorioAssincrono(RepositorioPortfolioAssincrono):
+    """
+    Implementação de RepositorioPortfolioAssincrono sobre um repositório síncrono.
+
+    Quando o repositório informa que os dados estão em memória a chamada
+    roda no próprio event loop (sem salto de thread). Caso contrário
+    (carga inicial, verificação de mtime, banco de dados) a chamada é
+    executada via anyio.to_thread.
+
+    Attributes:
+        repositorio: Repositório síncrono adaptado.
+    """
+
+    def __init__(self, repositorio: RepositorioPortfolio):
+        """
+        Inicializa adaptador assíncrono.
+
+        Args:
+            repositorio: Implementação síncrona de RepositorioPortfolio.
+        """
+        self.repositorio = repositorio
+
+    async def _executar(self, funcao: Callable[..., T], *args: object) -> T:
+        """
+        Executa leitura no event loop ou em thread, conforme necessário.
+
+        Args:
+            funcao: Método do repositório síncrono.
+            *args: Argumentos posicionais do método.
+
+        Returns:
+            Resultado do método.
+
+        O tempo da chamada (inclusive espera pela thread) entra no trecho
+        "repositorio" do Server-Timing.
+        """
+        with medir("repositorio"):
+            if self.repositorio.dados_em_memoria():
+                return funcao(*args)
+            return await anyio.to_thread.run_sync(funcao, *args)
+
+    async def versao_dados(self) -> int | None:
+        """Obtém versão atual dos dados do repositório adaptado."""
+        return await self._executar(self.repositorio.versao_dados)
+
+    async def obter_sobre(self) -> dict:
+        """Obtém informações da seção Sobre."""
+        return await self._executar(self.repositorio.obter_sobre)
+
+    async def obter_projetos(self) -> list[Projeto]:
+        """Obtém lista de projetos."""
+        return await self._executar(self.repositorio.obter_projetos)
+
+    async def obter_projeto_por_id(self, projeto_id: str) -> Projeto | None:
+        """Obtém projeto específico por ID."""
+        return await self._executar(
+            self.repositorio.obter_projeto_por_id,
+            projeto_id,
+        )
+
+    async def obter_stack(self) -> list[dict]:
+        """Obtém lista de tecnologias do stack."""
+        return await self._executar(self.repositorio.obter_stack)
+
+    async def obter_experiencias(self) -> list[ExperienciaProfissional]:
+        """Obtém lista de experiências profissionais."""
+        return await self._executar(self.repositorio.obter_experiencias)
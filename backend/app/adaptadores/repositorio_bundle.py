@@ -0,0 +1,193 @@
+"""
+Adaptador para repositório a partir de bundle binário pré-compilado.
+
+O bundle é gerado por `python -m app.ferramentas.compilar_dados` a partir
+de dados/*.json já validados: entidades prontas e datas já convertidas,
+carregadas com uma única leitura de arquivo.
+
+Formato:
+    cabeçalho (mágica, versão do formato, BLAKE2b-256 do payload)
+    + payload pickle (protocolo 5) com sobre, projetos, stack e experiências.
+"""
+
+import hashlib
+import io
+import pickle
+import struct
+from datetime import date
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+from app.adaptadores.repositorio import (
+    RepositorioEmMemoria,
+    SnapshotPortfolio,
+    indexar_projetos,
+)
+from app.core.excecoes import ErroInfraestrutura
+from app.entidades.projeto import Projeto
+from app.entidades.experiencia import ExperienciaProfissional
+
+MAGICA = b"PORTFOLIO\x00"
+VERSAO_FORMATO = 1
+_CABECALHO = struct.Struct(">10sH32s")
+
+# Únicas classes que o payload pode referenciar
+_CLASSES_PERMITIDAS = {
+    ("app.entidades.projeto", "Projeto"): Projeto,
+    ("app.entidades.experiencia", "ExperienciaProfissional"): ExperienciaProfissional,
+    ("datetime", "date"): date,
+}
+
+
+class _UnpicklerRestrito(pickle.Unpickler):
+    """Unpickler que só instancia entidades do domínio e datas."""
+
+    def find_class(self, modulo: str, nome: str) -> Any:
+        try:
+            return _CLASSES_PERMITIDAS[(modulo, nome)]
+        except KeyError:
+            raise pickle.UnpicklingError(
+                f"Classe não permitida no bundle: {modulo}.{nome}"
+            ) from None
+
+
+def serializar_bundle(
+    sobre: dict,
+    projetos: tuple[Projeto, ...],
+    stack: tuple[dict, ...],
+    experiencias: tuple[ExperienciaProfissional, ...],
+) -> bytes:
+    """
+    Serializa dados já validados no formato de bundle.
+
+    Args:
+        sobre: Dados da seção Sobre.
+        projetos: Entidades Projeto.
+        stack: Itens do stack.
+        experiencias: Entidades ExperienciaProfissional.
+
+    Returns:
+        bytes: Conteúdo completo do arquivo de bundle.
+    """
+    payload = pickle.dumps(
+        {
+            "sobre": dict(sobre),
+            "projetos": tuple(projetos),
+            "stack": tuple(dict(item) for item in stack),
+            "experiencias": tuple(experiencias),
+        },
+        protocol=5,
+    )
+    resumo = hashlib.blake2b(payload, digest_size=32).digest()
+    return _CABECALHO.pack(MAGICA, VERSAO_FORMATO, resumo) + payload
+
+
+def desserializar_bundle(conteudo: bytes, origem: str = "bundle") -> dict:
+    """
+    Valida cabeçalho e integridade e desserializa o payload.
+
+    Args:
+        conteudo: Bytes lidos do arquivo de bundle.
+        origem: Identificação do arquivo (para mensagens de erro).
+
+    Returns:
+        dict: Chaves sobre, projetos, stack e experiencias.
+
+    Raises:
+        ErroInfraestrutura: Se o bundle está corrompido ou é incompatível.
+    """
+    if len(conteudo) < _CABECALHO.size:
+        raise ErroInfraestrutura(
+            "Bundle de dados truncado",
+            codigo="BUNDLE_INVALIDO",
+            origem=origem,
+        )
+
+    magica, versao, resumo = _CABECALHO.unpack_from(conteudo)
+    payload = memoryview(conteudo)[_CABECALHO.size:]
+
+    if magica != MAGICA or versao != VERSAO_FORMATO:
+        raise ErroInfraestrutura(
+            f"Bundle de dados incompatível (versão {versao})",
+            codigo="BUNDLE_INVALIDO",
+            origem=origem,
+        )
+    if hashlib.blake2b(payload, digest_size=32).digest() != resumo:
+        raise ErroInfraestrutura(
+            "Bundle de dados corrompido (checksum não confere)",
+            codigo="BUNDLE_INVALIDO",
+            origem=origem,
+        )
+
+    try:
+        return _UnpicklerRestrito(io.BytesIO(payload)).load()
+    except (pickle.UnpicklingError, EOFError) as exc:
+        raise ErroInfraestrutura(
+            f"Bundle de dados ilegível: {exc}",
+            codigo="BUNDLE_INVALIDO",
+            origem=origem,
+        ) from exc
+
+
+class RepositorioBundle(RepositorioEmMemoria):
+    """
+    Implementação de RepositorioPortfolio usando bundle binário.
+
+    Carrega todo o snapshot com uma única leitura; o arquivo é monitorado
+    (mtime e tamanho) como os arquivos JSON de RepositorioJSON.
+
+    Attributes:
+        caminho_bundle: Caminho do arquivo de bundle.
+    """
+
+    def __init__(
+        self,
+        caminho_bundle: str | Path = "dados/portfolio.bundle",
+        intervalo_verificacao: float = 1.0,
+    ):
+        """
+        Inicializa repositório de bundle.
+
+        Args:
+            caminho_bundle: Caminho do bundle gerado por compilar_dados.
+            intervalo_verificacao: Intervalo mínimo (segundos) entre
+                verificações de mtime. 0 verifica a cada leitura.
+        """
+        super().__init__(intervalo_verificacao)
+        self.caminho_bundle = Path(caminho_bundle)
+
+    def _arquivos_origem(self) -> dict[str, Path]:
+        """Retorna o arquivo de bundle monitorado."""
+        return {"bundle": self.caminho_bundle}
+
+    def _recarregar(
+        self,
+        anterior: SnapshotPortfolio | None,
+        alterados: set[str],
+    ) -> SnapshotPortfolio:
+        """
+        Lê e desserializa o bundle inteiro.
+
+        Args:
+            anterior: Snapshot atual (None na carga inicial).
+            alterados: Ignorado; o bundle é sempre recarregado por inteiro.
+
+        Returns:
+            SnapshotPortfolio: Novo snapshot com versão incrementada.
+        """
+        dados = desserializar_bundle(
+            self.caminho_bundle.read_bytes(),
+            origem=str(self.caminho_bundle),
+        )
+        projetos_por_id, ids_duplicados = indexar_projetos(dados["projetos"])
+
+        return SnapshotPortfolio(
+            versao=(anterior.versao + 1) if anterior else 1,
+            sobre=MappingProxyType(dados["sobre"]),
+            projetos=dados["projetos"],
+            projetos_por_id=projetos_por_id,
+            ids_duplicados=ids_duplicados,
+            stack=tuple(MappingProxyType(item) for item in dados["stack"]),
+            experiencias=dados["experiencias"],
+        )
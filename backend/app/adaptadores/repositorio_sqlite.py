@@ -0,0 +1,396 @@
+"""
+Adaptador para repositório de dados em SQLite.
+
+Implementação de RepositorioPortfolio com sqlite3 da biblioteca padrão:
+modo WAL, uma conexão somente-leitura por thread, SQL fixo (reaproveitado
+pelo cache de prepared statements do sqlite3) e índices para id de
+projeto, destaque, tecnologia e datas de experiência.
+
+Os dados são carregados pelo comando:
+    python -m app.ferramentas.importar_sqlite
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import date
+from pathlib import Path
+
+from app.adaptadores.repositorio import RepositorioPortfolio, SnapshotPortfolio
+from app.entidades.projeto import Projeto
+from app.entidades.experiencia import ExperienciaProfissional
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS metadados (
+    chave TEXT PRIMARY KEY,
+    valor TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sobre (
+    chave TEXT PRIMARY KEY,
+    valor TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS projetos (
+    id TEXT PRIMARY KEY,
+    posicao INTEGER NOT NULL,
+    nome TEXT NOT NULL,
+    descricao_curta TEXT NOT NULL,
+    descricao_completa TEXT NOT NULL,
+    tecnologias TEXT NOT NULL,
+    funcionalidades TEXT NOT NULL,
+    aprendizados TEXT NOT NULL,
+    repositorio TEXT,
+    demo TEXT,
+    destaque INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_projetos_posicao ON projetos (posicao);
+CREATE INDEX IF NOT EXISTS idx_projetos_destaque_nome ON projetos (destaque DESC, nome);
+CREATE TABLE IF NOT EXISTS projeto_tecnologias (
+    projeto_id TEXT NOT NULL REFERENCES projetos (id) ON DELETE CASCADE,
+    tecnologia TEXT NOT NULL,
+    PRIMARY KEY (projeto_id, tecnologia)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_projeto_tecnologias_tecnologia
+    ON projeto_tecnologias (tecnologia, projeto_id);
+CREATE TABLE IF NOT EXISTS stack (
+    posicao INTEGER PRIMARY KEY,
+    nome TEXT NOT NULL,
+    categoria TEXT NOT NULL,
+    nivel INTEGER NOT NULL,
+    icone TEXT
+);
+CREATE TABLE IF NOT EXISTS experiencias (
+    id TEXT PRIMARY KEY,
+    posicao INTEGER NOT NULL,
+    cargo TEXT NOT NULL,
+    empresa TEXT NOT NULL,
+    localizacao TEXT NOT NULL,
+    data_inicio TEXT NOT NULL,
+    data_fim TEXT,
+    descricao TEXT NOT NULL,
+    tecnologias TEXT NOT NULL,
+    atual INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_experiencias_posicao ON experiencias (posicao);
+CREATE INDEX IF NOT EXISTS idx_experiencias_datas
+    ON experiencias (atual DESC, data_inicio DESC, data_fim);
+CREATE TABLE IF NOT EXISTS experiencia_tecnologias (
+    experiencia_id TEXT NOT NULL REFERENCES experiencias (id) ON DELETE CASCADE,
+    tecnologia TEXT NOT NULL,
+    PRIMARY KEY (experiencia_id, tecnologia)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_experiencia_tecnologias_tecnologia
+    ON experiencia_tecnologias (tecnologia, experiencia_id);
+"""
+
+# Consultas fixas: o texto idêntico reaproveita o statement já preparado
+_SQL_SOBRE = "SELECT chave, valor FROM sobre"
+_SQL_PROJETOS = """
+    SELECT id, nome, descricao_curta, descricao_completa, tecnologias,
+           funcionalidades, aprendizados, repositorio, demo, destaque
+    FROM projetos ORDER BY posicao
+"""
+_SQL_PROJETO_POR_ID = """
+    SELECT id, nome, descricao_curta, descricao_completa, tecnologias,
+           funcionalidades, aprendizados, repositorio, demo, destaque
+    FROM projetos WHERE id = ?
+"""
+_SQL_STACK = "SELECT nome, categoria, nivel, icone FROM stack ORDER BY posicao"
+_SQL_EXPERIENCIAS = """
+    SELECT id, cargo, empresa, localizacao, data_inicio, data_fim,
+           descricao, tecnologias, atual
+    FROM experiencias ORDER BY posicao
+"""
+_SQL_VERSAO = "SELECT valor FROM metadados WHERE chave = 'versao'"
+
+
+def _configurar_conexao(conexao: sqlite3.Connection) -> None:
+    """Aplica PRAGMAs comuns a leitores e escritores."""
+    conexao.execute("PRAGMA journal_mode = WAL")
+    conexao.execute("PRAGMA synchronous = NORMAL")
+    conexao.execute("PRAGMA foreign_keys = ON")
+    conexao.execute("PRAGMA busy_timeout = 5000")
+
+
+def importar_snapshot(caminho_banco: str | Path, snapshot: SnapshotPortfolio) -> int:
+    """
+    Substitui todo o conteúdo do banco pelos dados do snapshot.
+
+    Executado em uma única transação: leitores em WAL continuam vendo a
+    versão anterior até o commit.
+
+    Args:
+        caminho_banco: Arquivo SQLite (criado se não existir).
+        snapshot: Dados já validados.
+
+    Returns:
+        int: Nova versão dos dados gravada em metadados.
+    """
+    conexao = sqlite3.connect(caminho_banco, isolation_level=None)
+    try:
+        _configurar_conexao(conexao)
+        conexao.executescript(ESQUEMA)
+        conexao.execute("BEGIN IMMEDIATE")
+
+        for tabela in (
+            "projeto_tecnologias",
+            "experiencia_tecnologias",
+            "projetos",
+            "experiencias",
+            "stack",
+            "sobre",
+        ):
+            conexao.execute(f"DELETE FROM {tabela}")
+
+        conexao.executemany(
+            "INSERT INTO sobre (chave, valor) VALUES (?, ?)",
+            [
+                (chave, json.dumps(valor, ensure_ascii=False))
+                for chave, valor in snapshot.sobre.items()
+            ],
+        )
+        conexao.executemany(
+            """
+            INSERT INTO projetos (
+                id, posicao, nome, descricao_curta, descricao_completa,
+                tecnologias, funcionalidades, aprendizados, repositorio,
+                demo, destaque
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    p.id,
+                    posicao,
+                    p.nome,
+                    p.descricao_curta,
+                    p.descricao_completa,
+                    json.dumps(p.tecnologias, ensure_ascii=False),
+                    json.dumps(p.funcionalidades, ensure_ascii=False),
+                    json.dumps(p.aprendizados, ensure_ascii=False),
+                    p.repositorio,
+                    p.demo,
+                    int(p.destaque),
+                )
+                for posicao, p in enumerate(snapshot.projetos)
+            ],
+        )
+        conexao.executemany(
+            "INSERT OR IGNORE INTO projeto_tecnologias (projeto_id, tecnologia) "
+            "VALUES (?, ?)",
+            [
+                (p.id, tecnologia)
+                for p in snapshot.projetos
+                for tecnologia in p.tecnologias
+            ],
+        )
+        conexao.executemany(
+            "INSERT INTO stack (posicao, nome, categoria, nivel, icone) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (posicao, item["nome"], item["categoria"], item["nivel"], item.get("icone"))
+                for posicao, item in enumerate(snapshot.stack)
+            ],
+        )
+        conexao.executemany(
+            """
+            INSERT INTO experiencias (
+                id, posicao, cargo, empresa, localizacao, data_inicio,
+                data_fim, descricao, tecnologias, atual
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    e.id,
+                    posicao,
+                    e.cargo,
+                    e.empresa,
+                    e.localizacao,
+                    e.data_inicio.isoformat(),
+                    e.data_fim.isoformat() if e.data_fim else None,
+                    e.descricao,
+                    json.dumps(e.tecnologias, ensure_ascii=False),
+                    int(e.atual),
+                )
+                for posicao, e in enumerate(snapshot.experiencias)
+            ],
+        )
+        conexao.executemany(
+            "INSERT OR IGNORE INTO experiencia_tecnologias (experiencia_id, tecnologia) "
+            "VALUES (?, ?)",
+            [
+                (e.id, tecnologia)
+                for e in snapshot.experiencias
+                for tecnologia in e.tecnologias
+            ],
+        )
+
+        linha = conexao.execute(_SQL_VERSAO).fetchone()
+        versao = int(linha[0]) + 1 if linha else 1
+        conexao.execute(
+            "INSERT OR REPLACE INTO metadados (chave, valor) VALUES ('versao', ?)",
+            (str(versao),),
+        )
+        conexao.execute("COMMIT")
+        return versao
+    except BaseException:
+        if conexao.in_transaction:
+            conexao.execute("ROLLBACK")
+        raise
+    finally:
+        conexao.close()
+
+
+class RepositorioSQLite(RepositorioPortfolio):
+    """
+    Implementação de RepositorioPortfolio usando SQLite.
+
+    Cada thread recebe sua própria conexão somente-leitura (sqlite3 não
+    permite compartilhar conexões entre threads sem serialização). Em
+    modo WAL os leitores não bloqueiam nem são bloqueados pela importação.
+
+    Attributes:
+        caminho_banco: Arquivo SQLite gerado por importar_sqlite.
+    """
+
+    def __init__(self, caminho_banco: str | Path = "dados/portfolio.db"):
+        """
+        Inicializa repositório SQLite.
+
+        Args:
+            caminho_banco: Caminho do arquivo de banco.
+        """
+        self.caminho_banco = Path(caminho_banco)
+        self._local = threading.local()
+        self._conexoes: list[sqlite3.Connection] = []
+        self._trava = threading.Lock()
+
+    def _conexao(self) -> sqlite3.Connection:
+        """
+        Retorna a conexão da thread atual, criando-a na primeira chamada.
+
+        Returns:
+            sqlite3.Connection: Conexão somente-leitura com row_factory Row.
+        """
+        conexao = getattr(self._local, "conexao", None)
+        if conexao is None:
+            uri = f"{self.caminho_banco.resolve().as_uri()}?mode=ro"
+            # check_same_thread=False apenas para permitir fechar() no
+            # shutdown; durante o uso cada conexão fica na sua thread.
+            conexao = sqlite3.connect(
+                uri,
+                uri=True,
+                cached_statements=64,
+                check_same_thread=False,
+            )
+            conexao.row_factory = sqlite3.Row
+            conexao.execute("PRAGMA busy_timeout = 5000")
+            conexao.execute("PRAGMA query_only = ON")
+            self._local.conexao = conexao
+            with self._trava:
+                self._conexoes.append(conexao)
+        return conexao
+
+    def fechar(self) -> None:
+        """Fecha todas as conexões abertas pelas threads."""
+        with self._trava:
+            conexoes, self._conexoes = self._conexoes, []
+        for conexao in conexoes:
+            conexao.close()
+        self._local = threading.local()
+
+    def versao_dados(self) -> int:
+        """
+        Retorna a versão gravada pela última importação.
+
+        Returns:
+            int: Versão em metadados ou 0 se o banco ainda não foi
+            importado (assim os caches por versão funcionam também aí).
+        """
+        linha = self._conexao().execute(_SQL_VERSAO).fetchone()
+        return int(linha["valor"]) if linha else 0
+
+    @staticmethod
+    def _para_projeto(linha: sqlite3.Row) -> Projeto:
+        """Converte linha da tabela projetos em entidade Projeto."""
+        return Projeto(
+            id=linha["id"],
+            nome=linha["nome"],
+            descricao_curta=linha["descricao_curta"],
+            descricao_completa=linha["descricao_completa"],
+            tecnologias=json.loads(linha["tecnologias"]),
+            funcionalidades=json.loads(linha["funcionalidades"]),
+            aprendizados=json.loads(linha["aprendizados"]),
+            repositorio=linha["repositorio"],
+            demo=linha["demo"],
+            destaque=bool(linha["destaque"]),
+        )
+
+    def obter_sobre(self) -> dict:
+        """
+        Obtém informações da seção Sobre.
+
+        Returns:
+            dict: Dados da seção Sobre.
+        """
+        return {
+            linha["chave"]: json.loads(linha["valor"])
+            for linha in self._conexao().execute(_SQL_SOBRE)
+        }
+
+    def obter_projetos(self) -> list[Projeto]:
+        """
+        Obtém lista de projetos na ordem de importação.
+
+        Returns:
+            list[Projeto]: Lista de entidades Projeto.
+        """
+        return [
+            self._para_projeto(linha)
+            for linha in self._conexao().execute(_SQL_PROJETOS)
+        ]
+
+    def obter_projeto_por_id(self, projeto_id: str) -> Projeto | None:
+        """
+        Obtém projeto específico por ID (busca pela chave primária).
+
+        Args:
+            projeto_id: ID do projeto a buscar.
+
+        Returns:
+            Projeto | None: Projeto encontrado ou None.
+        """
+        linha = self._conexao().execute(_SQL_PROJETO_POR_ID, (projeto_id,)).fetchone()
+        return self._para_projeto(linha) if linha else None
+
+    def obter_stack(self) -> list[dict]:
+        """
+        Obtém lista de tecnologias do stack.
+
+        Returns:
+            list[dict]: Lista de tecnologias.
+        """
+        return [dict(linha) for linha in self._conexao().execute(_SQL_STACK)]
+
+    def obter_experiencias(self) -> list[ExperienciaProfissional]:
+        """
+        Obtém lista de experiências profissionais.
+
+        Returns:
+            list[ExperienciaProfissional]: Lista de entidades ExperienciaProfissional.
+        """
+        return [
+            ExperienciaProfissional(
+                id=linha["id"],
+                cargo=linha["cargo"],
+                empresa=linha["empresa"],
+                localizacao=linha["localizacao"],
+                data_inicio=date.fromisoformat(linha["data_inicio"]),
+                data_fim=(
+                    date.fromisoformat(linha["data_fim"])
+                    if linha["data_fim"] else None
+                ),
+                descricao=linha["descricao"],
+                tecnologias=json.loads(linha["tecnologias"]),
+                atual=bool(linha["atual"]),
+            )
+            for linha in self._conexao().execute(_SQL_EXPERIENCIAS)
+        ]
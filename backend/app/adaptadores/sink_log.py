@@ -0,0 +1,251 @@
+"""
+Destino de logs não bloqueante para structlog.
+
+Os processadores rodam na thread que loga (contexto, nível, timestamp,
+exceção) e o evento pronto vai para uma fila limitada. Uma thread de
+fundo renderiza (JSON ou console) e escreve em lotes, então um coletor
+lento de stdout não atrasa requisições no event loop.
+
+Fila cheia:
+    - "descartar": o evento é descartado e contado; a thread escreve um
+      aviso `logs_descartados` com o total no próximo lote.
+    - "bloquear": quem loga espera por espaço (nenhum evento se perde).
+"""
+
+import atexit
+import queue
+import sys
+import threading
+from typing import Any, Callable, Literal, TextIO
+
+PoliticaFila = Literal["descartar", "bloquear"]
+
+Renderizador = Callable[[Any, str, dict], str]
+
+_FIM = object()
+
+
+class SinkLogEmLote:
+    """
+    Fila de eventos + thread escritora em lotes.
+
+    Attributes:
+        descartados: Eventos descartados por fila cheia (acumulado).
+    """
+
+    def __init__(
+        self,
+        renderizador: Renderizador,
+        saida: TextIO | None = None,
+        tamanho_fila: int = 10_000,
+        politica: PoliticaFila = "descartar",
+        lote_maximo: int = 500,
+    ):
+        """
+        Inicializa sink (a thread só sobe no primeiro evento).
+
+        Args:
+            renderizador: Processador final do structlog (ex.: JSONRenderer).
+            saida: Stream de destino (padrão: sys.stdout).
+            tamanho_fila: Máximo de eventos aguardando escrita.
+            politica: "descartar" ou "bloquear" quando a fila enche.
+            lote_maximo: Máximo de eventos por escrita.
+        """
+        self.renderizador = renderizador
+        self.saida = saida if saida is not None else sys.stdout
+        self.politica = politica
+        self.lote_maximo = lote_maximo
+        self.descartados = 0
+        self._descartados_avisados = 0
+        self._fila: queue.Queue = queue.Queue(maxsize=tamanho_fila)
+        self._thread: threading.Thread | None = None
+        self._trava = threading.Lock()
+
+    def enfileirar(self, nome_metodo: str, evento: dict) -> None:
+        """
+        Entrega evento já processado para escrita em segundo plano.
+
+        Args:
+            nome_metodo: Método de log chamado (info, error, ...).
+            evento: Event dict após os processadores.
+        """
+        self._iniciar()
+        if self.politica == "bloquear":
+            self._fila.put((nome_metodo, evento))
+            return
+        try:
+            self._fila.put_nowait((nome_metodo, evento))
+        except queue.Full:
+            self.descartados += 1
+
+    def esvaziar(self, timeout: float | None = 5.0) -> bool:
+        """
+        Espera todos os eventos enfileirados serem escritos.
+
+        Args:
+            timeout: Espera máxima em segundos (None: sem limite).
+
+        Returns:
+            bool: True se a fila esvaziou dentro do prazo.
+        """
+        if self._thread is None:
+            return True
+        concluido = threading.Event()
+
+        def aguardar() -> None:
+            self._fila.join()
+            concluido.set()
+
+        threading.Thread(target=aguardar, daemon=True).start()
+        return concluido.wait(timeout)
+
+    def encerrar(self, timeout: float = 5.0) -> None:
+        """
+        Escreve o que falta e para a thread escritora.
+
+        Args:
+            timeout: Espera máxima em segundos.
+        """
+        with self._trava:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._fila.put(_FIM)
+        thread.join(timeout)
+
+    def _iniciar(self) -> None:
+        """Sobe a thread escritora na primeira chamada."""
+        if self._thread is not None:
+            return
+        with self._trava:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._escrever, name="sink-log", daemon=True
+                )
+                self._thread.start()
+
+    def _escrever(self) -> None:
+        """Laço da thread: junta um lote, renderiza e escreve de uma vez."""
+        while True:
+            item = self._fila.get()
+            lote = [item]
+            while item is not _FIM and len(lote) < self.lote_maximo:
+                try:
+                    item = self._fila.get_nowait()
+                except queue.Empty:
+                    break
+                lote.append(item)
+
+            linhas = [
+                self._renderizar(nome, evento)
+                for nome, evento in (i for i in lote if i is not _FIM)
+            ]
+            linhas.extend(self._aviso_descartados())
+            try:
+                if linhas:
+                    self.saida.write("\n".join(linhas) + "\n")
+                    self.saida.flush()
+            except (OSError, ValueError):
+                pass  # saída fechada: não há onde reportar
+            finally:
+                for _ in lote:
+                    self._fila.task_done()
+
+            if lote[-1] is _FIM:
+                return
+
+    def _renderizar(self, nome_metodo: str, evento: dict) -> str:
+        """Renderiza um evento; falha vira linha com repr do evento."""
+        try:
+            return self.renderizador(None, nome_metodo, evento)
+        except Exception as exc:
+            return f"log_nao_renderizado erro={exc!r} evento={evento!r}"
+
+    def _aviso_descartados(self) -> list[str]:
+        """Linha de aviso se houve descarte desde o último lote."""
+        total = self.descartados
+        novos = total - self._descartados_avisados
+        if not novos:
+            return []
+        self._descartados_avisados = total
+        return [self._renderizar("warning", {
+            "event": "logs_descartados",
+            "level": "warning",
+            "quantidade": novos,
+            "total": total,
+        })]
+
+
+class LoggerFila:
+    """
+    Logger do structlog que só enfileira o event dict no sink.
+
+    Recebe o evento como dict porque o último processador
+    (`encaminhar_para_fila`) não renderiza.
+    """
+
+    def __init__(self, sink: SinkLogEmLote):
+        self._sink = sink
+
+    def _enviar(self, nome_metodo: str) -> Callable[[dict], None]:
+        def enviar(evento: dict) -> None:
+            self._sink.enfileirar(nome_metodo, evento)
+        return enviar
+
+    def __getattr__(self, nome_metodo: str) -> Callable[[dict], None]:
+        # debug, info, warning, error, critical, exception, msg, ...
+        enviar = self._enviar(nome_metodo)
+        setattr(self, nome_metodo, enviar)
+        return enviar
+
+
+class FabricaLoggerFila:
+    """logger_factory do structlog: todos os loggers usam o mesmo sink."""
+
+    def __init__(self, sink: SinkLogEmLote):
+        self.sink = sink
+
+    def __call__(self, *args: Any) -> LoggerFila:
+        return LoggerFila(self.sink)
+
+
+def encaminhar_para_fila(logger: Any, nome_metodo: str, evento: dict) -> tuple:
+    """
+    Processador final: passa o event dict adiante sem renderizar.
+
+    Returns:
+        tuple: (args, kwargs) para o método de LoggerFila.
+    """
+    return (evento,), {}
+
+
+_sink_global: SinkLogEmLote | None = None
+
+
+def obter_sink(
+    renderizador: Renderizador,
+    tamanho_fila: int,
+    politica: PoliticaFila,
+    lote_maximo: int,
+) -> SinkLogEmLote:
+    """
+    Retorna o sink do processo, criando-o na primeira chamada.
+
+    Reconfigurar o structlog não cria outra thread; os parâmetros da
+    chamada mais recente substituem os anteriores.
+    """
+    global _sink_global
+    if _sink_global is None:
+        _sink_global = SinkLogEmLote(renderizador, None, tamanho_fila, politica, lote_maximo)
+        atexit.register(encerrar_sink)
+    else:
+        _sink_global.renderizador = renderizador
+        _sink_global.politica = politica
+        _sink_global.lote_maximo = lote_maximo
+    return _sink_global
+
+
+def encerrar_sink() -> None:
+    """Escreve eventos pendentes e para a thread (shutdown/atexit)."""
+    if _sink_global is not None:
+        _sink_global.encerrar()
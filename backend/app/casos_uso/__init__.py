@@ -12,11 +12,27 @@ Casos de uso NÃO devem:
 - Lidar com validação de entrada (feito por schemas)
 """
 
-from app.casos_uso.obter_sobre import ObterSobreUseCase
-from app.casos_uso.obter_projetos import ObterProjetosUseCase, ObterProjetoPorIdUseCase
-from app.casos_uso.obter_stack import ObterStackUseCase
-from app.casos_uso.obter_experiencias import ObterExperienciasUseCase
+from app.casos_uso.obter_sobre import ObterSobreUseCase, ObterSobreAssincronoUseCase
+from app.casos_uso.obter_projetos import (
+    OrdenacaoProjetos,
+    ObterProjetosUseCase,
+    ObterProjetoPorIdUseCase,
+    ObterProjetosAssincronoUseCase,
+    ObterProjetoPorIdAssincronoUseCase,
+)
+from app.casos_uso.obter_stack import ObterStackUseCase, ObterStackAssincronoUseCase
+from app.casos_uso.obter_experiencias import (
+    OrdenacaoExperiencias,
+    ObterExperienciasUseCase,
+    ObterExperienciasAssincronoUseCase,
+)
+from app.casos_uso.buscar_projetos import (
+    BuscarProjetosUseCase,
+    BuscarProjetosAssincronoUseCase,
+)
 from app.casos_uso.enviar_contato import EnviarContatoUseCase
+from app.casos_uso.entregar_contato import EntregarContatoUseCase
+from app.casos_uso.filtros import IndiceTecnologias, ModoFiltro
 
 __all__ = [
     "ObterSobreUseCase",
@@ -24,5 +40,17 @@ __all__ = [
     "ObterProjetoPorIdUseCase",
     "ObterStackUseCase",
     "ObterExperienciasUseCase",
+    "ObterSobreAssincronoUseCase",
+    "ObterProjetosAssincronoUseCase",
+    "ObterProjetoPorIdAssincronoUseCase",
+    "ObterStackAssincronoUseCase",
+    "ObterExperienciasAssincronoUseCase",
+    "BuscarProjetosUseCase",
+    "BuscarProjetosAssincronoUseCase",
     "EnviarContatoUseCase",
+    "EntregarContatoUseCase",
+    "IndiceTecnologias",
+    "ModoFiltro",
+    "OrdenacaoProjetos",
+    "OrdenacaoExperiencias",
 ]
@@ -0,0 +1,246 @@
+"""
+Casos de uso: Busca textual em projetos.
+
+Lógica pura, sem dependência de FastAPI.
+
+Um índice invertido é montado uma vez por versão dos dados sobre nome,
+descrições, funcionalidades e aprendizados. A tokenização ignora acentos
+e caixa (conteúdo em português) e o ranqueamento usa BM25 com pesos por
+campo; a contribuição de cada termo em cada projeto é pré-calculada, de
+modo que a consulta apenas soma valores das listas de postagem.
+"""
+
+import math
+import re
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass
+
+from app.adaptadores.repositorio import RepositorioPortfolio
+from app.adaptadores.repositorio_assincrono import RepositorioPortfolioAssincrono
+from app.core.cache import CachePorVersao
+from app.entidades.projeto import Projeto
+
+# Peso de cada campo na frequência do termo (BM25F simplificado)
+PESOS_CAMPOS = {
+    "nome": 3.0,
+    "descricao_curta": 2.0,
+    "descricao_completa": 1.0,
+    "funcionalidades": 1.0,
+    "aprendizados": 1.0,
+}
+
+# Parâmetros clássicos do BM25
+_K1 = 1.2
+_B = 0.75
+
+_PALAVRAS_VAZIAS = frozenset(
+    "a ao aos as com da das de do dos e em na nas no nos o os ou para "
+    "pela pelas pelo pelos por que se sem um uma".split()
+)
+_RE_TOKEN = re.compile(r"\w+")
+
+
+def normalizar(texto: str) -> str:
+    """
+    Remove acentos e caixa para comparação.
+
+    Example:
+        >>> normalizar("Validação Automática")
+        'validacao automatica'
+    """
+    decomposto = unicodedata.normalize("NFKD", texto)
+    sem_acentos = "".join(c for c in decomposto if not unicodedata.combining(c))
+    return sem_acentos.casefold()
+
+
+def tokenizar(texto: str) -> list[str]:
+    """
+    Quebra texto em termos normalizados, sem palavras vazias.
+
+    Example:
+        >>> tokenizar("Integração com a API de Pagamentos")
+        ['integracao', 'api', 'pagamentos']
+    """
+    return [
+        token
+        for token in _RE_TOKEN.findall(normalizar(texto))
+        if token not in _PALAVRAS_VAZIAS
+    ]
+
+
+def _textos_do_campo(projeto: Projeto, campo: str) -> list[str]:
+    """Retorna o campo como lista de textos (campos lista ou texto)."""
+    valor = getattr(projeto, campo)
+    return list(valor) if isinstance(valor, (list, tuple)) else [valor]
+
+
+@dataclass(frozen=True)
+class ResultadoBusca:
+    """
+    Projeto encontrado e sua relevância.
+
+    Attributes:
+        projeto: Projeto encontrado.
+        pontuacao: Pontuação BM25 (maior é mais relevante).
+    """
+
+    projeto: Projeto
+    pontuacao: float
+
+
+class IndiceBusca:
+    """
+    Índice invertido termo → [(posição do projeto, pontuação)].
+
+    Attributes:
+        projetos: Projetos indexados (posição usada nas postagens).
+        postagens: Contribuição BM25 pré-calculada por termo e projeto.
+    """
+
+    def __init__(self, projetos: list[Projeto]):
+        """
+        Monta o índice.
+
+        Args:
+            projetos: Projetos a indexar.
+        """
+        self.projetos: tuple[Projeto, ...] = tuple(projetos)
+
+        frequencias: list[dict[str, float]] = []
+        comprimentos: list[float] = []
+        for projeto in self.projetos:
+            tf: dict[str, float] = defaultdict(float)
+            comprimento = 0.0
+            for campo, peso in PESOS_CAMPOS.items():
+                for texto in _textos_do_campo(projeto, campo):
+                    for token in tokenizar(texto):
+                        tf[token] += peso
+                        comprimento += peso
+            frequencias.append(tf)
+            comprimentos.append(comprimento)
+
+        total = len(self.projetos)
+        media = (sum(comprimentos) / total) if total else 0.0
+        documentos_por_termo: dict[str, int] = defaultdict(int)
+        for tf in frequencias:
+            for termo in tf:
+                documentos_por_termo[termo] += 1
+
+        self.postagens: dict[str, list[tuple[int, float]]] = defaultdict(list)
+        for posicao, (tf, comprimento) in enumerate(zip(frequencias, comprimentos)):
+            normalizacao = _K1 * (1 - _B + _B * comprimento / media) if media else _K1
+            for termo, frequencia in tf.items():
+                df = documentos_por_termo[termo]
+                idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+                pontuacao = idf * frequencia * (_K1 + 1) / (frequencia + normalizacao)
+                self.postagens[termo].append((posicao, pontuacao))
+        self.postagens = dict(self.postagens)
+
+    def buscar(self, consulta: str, limite: int = 20) -> list[ResultadoBusca]:
+        """
+        Retorna projetos que contêm algum termo da consulta, por relevância.
+
+        Args:
+            consulta: Texto livre.
+            limite: Máximo de resultados.
+
+        Returns:
+            list[ResultadoBusca]: Resultados ordenados por pontuação.
+        """
+        pontuacoes: dict[int, float] = defaultdict(float)
+        for termo in set(tokenizar(consulta)):
+            for posicao, pontuacao in self.postagens.get(termo, ()):
+                pontuacoes[posicao] += pontuacao
+
+        melhores = sorted(
+            pontuacoes.items(),
+            key=lambda par: (-par[1], self.projetos[par[0]].nome),
+        )[:limite]
+        return [
+            ResultadoBusca(projeto=self.projetos[posicao], pontuacao=round(pontuacao, 4))
+            for posicao, pontuacao in melhores
+        ]
+
+
+class BuscarProjetosUseCase:
+    """
+    Caso de uso para busca textual em projetos.
+
+    Responsabilidade:
+        - Manter índice invertido por versão dos dados
+        - Retornar projetos ordenados por relevância
+
+    Attributes:
+        repositorio: Repositório de dados do portfólio.
+    """
+
+    def __init__(self, repositorio: RepositorioPortfolio):
+        """
+        Inicializa caso de uso.
+
+        Args:
+            repositorio: Implementação de RepositorioPortfolio.
+        """
+        self.repositorio = repositorio
+        self._cache = CachePorVersao()
+
+    def executar(self, consulta: str, limite: int = 20) -> list[ResultadoBusca]:
+        """
+        Executa caso de uso.
+
+        Args:
+            consulta: Texto buscado (acentos e caixa são ignorados).
+            limite: Máximo de resultados.
+
+        Returns:
+            list[ResultadoBusca]: Resultados ordenados por relevância.
+
+        Example:
+            >>> uc = BuscarProjetosUseCase(RepositorioJSON())
+            >>> uc.executar("validacao")[0].projeto.id
+            'portfolio-api'
+        """
+        indice = self._cache.obter(
+            self.repositorio.versao_dados(),
+            "busca",
+            lambda: IndiceBusca(self.repositorio.obter_projetos()),
+        )
+        return indice.buscar(consulta, limite)
+
+
+class BuscarProjetosAssincronoUseCase:
+    """
+    Versão assíncrona de BuscarProjetosUseCase.
+
+    Attributes:
+        repositorio: Repositório assíncrono de dados do portfólio.
+    """
+
+    def __init__(self, repositorio: RepositorioPortfolioAssincrono):
+        """
+        Inicializa caso de uso.
+
+        Args:
+            repositorio: Implementação de RepositorioPortfolioAssincrono.
+        """
+        self.repositorio = repositorio
+        self._cache = CachePorVersao()
+
+    async def executar(self, consulta: str, limite: int = 20) -> list[ResultadoBusca]:
+        """
+        Executa caso de uso.
+
+        Args:
+            consulta: Texto buscado (acentos e caixa são ignorados).
+            limite: Máximo de resultados.
+
+        Returns:
+            list[ResultadoBusca]: Resultados ordenados por relevância.
+        """
+        versao = await self.repositorio.versao_dados()
+        indice = self._cache.valor(versao, "busca")
+        if indice is None:
+            projetos = await self.repositorio.obter_projetos()
+            indice = self._cache.guardar(versao, "busca", IndiceBusca(projetos))
+        return indice.buscar(consulta, limite)
@@ -0,0 +1,222 @@
+"""
+Caso de uso: Entregar mensagens de contato da caixa de saída.
+
+Workers assíncronos reservam mensagens vencidas, enviam pelo adaptador
+de email e concluem, reagendam com backoff exponencial ou descartam
+quando as tentativas acabam. Sem dependência de FastAPI.
+"""
+
+import asyncio
+import random
+
+from app.adaptadores.caixa_saida import CaixaSaida, ItemCaixaSaida
+from app.adaptadores.email_adaptador import EmailAdaptador
+from app.adaptadores.logger_adaptador import LoggerAdaptador
+from app.core.excecoes import ErroCircuitoAberto
+from app.core.metricas import ENTREGAS_CONTATO
+
+
+class EntregarContatoUseCase:
+    """
+    Caso de uso para entregar mensagens enfileiradas.
+
+    Responsabilidade:
+        - Reservar lotes de mensagens vencidas na caixa de saída
+        - Enviar via adaptador de email
+        - Reagendar falhas com backoff exponencial (com jitter)
+        - Adiar, sem gastar tentativa, quando o provedor está suspenso
+        - Manter um grupo limitado de workers e drenar as vencidas no shutdown
+
+    Attributes:
+        caixa_saida: Caixa de saída com as mensagens.
+        email_adaptador: Adaptador para envio de emails.
+        logger: Adaptador para logging.
+        tentativas_maximas: Tentativas antes de descartar a mensagem.
+        atraso_base: Atraso (segundos) após a primeira falha.
+        atraso_maximo: Teto do atraso entre tentativas.
+        lote: Mensagens entregues por rodada do worker.
+    """
+
+    def __init__(
+        self,
+        caixa_saida: CaixaSaida,
+        email_adaptador: EmailAdaptador,
+        logger: LoggerAdaptador,
+        tentativas_maximas: int = 5,
+        atraso_base: float = 2.0,
+        atraso_maximo: float = 300.0,
+        lote: int = 10,
+        aleatorio: random.Random | None = None,
+    ):
+        """
+        Inicializa caso de uso (sem workers rodando).
+
+        Args:
+            caixa_saida: Implementação de CaixaSaida.
+            email_adaptador: Implementação de EmailAdaptador.
+            logger: Implementação de LoggerAdaptador.
+            tentativas_maximas: Tentativas antes de descartar.
+            atraso_base: Atraso após a primeira falha (dobra a cada falha).
+            atraso_maximo: Teto do atraso.
+            lote: Mensagens reservadas e entregues por rodada.
+            aleatorio: Gerador do jitter (injetável em testes).
+        """
+        self.caixa_saida = caixa_saida
+        self.email_adaptador = email_adaptador
+        self.logger = logger
+        self.tentativas_maximas = tentativas_maximas
+        self.atraso_base = atraso_base
+        self.atraso_maximo = atraso_maximo
+        self.lote = lote
+        self._aleatorio = aleatorio or random.Random()
+        self._workers: list[asyncio.Task] = []
+        self._encerrando = False
+
+    def atraso(self, tentativas: int) -> float:
+        """
+        Atraso antes da próxima tentativa.
+
+        Args:
+            tentativas: Tentativas já feitas (>= 1).
+
+        Returns:
+            float: base * 2^(tentativas-1), limitado ao teto, com jitter
+            de 50-100% para espalhar reenvios simultâneos.
+        """
+        atraso = min(self.atraso_maximo, self.atraso_base * 2 ** (tentativas - 1))
+        return atraso * (0.5 + self._aleatorio.random() / 2)
+
+    async def entregar(self, item: ItemCaixaSaida) -> str:
+        """
+        Faz uma tentativa de envio e atualiza a caixa de saída.
+
+        Args:
+            item: Item reservado.
+
+        Returns:
+            str: "enviada", "nova_tentativa", "adiada" ou "descartada".
+        """
+        mensagem = item.mensagem
+        try:
+            sucesso = await self.email_adaptador.enviar_mensagem(mensagem)
+        except ErroCircuitoAberto as exc:
+            # Nada foi enviado: volta para a fila quando o disjuntor testar
+            atraso = max(exc.tentar_apos, 1.0)
+            await self.caixa_saida.reagendar(item, atraso, contar_tentativa=False)
+            ENTREGAS_CONTATO.incrementar("adiada")
+            return "adiada"
+        except Exception as exc:
+            # Adaptadores não devem levantar; se levantarem, conta como falha
+            self.logger.erro("Erro inesperado no envio", id=mensagem.id, erro=str(exc))
+            sucesso = False
+
+        if sucesso:
+            await self.caixa_saida.concluir(item)
+            resultado = "enviada"
+            self.logger.info(
+                "Mensagem de contato enviada com sucesso",
+                id=mensagem.id,
+                tentativas=item.tentativas + 1,
+            )
+        elif item.tentativas + 1 >= self.tentativas_maximas:
+            await self.caixa_saida.descartar(item)
+            resultado = "descartada"
+            self.logger.erro(
+                "Mensagem de contato descartada após tentativas",
+                id=mensagem.id,
+                tentativas=item.tentativas + 1,
+            )
+        else:
+            atraso = self.atraso(item.tentativas + 1)
+            await self.caixa_saida.reagendar(item, atraso)
+            resultado = "nova_tentativa"
+            self.logger.aviso(
+                "Falha ao enviar mensagem de contato; nova tentativa agendada",
+                id=mensagem.id,
+                tentativas=item.tentativas,
+                atraso_s=round(atraso, 1),
+            )
+
+        ENTREGAS_CONTATO.incrementar(resultado)
+        return resultado
+
+    async def executar_lote(self) -> int:
+        """
+        Reserva até `lote` mensagens vencidas e as entrega em sequência.
+
+        Uma reserva por lote (uma escrita no SQLite, não uma por envio);
+        a caixa dá a cada item um prazo que conta a partir da vez dele,
+        então os últimos do lote não vencem enquanto esperam.
+
+        Returns:
+            int: Mensagens processadas (0 se nenhuma vencida).
+        """
+        itens = await self.caixa_saida.reservar(self.lote)
+        for item in itens:
+            await self.entregar(item)
+        return len(itens)
+
+    def iniciar(self, quantidade: int) -> None:
+        """
+        Sobe `quantidade` workers no event loop atual.
+
+        Args:
+            quantidade: Tamanho do grupo de workers.
+        """
+        self._encerrando = False
+        self._workers = [
+            asyncio.create_task(self._trabalhar(), name=f"entrega-contato-{i}")
+            for i in range(quantidade)
+        ]
+
+    async def encerrar(self, timeout: float) -> int:
+        """
+        Drena as mensagens vencidas e para os workers.
+
+        Workers continuam entregando enquanto houver mensagem reservável
+        agora; as que estão em backoff não seguram o shutdown. Passado o
+        prazo, os workers são cancelados. O que sobra na caixa é
+        reportado como adiado (caixa durável) ou perdido (em memória).
+
+        Args:
+            timeout: Espera máxima (segundos) pela drenagem.
+
+        Returns:
+            int: Mensagens que ficaram na caixa.
+        """
+        if not self._workers:
+            return self.caixa_saida.profundidade()
+        self._encerrando = True
+        _, pendentes = await asyncio.wait(self._workers, timeout=timeout)
+        for worker in pendentes:
+            worker.cancel()
+        await asyncio.gather(*pendentes, return_exceptions=True)
+        self._workers = []
+
+        restantes = self.caixa_saida.profundidade()
+        if restantes and self.caixa_saida.duravel:
+            self.logger.aviso(
+                "Mensagens de contato adiadas para o próximo início",
+                quantidade=restantes,
+            )
+        elif restantes:
+            self.logger.erro(
+                "Mensagens de contato perdidas no encerramento",
+                quantidade=restantes,
+            )
+        return restantes
+
+    async def _trabalhar(self) -> None:
+        """Laço do worker: entrega lotes; sem vencidas, espera ou (no shutdown) sai."""
+        while True:
+            try:
+                if await self.executar_lote():
+                    continue
+            except Exception as exc:
+                # Falha da caixa de saída: não derrubar o worker
+                self.logger.erro("Erro no worker de entrega de contato", erro=str(exc))
+                await asyncio.sleep(1.0)
+                continue
+            if self._encerrando:
+                return
+            await self.caixa_saida.aguardar(1.0)
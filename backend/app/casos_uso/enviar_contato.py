@@ -2,10 +2,12 @@
 Caso de uso: Enviar mensagem de contato.
 
 Lógica pura com operação assíncrona, sem dependência de FastAPI.
+A mensagem é gravada na caixa de saída; a entrega fica com
+EntregarContatoUseCase.
 """
 
 from app.entidades.mensagem import Mensagem
-from app.adaptadores.email_adaptador import EmailAdaptador
+from app.adaptadores.caixa_saida import CaixaSaida
 from app.adaptadores.logger_adaptador import LoggerAdaptador
 
 
@@ -14,29 +16,29 @@ class EnviarContatoUseCase:
     Caso de uso para enviar mensagem de contato.
 
     Responsabilidade:
-        - Criar entidade Mensagem
-        - Enviar via adaptador de email
-        - Registrar logs de sucesso/falha
-        - Retornar resultado da operação
+        - Criar entidade Mensagem (com id de rastreamento)
+        - Gravar na caixa de saída para entrega assíncrona
+        - Registrar logs
+        - Retornar a mensagem gravada
 
     Attributes:
-        email_adaptador: Adaptador para envio de emails.
+        caixa_saida: Caixa de saída das mensagens.
         logger: Adaptador para logging.
     """
 
     def __init__(
         self,
-        email_adaptador: EmailAdaptador,
+        caixa_saida: CaixaSaida,
         logger: LoggerAdaptador,
     ):
         """
         Inicializa caso de uso.
 
         Args:
-            email_adaptador: Implementação de EmailAdaptador.
+            caixa_saida: Implementação de CaixaSaida.
             logger: Implementação de LoggerAdaptador.
         """
-        self.email_adaptador = email_adaptador
+        self.caixa_saida = caixa_saida
         self.logger = logger
 
     async def executar(
@@ -45,7 +47,7 @@ class EnviarContatoUseCase:
         email: str,
         assunto: str,
         mensagem: str,
-    ) -> bool:
+    ) -> Mensagem:
         """
         Executa caso de uso de envio de mensagem.
 
@@ -56,18 +58,23 @@ class EnviarContatoUseCase:
             mensagem: Conteúdo da mensagem.
 
         Returns:
-            bool: True se enviado com sucesso, False caso contrário.
+            Mensagem: Mensagem gravada (use `id` para rastrear a entrega).
+
+        Raises:
+            ErroServicoIndisponivel: Se a caixa de saída está cheia.
 
         Example:
-            >>> email_adaptador = FormspreeEmailAdaptador(url, form_id)
+            >>> caixa = CaixaSaidaMemoria()
             >>> logger = LoggerEstruturado()
-            >>> uc = EnviarContatoUseCase(email_adaptador, logger)
-            >>> sucesso = await uc.executar(
+            >>> uc = EnviarContatoUseCase(caixa, logger)
+            >>> mensagem = await uc.executar(
             ...     "Maria",
             ...     "maria@example.com",
             ...     "Teste",
             ...     "Mensagem de teste"
             ... )
+            >>> mensagem.id
+            '3f2a...'
         """
         # Criar entidade de domínio
         mensagem_entidade = Mensagem(
@@ -77,24 +84,12 @@ class EnviarContatoUseCase:
             mensagem=mensagem,
         )
 
-        # Tentar enviar
+        await self.caixa_saida.adicionar(mensagem_entidade)
+
         self.logger.info(
-            "Tentando enviar mensagem de contato",
+            "Mensagem de contato enfileirada",
+            id=mensagem_entidade.id,
             remetente=nome,
             email=email,
         )
-
-        sucesso = await self.email_adaptador.enviar_mensagem(mensagem_entidade)
-
-        if sucesso:
-            self.logger.info(
-                "Mensagem de contato enviada com sucesso",
-                remetente=nome,
-            )
-        else:
-            self.logger.erro(
-                "Falha ao enviar mensagem de contato",
-                remetente=nome,
-            )
-
-        return sucesso
+        return mensagem_entidade
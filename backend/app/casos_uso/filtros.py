@@ -0,0 +1,73 @@
+"""
+Filtro por tecnologia com bitsets pré-calculados.
+
+Lógica pura, sem dependência de FastAPI.
+
+Para cada tecnologia guarda-se um inteiro cujo bit i indica que o item
+na posição i de um IndiceOrdenado usa a tecnologia. Consultas com várias
+tecnologias viram interseções (modo "todas") ou uniões (modo "qualquer")
+de inteiros, sem percorrer as entidades.
+"""
+
+from collections import defaultdict
+from functools import reduce
+from operator import and_, or_
+from typing import Callable, Iterable, Literal, Sequence, TypeVar
+
+from app.casos_uso.buscar_projetos import normalizar
+
+T = TypeVar("T")
+
+ModoFiltro = Literal["todas", "qualquer"]
+
+
+class IndiceTecnologias:
+    """
+    Índice tecnologia normalizada → bitset de posições.
+
+    Attributes:
+        mascaras: Bitset de cada tecnologia (chave sem acento/caixa).
+    """
+
+    def __init__(
+        self,
+        itens: Sequence[T],
+        tecnologias: Callable[[T], Iterable[str]],
+    ):
+        """
+        Monta os bitsets.
+
+        Args:
+            itens: Itens na ordem de um IndiceOrdenado.
+            tecnologias: Função que retorna as tecnologias de um item.
+        """
+        posicoes: dict[str, list[int]] = defaultdict(list)
+        for posicao, item in enumerate(itens):
+            for tecnologia in tecnologias(item):
+                posicoes[normalizar(tecnologia)].append(posicao)
+        self.mascaras: dict[str, int] = {
+            tecnologia: sum(1 << posicao for posicao in set(lista))
+            for tecnologia, lista in posicoes.items()
+        }
+
+    def mascara(
+        self,
+        tecnologias: Iterable[str],
+        modo: ModoFiltro = "todas",
+    ) -> int | None:
+        """
+        Combina os bitsets das tecnologias pedidas.
+
+        Args:
+            tecnologias: Tecnologias pedidas (acentos e caixa ignorados).
+            modo: "todas" (interseção) ou "qualquer" (união).
+
+        Returns:
+            int | None: Bitset resultante ou None se nenhuma tecnologia
+            foi informada (sem filtro).
+        """
+        chaves = {normalizar(t.strip()) for t in tecnologias if t.strip()}
+        if not chaves:
+            return None
+        mascaras = [self.mascaras.get(chave, 0) for chave in chaves]
+        return reduce(and_ if modo == "todas" else or_, mascaras)
@@ -2,12 +2,81 @@
 Caso de uso: Obter experiências profissionais.
 
 Lógica pura, sem dependência de FastAPI.
+Variantes assíncronas usam RepositorioPortfolioAssincrono.
 """
 
+from typing import Callable, Literal
+
 from app.adaptadores.repositorio import RepositorioPortfolio
+from app.adaptadores.repositorio_assincrono import RepositorioPortfolioAssincrono
+from app.casos_uso.filtros import IndiceTecnologias, ModoFiltro
+from app.casos_uso.paginacao import IndiceOrdenado
+from app.core.cache import CachePorVersao
 from app.entidades.experiencia import ExperienciaProfissional
 
 
+OrdenacaoExperiencias = Literal["cronologica", "data_inicio", "tecnologias"]
+
+
+def _chave_cronologica(experiencia: ExperienciaProfissional) -> tuple:
+    """Atuais primeiro, depois mais recentes; id desempata."""
+    return (
+        not experiencia.atual,
+        -experiencia.data_inicio.toordinal(),
+        experiencia.id,
+    )
+
+
+def _chave_data_inicio(experiencia: ExperienciaProfissional) -> tuple:
+    """Mais antigas primeiro; id desempata."""
+    return (experiencia.data_inicio.toordinal(), experiencia.id)
+
+
+def _chave_tecnologias(experiencia: ExperienciaProfissional) -> tuple:
+    """Mais tecnologias primeiro, depois mais recentes; id desempata."""
+    return (
+        -len(experiencia.tecnologias),
+        -experiencia.data_inicio.toordinal(),
+        experiencia.id,
+    )
+
+
+ORDENACOES_EXPERIENCIAS: dict[str, Callable[[ExperienciaProfissional], tuple]] = {
+    "cronologica": _chave_cronologica,
+    "data_inicio": _chave_data_inicio,
+    "tecnologias": _chave_tecnologias,
+}
+
+
+def _indexar_experiencias(
+    experiencias: list[ExperienciaProfissional] | tuple[ExperienciaProfissional, ...],
+    ordenacao: OrdenacaoExperiencias = "cronologica",
+) -> IndiceOrdenado[ExperienciaProfissional]:
+    """Monta índice na ordenação pedida."""
+    return IndiceOrdenado(
+        experiencias, ORDENACOES_EXPERIENCIAS[ordenacao], ordenacao
+    )
+
+
+def _indexar_tecnologias(
+    experiencias: tuple[ExperienciaProfissional, ...],
+) -> IndiceTecnologias:
+    """Bitsets de tecnologia sobre as posições do índice ordenado."""
+    return IndiceTecnologias(experiencias, lambda e: e.tecnologias)
+
+
+def _filtrar(
+    indice: IndiceOrdenado[ExperienciaProfissional],
+    tecnologias: list[str] | None,
+    modo: ModoFiltro,
+) -> list[ExperienciaProfissional]:
+    """Aplica filtro por tecnologia mantendo a ordem do índice."""
+    if not tecnologias:
+        return list(indice.itens)
+    filtro = indice.derivado("tecnologias", _indexar_tecnologias)
+    return list(indice.pagina(None, None, filtro.mascara(tecnologias, modo)).itens)
+
+
 class ObterExperienciasUseCase:
     """
     Caso de uso para obter experiências profissionais.
@@ -15,8 +84,12 @@ class ObterExperienciasUseCase:
     Responsabilidade:
         - Buscar experiências no repositório
         - Ordenar cronologicamente (mais recente primeiro)
+        - Filtrar por tecnologia
         - Retornar lista ordenada
 
+    Cada ordenação e seus bitsets de tecnologia são calculados uma vez por
+    versão dos dados; as secundárias, só no primeiro uso.
+
     Attributes:
         repositorio: Repositório de dados do portfólio.
     """
@@ -29,11 +102,38 @@ class ObterExperienciasUseCase:
             repositorio: Implementação de RepositorioPortfolio.
         """
         self.repositorio = repositorio
+        self._cache = CachePorVersao()
 
-    def executar(self) -> list[ExperienciaProfissional]:
+    def _indice(
+        self, ordenacao: OrdenacaoExperiencias = "cronologica"
+    ) -> IndiceOrdenado[ExperienciaProfissional]:
+        """Retorna índice da ordenação pedida na versão atual dos dados."""
+        versao = self.repositorio.versao_dados()
+        base = self._cache.obter(
+            versao,
+            "cronologica",
+            lambda: _indexar_experiencias(self.repositorio.obter_experiencias()),
+        )
+        if ordenacao == "cronologica":
+            return base
+        return self._cache.obter(
+            versao, ordenacao, lambda: _indexar_experiencias(base.itens, ordenacao)
+        )
+
+    def executar(
+        self,
+        tecnologias: list[str] | None = None,
+        modo: ModoFiltro = "todas",
+        ordenacao: OrdenacaoExperiencias = "cronologica",
+    ) -> list[ExperienciaProfissional]:
         """
         Executa caso de uso.
 
+        Args:
+            tecnologias: Filtra experiências por tecnologia (None sem filtro).
+            modo: "todas" exige todas as tecnologias; "qualquer", ao menos uma.
+            ordenacao: "cronologica" (padrão), "data_inicio" ou "tecnologias".
+
         Returns:
             list[ExperienciaProfissional]: Lista de experiências ordenadas.
 
@@ -48,8 +148,59 @@ class ObterExperienciasUseCase:
             >>> experiencias[0].atual
             True
         """
-        experiencias = self.repositorio.obter_experiencias()
-        return sorted(
-            experiencias,
-            key=lambda e: (not e.atual, -e.data_inicio.toordinal())
+        return _filtrar(self._indice(ordenacao), tecnologias, modo)
+
+
+class ObterExperienciasAssincronoUseCase:
+    """
+    Versão assíncrona de ObterExperienciasUseCase.
+
+    Attributes:
+        repositorio: Repositório assíncrono de dados do portfólio.
+    """
+
+    def __init__(self, repositorio: RepositorioPortfolioAssincrono):
+        """
+        Inicializa caso de uso.
+
+        Args:
+            repositorio: Implementação de RepositorioPortfolioAssincrono.
+        """
+        self.repositorio = repositorio
+        self._cache = CachePorVersao()
+
+    async def _indice(
+        self, ordenacao: OrdenacaoExperiencias = "cronologica"
+    ) -> IndiceOrdenado[ExperienciaProfissional]:
+        """Retorna índice da ordenação pedida na versão atual dos dados."""
+        versao = await self.repositorio.versao_dados()
+        base = self._cache.valor(versao, "cronologica")
+        if base is None:
+            experiencias = await self.repositorio.obter_experiencias()
+            base = self._cache.guardar(
+                versao, "cronologica", _indexar_experiencias(experiencias)
+            )
+        if ordenacao == "cronologica":
+            return base
+        return self._cache.obter(
+            versao, ordenacao, lambda: _indexar_experiencias(base.itens, ordenacao)
         )
+
+    async def executar(
+        self,
+        tecnologias: list[str] | None = None,
+        modo: ModoFiltro = "todas",
+        ordenacao: OrdenacaoExperiencias = "cronologica",
+    ) -> list[ExperienciaProfissional]:
+        """
+        Executa caso de uso.
+
+        Args:
+            tecnologias: Filtra experiências por tecnologia (None sem filtro).
+            modo: "todas" exige todas as tecnologias; "qualquer", ao menos uma.
+            ordenacao: "cronologica" (padrão), "data_inicio" ou "tecnologias".
+
+        Returns:
+            list[ExperienciaProfissional]: Lista de experiências ordenadas.
+        """
+        return _filtrar(await self._indice(ordenacao), tecnologias, modo)
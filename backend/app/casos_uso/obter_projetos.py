@@ -2,20 +2,67 @@
 Casos de uso: Obter projetos.
 
 Lógica pura, sem dependência de FastAPI.
+Variantes assíncronas usam RepositorioPortfolioAssincrono.
 """
 
+from typing import Callable, Literal
+
 from app.adaptadores.repositorio import RepositorioPortfolio
+from app.adaptadores.repositorio_assincrono import RepositorioPortfolioAssincrono
+from app.casos_uso.filtros import IndiceTecnologias, ModoFiltro
+from app.casos_uso.paginacao import IndiceOrdenado, Pagina
+from app.core.cache import CachePorVersao
 from app.entidades.projeto import Projeto
 
 
+OrdenacaoProjetos = Literal["destaque", "nome", "tecnologias"]
+
+
+def _chave_destaque(projeto: Projeto) -> tuple[bool, str, str]:
+    """Destacados primeiro, depois alfabético; id desempata (chave única)."""
+    return (not projeto.destaque, projeto.nome, projeto.id)
+
+
+def _chave_nome(projeto: Projeto) -> tuple[str, str]:
+    """Alfabético sem distinguir caixa; id desempata."""
+    return (projeto.nome.casefold(), projeto.id)
+
+
+def _chave_tecnologias(projeto: Projeto) -> tuple[int, str, str]:
+    """Mais tecnologias primeiro, depois alfabético; id desempata."""
+    return (-len(projeto.tecnologias), projeto.nome, projeto.id)
+
+
+ORDENACOES_PROJETOS: dict[str, Callable[[Projeto], tuple]] = {
+    "destaque": _chave_destaque,
+    "nome": _chave_nome,
+    "tecnologias": _chave_tecnologias,
+}
+
+
+def _indexar_tecnologias(projetos: tuple[Projeto, ...]) -> IndiceTecnologias:
+    """Bitsets de tecnologia sobre as posições do índice ordenado."""
+    return IndiceTecnologias(projetos, lambda p: p.tecnologias)
+
+
+def _indexar_projetos(
+    projetos: list[Projeto] | tuple[Projeto, ...],
+    ordenacao: OrdenacaoProjetos = "destaque",
+) -> IndiceOrdenado[Projeto]:
+    """Ordena projetos uma vez para servir listagem e páginas."""
+    return IndiceOrdenado(projetos, ORDENACOES_PROJETOS[ordenacao], ordenacao)
+
+
 class ObterProjetosUseCase:
     """
     Caso de uso para listar projetos.
 
     Responsabilidade:
         - Buscar projetos no repositório
-        - Ordenar (destacados primeiro, depois alfabético)
-        - Retornar lista de projetos
+        - Ordenar (destacados primeiro, depois alfabético), uma vez por
+          versão dos dados
+        - Materializar outras ordenações (nome, tecnologias) no primeiro uso
+        - Retornar lista completa ou página (paginação por chave)
 
     Attributes:
         repositorio: Repositório de dados do portfólio.
@@ -29,17 +76,43 @@ class ObterProjetosUseCase:
             repositorio: Implementação de RepositorioPortfolio.
         """
         self.repositorio = repositorio
+        self._cache = CachePorVersao()
+
+    def _indice(
+        self, ordenacao: OrdenacaoProjetos = "destaque"
+    ) -> IndiceOrdenado[Projeto]:
+        """
+        Retorna índice da ordenação pedida na versão atual dos dados.
+
+        Ordenações secundárias partem dos itens do índice padrão, então o
+        repositório é lido uma vez por versão.
+        """
+        versao = self.repositorio.versao_dados()
+        base = self._cache.obter(
+            versao,
+            "destaque",
+            lambda: _indexar_projetos(self.repositorio.obter_projetos()),
+        )
+        if ordenacao == "destaque":
+            return base
+        return self._cache.obter(
+            versao, ordenacao, lambda: _indexar_projetos(base.itens, ordenacao)
+        )
 
-    def executar(self) -> list[Projeto]:
+    def executar(self, ordenacao: OrdenacaoProjetos = "destaque") -> list[Projeto]:
         """
         Executa caso de uso.
 
+        Args:
+            ordenacao: "destaque" (padrão), "nome" ou "tecnologias".
+
         Returns:
-            list[Projeto]: Lista de projetos ordenada (destacados primeiro).
+            list[Projeto]: Lista de projetos na ordenação pedida.
 
         Ordenação:
             1. Projetos em destaque vêm primeiro
             2. Dentro de cada grupo, ordem alfabética por nome
+            3. Nomes iguais: ordem por id
 
         Example:
             >>> repo = RepositorioJSON()
@@ -48,8 +121,147 @@ class ObterProjetosUseCase:
             >>> projetos[0].destaque
             True
         """
-        projetos = self.repositorio.obter_projetos()
-        return sorted(projetos, key=lambda p: (not p.destaque, p.nome))
+        return list(self._indice(ordenacao).itens)
+
+    def executar_pagina(
+        self,
+        limite: int | None = None,
+        cursor: str | None = None,
+        tecnologias: list[str] | None = None,
+        modo: ModoFiltro = "todas",
+        ordenacao: OrdenacaoProjetos = "destaque",
+    ) -> Pagina[Projeto]:
+        """
+        Executa caso de uso paginado por chave.
+
+        Args:
+            limite: Máximo de projetos na página (None para todos).
+            cursor: Cursor devolvido pela página anterior.
+            tecnologias: Filtra projetos por tecnologia (None sem filtro).
+            modo: "todas" exige todas as tecnologias; "qualquer", ao menos uma.
+            ordenacao: "destaque" (padrão), "nome" ou "tecnologias".
+
+        Returns:
+            Pagina[Projeto]: Projetos da página, total filtrado e próximo cursor.
+
+        Raises:
+            ErroValidacao: Se o cursor é inválido ou de outra ordenação.
+        """
+        indice = self._indice(ordenacao)
+        mascara = None
+        if tecnologias:
+            filtro = indice.derivado("tecnologias", _indexar_tecnologias)
+            mascara = filtro.mascara(tecnologias, modo)
+        return indice.pagina(limite, cursor, mascara)
+
+    def validar_cursor(
+        self, cursor: str | None, ordenacao: OrdenacaoProjetos = "destaque"
+    ) -> None:
+        """
+        Valida o cursor sem montar a página.
+
+        Args:
+            cursor: Cursor devolvido pela página anterior (None é válido).
+            ordenacao: Ordenação da requisição.
+
+        Raises:
+            ErroValidacao: Se o cursor é inválido ou de outra ordenação.
+        """
+        self._indice(ordenacao).posicao_apos(cursor)
+
+
+class ObterProjetosAssincronoUseCase:
+    """
+    Versão assíncrona de ObterProjetosUseCase.
+
+    Attributes:
+        repositorio: Repositório assíncrono de dados do portfólio.
+    """
+
+    def __init__(self, repositorio: RepositorioPortfolioAssincrono):
+        """
+        Inicializa caso de uso.
+
+        Args:
+            repositorio: Implementação de RepositorioPortfolioAssincrono.
+        """
+        self.repositorio = repositorio
+        self._cache = CachePorVersao()
+
+    async def _indice(
+        self, ordenacao: OrdenacaoProjetos = "destaque"
+    ) -> IndiceOrdenado[Projeto]:
+        """Retorna índice da ordenação pedida na versão atual dos dados."""
+        versao = await self.repositorio.versao_dados()
+        base = self._cache.valor(versao, "destaque")
+        if base is None:
+            projetos = await self.repositorio.obter_projetos()
+            base = self._cache.guardar(versao, "destaque", _indexar_projetos(projetos))
+        if ordenacao == "destaque":
+            return base
+        return self._cache.obter(
+            versao, ordenacao, lambda: _indexar_projetos(base.itens, ordenacao)
+        )
+
+    async def executar(
+        self, ordenacao: OrdenacaoProjetos = "destaque"
+    ) -> list[Projeto]:
+        """
+        Executa caso de uso.
+
+        Args:
+            ordenacao: "destaque" (padrão), "nome" ou "tecnologias".
+
+        Returns:
+            list[Projeto]: Lista de projetos na ordenação pedida.
+        """
+        return list((await self._indice(ordenacao)).itens)
+
+    async def executar_pagina(
+        self,
+        limite: int | None = None,
+        cursor: str | None = None,
+        tecnologias: list[str] | None = None,
+        modo: ModoFiltro = "todas",
+        ordenacao: OrdenacaoProjetos = "destaque",
+    ) -> Pagina[Projeto]:
+        """
+        Executa caso de uso paginado por chave.
+
+        Args:
+            limite: Máximo de projetos na página (None para todos).
+            cursor: Cursor devolvido pela página anterior.
+            tecnologias: Filtra projetos por tecnologia (None sem filtro).
+            modo: "todas" exige todas as tecnologias; "qualquer", ao menos uma.
+            ordenacao: "destaque" (padrão), "nome" ou "tecnologias".
+
+        Returns:
+            Pagina[Projeto]: Projetos da página, total filtrado e próximo cursor.
+
+        Raises:
+            ErroValidacao: Se o cursor é inválido ou de outra ordenação.
+        """
+        indice = await self._indice(ordenacao)
+        mascara = None
+        if tecnologias:
+            filtro = indice.derivado("tecnologias", _indexar_tecnologias)
+            mascara = filtro.mascara(tecnologias, modo)
+        return indice.pagina(limite, cursor, mascara)
+
+    async def validar_cursor(
+        self, cursor: str | None, ordenacao: OrdenacaoProjetos = "destaque"
+    ) -> None:
+        """
+        Valida o cursor sem montar a página (antes do If-None-Match).
+
+        Args:
+            cursor: Cursor devolvido pela página anterior (None é válido).
+            ordenacao: Ordenação da requisição.
+
+        Raises:
+            ErroValidacao: Se o cursor é inválido ou de outra ordenação.
+        """
+        (await self._indice(ordenacao)).posicao_apos(cursor)
 
 
 class ObterProjetoPorIdUseCase:
@@ -91,3 +303,33 @@ class ObterProjetoPorIdUseCase:
             'Portfolio API'
         """
         return self.repositorio.obter_projeto_por_id(projeto_id)
+
+
+class ObterProjetoPorIdAssincronoUseCase:
+    """
+    Versão assíncrona de ObterProjetoPorIdUseCase.
+
+    Attributes:
+        repositorio: Repositório assíncrono de dados do portfólio.
+    """
+
+    def __init__(self, repositorio: RepositorioPortfolioAssincrono):
+        """
+        Inicializa caso de uso.
+
+        Args:
+            repositorio: Implementação de RepositorioPortfolioAssincrono.
+        """
+        self.repositorio = repositorio
+
+    async def executar(self, projeto_id: str) -> Projeto | None:
+        """
+        Executa caso de uso.
+
+        Args:
+            projeto_id: ID do projeto a buscar.
+
+        Returns:
+            Projeto | None: Projeto encontrado ou None.
+        """
+        return await self.repositorio.obter_projeto_por_id(projeto_id)
@@ -2,9 +2,11 @@
 Caso de uso: Obter informações da seção Sobre.
 
 Lógica pura, sem dependência de FastAPI.
+Variantes assíncronas usam RepositorioPortfolioAssincrono.
 """
 
 from app.adaptadores.repositorio import RepositorioPortfolio
+from app.adaptadores.repositorio_assincrono import RepositorioPortfolioAssincrono
 
 
 class ObterSobreUseCase:
@@ -43,3 +45,30 @@ class ObterSobreUseCase:
             'Argenis Lopez'
         """
         return self.repositorio.obter_sobre()
+
+
+class ObterSobreAssincronoUseCase:
+    """
+    Versão assíncrona de ObterSobreUseCase.
+
+    Attributes:
+        repositorio: Repositório assíncrono de dados do portfólio.
+    """
+
+    def __init__(self, repositorio: RepositorioPortfolioAssincrono):
+        """
+        Inicializa caso de uso.
+
+        Args:
+            repositorio: Implementação de RepositorioPortfolioAssincrono.
+        """
+        self.repositorio = repositorio
+
+    async def executar(self) -> dict:
+        """
+        Executa caso de uso.
+
+        Returns:
+            dict: Informações pessoais do desenvolvedor.
+        """
+        return await self.repositorio.obter_sobre()
@@ -2,9 +2,52 @@
 Caso de uso: Obter stack tecnológico.
 
 Lógica pura, sem dependência de FastAPI.
+Variantes assíncronas usam RepositorioPortfolioAssincrono.
 """
 
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
 from app.adaptadores.repositorio import RepositorioPortfolio
+from app.adaptadores.repositorio_assincrono import RepositorioPortfolioAssincrono
+from app.core.cache import CachePorVersao
+
+
+@dataclass(frozen=True)
+class StackAgrupado:
+    """
+    Stack agrupado por categoria, calculado uma vez por versão dos dados.
+
+    Attributes:
+        itens: Itens na ordem de agrupamento (categorias na ordem em que
+            aparecem; dentro delas, ordem original).
+        por_categoria: Posições em `itens` de cada categoria.
+    """
+
+    itens: tuple[Mapping, ...]
+    por_categoria: Mapping[str, tuple[int, ...]]
+
+    def como_dict(self) -> dict[str, list[dict]]:
+        """Retorna cópia no formato {"categoria": [item, ...]}."""
+        return {
+            categoria: [dict(self.itens[posicao]) for posicao in posicoes]
+            for categoria, posicoes in self.por_categoria.items()
+        }
+
+
+def _agrupar_por_categoria(stack: list[dict]) -> StackAgrupado:
+    """Agrupa itens do stack por categoria, preservando a ordem original."""
+    por_categoria: dict[str, list[dict]] = {}
+    for item in stack:
+        por_categoria.setdefault(item["categoria"], []).append(item)
+
+    itens: list[Mapping] = []
+    posicoes: dict[str, tuple[int, ...]] = {}
+    for categoria, grupo in por_categoria.items():
+        posicoes[categoria] = tuple(range(len(itens), len(itens) + len(grupo)))
+        itens.extend(MappingProxyType(dict(item)) for item in grupo)
+    return StackAgrupado(tuple(itens), MappingProxyType(posicoes))
 
 
 class ObterStackUseCase:
@@ -13,7 +56,7 @@ class ObterStackUseCase:
 
     Responsabilidade:
         - Buscar tecnologias no repositório
-        - Agrupar por categoria
+        - Agrupar por categoria, uma vez por versão dos dados
         - Retornar dados organizados
 
     Attributes:
@@ -28,6 +71,20 @@ class ObterStackUseCase:
             repositorio: Implementação de RepositorioPortfolio.
         """
         self.repositorio = repositorio
+        self._cache = CachePorVersao()
+
+    def executar_agrupado(self) -> StackAgrupado:
+        """
+        Retorna o agrupamento imutável da versão atual dos dados.
+
+        Returns:
+            StackAgrupado: Itens e posições por categoria.
+        """
+        return self._cache.obter(
+            self.repositorio.versao_dados(),
+            "agrupado",
+            lambda: _agrupar_por_categoria(self.repositorio.obter_stack()),
+        )
 
     def executar(self) -> dict[str, list[dict]]:
         """
@@ -46,14 +103,48 @@ class ObterStackUseCase:
             >>> len(resultado["backend"]) > 0
             True
         """
-        stack = self.repositorio.obter_stack()
-        
-        # Agrupar por categoria
-        por_categoria: dict[str, list[dict]] = {}
-        for item in stack:
-            categoria = item["categoria"]
-            if categoria not in por_categoria:
-                por_categoria[categoria] = []
-            por_categoria[categoria].append(item)
-        
-        return por_categoria
+        return self.executar_agrupado().como_dict()
+
+
+class ObterStackAssincronoUseCase:
+    """
+    Versão assíncrona de ObterStackUseCase.
+
+    Attributes:
+        repositorio: Repositório assíncrono de dados do portfólio.
+    """
+
+    def __init__(self, repositorio: RepositorioPortfolioAssincrono):
+        """
+        Inicializa caso de uso.
+
+        Args:
+            repositorio: Implementação de RepositorioPortfolioAssincrono.
+        """
+        self.repositorio = repositorio
+        self._cache = CachePorVersao()
+
+    async def executar_agrupado(self) -> StackAgrupado:
+        """
+        Retorna o agrupamento imutável da versão atual dos dados.
+
+        Returns:
+            StackAgrupado: Itens e posições por categoria.
+        """
+        versao = await self.repositorio.versao_dados()
+        agrupado = self._cache.valor(versao, "agrupado")
+        if agrupado is None:
+            stack = await self.repositorio.obter_stack()
+            agrupado = self._cache.guardar(
+                versao, "agrupado", _agrupar_por_categoria(stack)
+            )
+        return agrupado
+
+    async def executar(self) -> dict[str, list[dict]]:
+        """
+        Executa caso de uso.
+
+        Returns:
+            dict: Tecnologias agrupadas por categoria.
+        """
+        return (await self.executar_agrupado()).como_dict()
@@ -0,0 +1,216 @@
+"""
+Paginação por chave (keyset) sobre listas pré-ordenadas.
+
+Lógica pura, sem dependência de FastAPI.
+
+O cursor é a chave de ordenação do último item da página, junto com o
+nome da ordenação, codificada em base64url. A próxima página começa no
+primeiro item com chave maior, localizado por busca binária: custo
+O(log N + tamanho da página).
+"""
+
+import base64
+import binascii
+import json
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Callable, Generic, Iterable, TypeVar
+
+from app.core.excecoes import ErroValidacao
+
+T = TypeVar("T")
+D = TypeVar("D")
+
+
+@dataclass(frozen=True)
+class Pagina(Generic[T]):
+    """
+    Uma página de resultados.
+
+    Attributes:
+        itens: Itens da página, na ordem do índice.
+        total: Total de itens do índice (todas as páginas).
+        proximo_cursor: Cursor da página seguinte (None se é a última).
+    """
+
+    itens: tuple[T, ...]
+    total: int
+    proximo_cursor: str | None
+
+
+def codificar_cursor(chave: tuple, ordenacao: str = "") -> str:
+    """
+    Codifica chave de ordenação como cursor opaco.
+
+    Args:
+        chave: Chave de ordenação (valores serializáveis em JSON).
+        ordenacao: Nome da ordenação que gerou a chave.
+
+    Returns:
+        str: Cursor base64url sem padding.
+    """
+    bruto = json.dumps(
+        [ordenacao, list(chave)], ensure_ascii=False, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(bruto.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decodificar_cursor(cursor: str) -> tuple[str, tuple]:
+    """
+    Decodifica cursor gerado por codificar_cursor.
+
+    Args:
+        cursor: Cursor recebido do cliente.
+
+    Returns:
+        tuple[str, tuple]: Nome da ordenação e chave.
+
+    Raises:
+        ErroValidacao: Se o cursor está malformado.
+    """
+    try:
+        bruto = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        conteudo = json.loads(bruto.decode("utf-8"))
+    except (binascii.Error, ValueError, UnicodeDecodeError):
+        raise ErroValidacao("Cursor de paginação inválido", codigo="CURSOR_INVALIDO")
+    if (
+        not isinstance(conteudo, list)
+        or len(conteudo) != 2
+        or not isinstance(conteudo[0], str)
+        or not isinstance(conteudo[1], list)
+    ):
+        raise ErroValidacao("Cursor de paginação inválido", codigo="CURSOR_INVALIDO")
+    return conteudo[0], tuple(conteudo[1])
+
+
+class IndiceOrdenado(Generic[T]):
+    """
+    Itens ordenados uma única vez, com suas chaves, para paginação por chave.
+
+    Attributes:
+        nome: Nome da ordenação (gravado nos cursores).
+        itens: Itens na ordem da chave.
+        chaves: Chave de cada item (mesma posição de itens).
+    """
+
+    def __init__(
+        self,
+        itens: Iterable[T],
+        chave: Callable[[T], tuple],
+        nome: str = "",
+    ):
+        """
+        Ordena itens pela chave.
+
+        Args:
+            itens: Itens a indexar.
+            chave: Função que retorna chave única e ordenável de um item.
+            nome: Nome da ordenação; cursores de outra ordenação são rejeitados.
+        """
+        pares = sorted(((chave(item), item) for item in itens), key=lambda par: par[0])
+        self.nome = nome
+        self.chaves: list[tuple] = [par[0] for par in pares]
+        self.itens: tuple[T, ...] = tuple(par[1] for par in pares)
+        self._derivados: dict[str, object] = {}
+
+    def __len__(self) -> int:
+        return len(self.itens)
+
+    def derivado(self, nome: str, fabrica: Callable[[tuple[T, ...]], D]) -> D:
+        """
+        Estrutura calculada sobre as posições deste índice (ex.: bitsets).
+
+        Fica presa ao índice, então nunca se mistura com posições de
+        outra versão dos dados. Calculada na primeira chamada.
+
+        Args:
+            nome: Identificador da estrutura.
+            fabrica: Recebe os itens ordenados e monta a estrutura.
+        """
+        try:
+            return self._derivados[nome]
+        except KeyError:
+            valor = self._derivados[nome] = fabrica(self.itens)
+            return valor
+
+    def posicao_apos(self, cursor: str | None) -> int:
+        """
+        Retorna a posição do primeiro item depois do cursor.
+
+        Args:
+            cursor: Cursor recebido (None para o início).
+
+        Raises:
+            ErroValidacao: Se o cursor não é compatível com este índice.
+        """
+        if cursor is None:
+            return 0
+        ordenacao, chave = decodificar_cursor(cursor)
+        if ordenacao != self.nome:
+            raise ErroValidacao(
+                "Cursor pertence a outra ordenação", codigo="CURSOR_INVALIDO"
+            )
+        if self.chaves and len(chave) != len(self.chaves[0]):
+            raise ErroValidacao("Cursor de paginação inválido", codigo="CURSOR_INVALIDO")
+        try:
+            return bisect_right(self.chaves, chave)
+        except TypeError:
+            raise ErroValidacao("Cursor de paginação inválido", codigo="CURSOR_INVALIDO")
+
+    def pagina(
+        self,
+        limite: int | None,
+        cursor: str | None,
+        mascara: int | None = None,
+    ) -> Pagina[T]:
+        """
+        Retorna a página que começa logo após o cursor.
+
+        Args:
+            limite: Máximo de itens (None para todos os restantes).
+            cursor: Cursor da página anterior (None para a primeira).
+            mascara: Bitset de posições permitidas (None sem filtro).
+
+        Returns:
+            Pagina: Itens, total e cursor da próxima página.
+        """
+        inicio = self.posicao_apos(cursor)
+        if mascara is not None:
+            return self._pagina_filtrada(limite, inicio, mascara)
+
+        total = len(self.itens)
+        fim = total if limite is None else min(inicio + limite, total)
+        proximo = codificar_cursor(self.chaves[fim - 1], self.nome) if fim < total else None
+        return Pagina(
+            itens=self.itens[inicio:fim],
+            total=total,
+            proximo_cursor=proximo,
+        )
+
+    def _pagina_filtrada(
+        self,
+        limite: int | None,
+        inicio: int,
+        mascara: int,
+    ) -> Pagina[T]:
+        """
+        Página percorrendo apenas os bits ligados da máscara.
+
+        Custo proporcional ao tamanho da página, não ao do índice.
+        """
+        restante = (mascara >> inicio) << inicio
+        posicoes: list[int] = []
+        while restante and (limite is None or len(posicoes) < limite):
+            menor_bit = restante & -restante
+            posicoes.append(menor_bit.bit_length() - 1)
+            restante ^= menor_bit
+
+        proximo = (
+            codificar_cursor(self.chaves[posicoes[-1]], self.nome)
+            if restante and posicoes else None
+        )
+        return Pagina(
+            itens=tuple(self.itens[posicao] for posicao in posicoes),
+            total=mascara.bit_count(),
+            proximo_cursor=proximo,
+        )
@@ -5,6 +5,8 @@ Usa pydantic-settings para validação automática e valores padrão.
 Todas as configurações podem ser sobrescritas via .env ou variáveis de ambiente.
 """
 
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
@@ -19,6 +21,74 @@ class Configuracoes(BaseSettings):
         origens_permitidas: Lista de origens CORS separadas por vírgula.
         formspree_url: URL do endpoint Formspree para envio de emails.
         formspree_form_id: ID do formulário Formspree.
+        formspree_form_id_reserva: Formulário Formspree de reserva; se
+            definido, envios lentos ou com falha no principal vão também
+            para ele (hedge/failover).
+        repositorio_intervalo_verificacao: Intervalo mínimo (segundos) entre
+            verificações de alteração nos arquivos de dados.
+        repositorio_backend: Fonte dos dados ("json", "bundle" ou "sqlite").
+        repositorio_bundle: Caminho do bundle gerado por compilar_dados.
+        repositorio_sqlite: Caminho do banco gerado por importar_sqlite.
+        cache_max_age: max-age (segundos) do Cache-Control das leituras.
+        cache_stale_while_revalidate: Janela (segundos) em que caches podem
+            servir a resposta vencida enquanto revalidam (0 desativa).
+        log_assincrono: Renderiza e escreve logs em thread de fundo, em lotes.
+        log_fila_tamanho: Máximo de eventos de log aguardando escrita.
+        log_fila_politica: Fila cheia: "descartar" (conta e avisa) ou
+            "bloquear" (quem loga espera).
+        log_lote_maximo: Máximo de eventos por escrita.
+        log_amostragem: Fração de requisições bem-sucedidas logadas (0-1).
+        log_amostragem_rotas: Fração por template de rota, em JSON
+            (ex.: {"/saude": 0, "/api/v1/projetos": 0.1}).
+        log_lento_ms: Requisições a partir desta duração são sempre logadas.
+        log_resumo_intervalo: Segundos entre resumos por rota (0 desativa).
+        metricas_habilitadas: Expõe GET /metrics (formato Prometheus).
+        server_timing: Tempo por camada no cabeçalho Server-Timing e no log:
+            "desligado", "cabecalho" (só se a requisição trouxer
+            X-Server-Timing) ou "sempre".
+        perfil_token: Valor do cabeçalho X-Perfil que ativa o perfilador
+            na requisição (vazio desativa).
+        perfil_rotas: Fração de requisições perfiladas por template de
+            rota, em JSON (ex.: {"/api/v1/projetos/{projeto_id}": 0.01}).
+        perfil_diretorio: Diretório dos arquivos .folded (collapsed stacks).
+        perfil_intervalo_ms: Intervalo entre amostras de pilha (ms).
+        email_conexoes_max: Máximo de conexões HTTP abertas com o Formspree.
+        email_keepalive_max: Conexões ociosas mantidas para reuso.
+        email_keepalive_expira: Segundos até fechar uma conexão ociosa.
+        email_timeout_conexao: Timeout (segundos) para estabelecer conexão.
+        email_timeout_leitura: Timeout (segundos) de leitura, escrita e
+            espera por conexão livre no pool.
+        email_http2: Usa HTTP/2 com o Formspree (requer o pacote `h2`).
+        email_disjuntor_janela: Envios considerados pelo disjuntor do email.
+        email_disjuntor_minimo: Envios na janela antes de o disjuntor abrir.
+        email_disjuntor_taxa: Fração de falhas, ou de envios lentos, que
+            abre o disjuntor.
+        email_disjuntor_lento_ms: Envio acima deste tempo conta como lento.
+        email_disjuntor_aberto_segundos: Tempo recusando envios antes de
+            testar o provedor de novo.
+        email_hedge_percentil: Percentil da latência do provedor principal
+            após o qual o envio também vai para o de reserva.
+        email_hedge_atraso_inicial: Atraso de hedge (segundos) enquanto não
+            há latências suficientes para o percentil.
+        email_hedge_atraso_maximo: Teto (segundos) do atraso de hedge.
+        vigia_lento_ms: Requisições em andamento acima deste tempo têm as
+            pilhas do event loop e do threadpool logadas uma vez (0 desativa).
+        contato_trabalhadores: Workers que entregam a caixa de saída de contato.
+        contato_fila_maximo: Capacidade da caixa de saída (cheia → 503).
+        contato_tentativas_maximas: Tentativas de envio antes de descartar.
+        contato_atraso_base: Atraso (segundos) após a primeira falha; dobra
+            a cada nova falha.
+        contato_atraso_maximo: Teto (segundos) do atraso entre tentativas.
+        contato_drenar_timeout: Espera máxima (segundos) no shutdown para
+            entregar as mensagens vencidas (as em backoff não esperam).
+        contato_caixa_saida: Onde a caixa de saída guarda as mensagens
+            ("memoria" ou "sqlite", que sobrevive a crash e redeploy).
+        contato_sqlite: Arquivo SQLite da caixa de saída durável.
+        contato_reserva_segundos: Tempo até uma mensagem reservada por um
+            worker que morreu voltar à fila, contado a partir da vez dela
+            no lote; deve passar do pior tempo de um envio.
+        contato_retencao_dias: Dias de histórico de mensagens enviadas ou
+            descartadas no SQLite (0 guarda para sempre).
     """
 
     model_config = SettingsConfigDict(
@@ -47,6 +117,236 @@ class Configuracoes(BaseSettings):
         default="",
         alias="FORMSPREE_FORM_ID",
     )
+    formspree_form_id_reserva: str = Field(
+        default="",
+        alias="FORMSPREE_FORM_ID_RESERVA",
+    )
+    repositorio_intervalo_verificacao: float = Field(
+        default=1.0,
+        ge=0,
+        alias="REPOSITORIO_INTERVALO_VERIFICACAO",
+    )
+    repositorio_backend: Literal["json", "bundle", "sqlite"] = Field(
+        default="json",
+        alias="REPOSITORIO_BACKEND",
+    )
+    repositorio_bundle: str = Field(
+        default="dados/portfolio.bundle",
+        alias="REPOSITORIO_BUNDLE",
+    )
+    repositorio_sqlite: str = Field(
+        default="dados/portfolio.db",
+        alias="REPOSITORIO_SQLITE",
+    )
+    cache_max_age: int = Field(
+        default=60,
+        ge=0,
+        alias="CACHE_MAX_AGE",
+    )
+    cache_stale_while_revalidate: int = Field(
+        default=300,
+        ge=0,
+        alias="CACHE_STALE_WHILE_REVALIDATE",
+    )
+    log_assincrono: bool = Field(
+        default=True,
+        alias="LOG_ASSINCRONO",
+    )
+    log_fila_tamanho: int = Field(
+        default=10_000,
+        ge=1,
+        alias="LOG_FILA_TAMANHO",
+    )
+    log_fila_politica: Literal["descartar", "bloquear"] = Field(
+        default="descartar",
+        alias="LOG_FILA_POLITICA",
+    )
+    log_lote_maximo: int = Field(
+        default=500,
+        ge=1,
+        alias="LOG_LOTE_MAXIMO",
+    )
+    log_amostragem: float = Field(
+        default=1.0,
+        ge=0,
+        le=1,
+        alias="LOG_AMOSTRAGEM",
+    )
+    log_amostragem_rotas: dict[str, float] = Field(
+        default_factory=dict,
+        alias="LOG_AMOSTRAGEM_ROTAS",
+    )
+    log_lento_ms: float = Field(
+        default=1000.0,
+        gt=0,
+        alias="LOG_LENTO_MS",
+    )
+    log_resumo_intervalo: float = Field(
+        default=60.0,
+        ge=0,
+        alias="LOG_RESUMO_INTERVALO",
+    )
+    metricas_habilitadas: bool = Field(
+        default=True,
+        alias="METRICAS_HABILITADAS",
+    )
+    server_timing: Literal["desligado", "cabecalho", "sempre"] = Field(
+        default="desligado",
+        alias="SERVER_TIMING",
+    )
+    perfil_token: str = Field(
+        default="",
+        alias="PERFIL_TOKEN",
+    )
+    perfil_rotas: dict[str, float] = Field(
+        default_factory=dict,
+        alias="PERFIL_ROTAS",
+    )
+    perfil_diretorio: str = Field(
+        default="perfis",
+        alias="PERFIL_DIRETORIO",
+    )
+    perfil_intervalo_ms: float = Field(
+        default=5.0,
+        gt=0,
+        alias="PERFIL_INTERVALO_MS",
+    )
+    email_conexoes_max: int = Field(
+        default=10,
+        ge=1,
+        alias="EMAIL_CONEXOES_MAX",
+    )
+    email_keepalive_max: int = Field(
+        default=5,
+        ge=0,
+        alias="EMAIL_KEEPALIVE_MAX",
+    )
+    email_keepalive_expira: float = Field(
+        default=30.0,
+        ge=0,
+        alias="EMAIL_KEEPALIVE_EXPIRA",
+    )
+    email_timeout_conexao: float = Field(
+        default=3.0,
+        gt=0,
+        alias="EMAIL_TIMEOUT_CONEXAO",
+    )
+    email_timeout_leitura: float = Field(
+        default=10.0,
+        gt=0,
+        alias="EMAIL_TIMEOUT_LEITURA",
+    )
+    email_http2: bool = Field(
+        default=False,
+        alias="EMAIL_HTTP2",
+    )
+    email_disjuntor_janela: int = Field(
+        default=20,
+        ge=1,
+        alias="EMAIL_DISJUNTOR_JANELA",
+    )
+    email_disjuntor_minimo: int = Field(
+        default=5,
+        ge=1,
+        alias="EMAIL_DISJUNTOR_MINIMO",
+    )
+    email_disjuntor_taxa: float = Field(
+        default=0.5,
+        gt=0,
+        le=1,
+        alias="EMAIL_DISJUNTOR_TAXA",
+    )
+    email_disjuntor_lento_ms: float = Field(
+        default=3000.0,
+        gt=0,
+        alias="EMAIL_DISJUNTOR_LENTO_MS",
+    )
+    email_disjuntor_aberto_segundos: float = Field(
+        default=30.0,
+        gt=0,
+        alias="EMAIL_DISJUNTOR_ABERTO_SEGUNDOS",
+    )
+    email_hedge_percentil: float = Field(
+        default=95.0,
+        gt=0,
+        le=100,
+        alias="EMAIL_HEDGE_PERCENTIL",
+    )
+    email_hedge_atraso_inicial: float = Field(
+        default=2.0,
+        gt=0,
+        alias="EMAIL_HEDGE_ATRASO_INICIAL",
+    )
+    email_hedge_atraso_maximo: float = Field(
+        default=5.0,
+        gt=0,
+        alias="EMAIL_HEDGE_ATRASO_MAXIMO",
+    )
+    vigia_lento_ms: float = Field(
+        default=5000.0,
+        ge=0,
+        alias="VIGIA_LENTO_MS",
+    )
+    contato_trabalhadores: int = Field(
+        default=2,
+        ge=1,
+        alias="CONTATO_TRABALHADORES",
+    )
+    contato_fila_maximo: int = Field(
+        default=1000,
+        ge=1,
+        alias="CONTATO_FILA_MAXIMO",
+    )
+    contato_tentativas_maximas: int = Field(
+        default=5,
+        ge=1,
+        alias="CONTATO_TENTATIVAS_MAXIMAS",
+    )
+    contato_atraso_base: float = Field(
+        default=2.0,
+        ge=0,
+        alias="CONTATO_ATRASO_BASE",
+    )
+    contato_atraso_maximo: float = Field(
+        default=300.0,
+        ge=0,
+        alias="CONTATO_ATRASO_MAXIMO",
+    )
+    contato_drenar_timeout: float = Field(
+        default=10.0,
+        ge=0,
+        alias="CONTATO_DRENAR_TIMEOUT",
+    )
+    contato_caixa_saida: Literal["memoria", "sqlite"] = Field(
+        default="memoria",
+        alias="CONTATO_CAIXA_SAIDA",
+    )
+    contato_sqlite: str = Field(
+        default="dados/contato.db",
+        alias="CONTATO_SQLITE",
+    )
+    contato_reserva_segundos: float = Field(
+        default=60.0,
+        gt=0,
+        alias="CONTATO_RESERVA_SEGUNDOS",
+    )
+    contato_retencao_dias: float = Field(
+        default=30.0,
+        ge=0,
+        alias="CONTATO_RETENCAO_DIAS",
+    )
+
+    def valor_cache_control(self) -> str:
+        """
+        Monta o cabeçalho Cache-Control das rotas de leitura.
+
+        Returns:
+            Ex.: "public, max-age=60, stale-while-revalidate=300".
+        """
+        valor = f"public, max-age={self.cache_max_age}"
+        if self.cache_stale_while_revalidate:
+            valor += f", stale-while-revalidate={self.cache_stale_while_revalidate}"
+        return valor
 
     def lista_origens_permitidas(self) -> list[str]:
         """
@@ -11,7 +11,23 @@ NÃO deve conter lógica de negócio.
 """
 
 from app.controladores.saude import roteador as roteador_saude
-from app.controladores.api import roteador as roteador_api
-from app.controladores.contato import roteador as roteador_contato
+from app.controladores.api import (
+    roteador as roteador_api,
+    encerrar as encerrar_api,
+)
+from app.controladores.contato import (
+    roteador as roteador_contato,
+    iniciar as iniciar_contato,
+    encerrar as encerrar_contato,
+)
+from app.controladores.metricas import roteador as roteador_metricas
 
-__all__ = ["roteador_saude", "roteador_api", "roteador_contato"]
\ No newline at end of file
+__all__ = [
+    "roteador_saude",
+    "roteador_api",
+    "roteador_contato",
+    "roteador_metricas",
+    "iniciar_contato",
+    "encerrar_contato",
+    "encerrar_api",
+]
\ No newline at end of file
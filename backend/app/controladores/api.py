@@ -4,50 +4,413 @@ Controlador de rotas da API.
 Endpoints:
 - GET /api/sobre
 - GET /api/projetos
+- GET /api/projetos/busca
 - GET /api/projetos/{projeto_id}
 - GET /api/stack
 - GET /api/experiencias
 """
 
-from fastapi import APIRouter
+from hashlib import blake2b
+from typing import Awaitable, Callable, Literal, TypeVar
+
+import anyio.to_thread
+from fastapi import APIRouter, Query, Request, Response
+from pydantic import BaseModel
 
 from app.esquemas.sobre import RespostaSobre
-from app.esquemas.projetos import ProjetoResumo, ProjetoDetalhado, RespostaProjetos
-from app.esquemas.stack import ItemStack, RespostaStack
+from app.esquemas.projetos import (
+    ProjetoResumo,
+    ProjetoDetalhado,
+    RespostaProjetos,
+    ProjetoEncontrado,
+    RespostaBuscaProjetos,
+)
+from app.esquemas.stack import ItemStack, RespostaStack, RespostaStackCompacta
 from app.esquemas.experiencias import Experiencia, RespostaExperiencias
 from app.casos_uso import (
-    ObterSobreUseCase,
-    ObterProjetosUseCase,
-    ObterProjetoPorIdUseCase,
-    ObterStackUseCase,
-    ObterExperienciasUseCase,
+    ModoFiltro,
+    OrdenacaoProjetos,
+    OrdenacaoExperiencias,
+    ObterSobreAssincronoUseCase,
+    ObterProjetosAssincronoUseCase,
+    ObterStackAssincronoUseCase,
+    ObterExperienciasAssincronoUseCase,
+    BuscarProjetosAssincronoUseCase,
+)
+from app.adaptadores import (
+    RepositorioPortfolio,
+    RepositorioJSON,
+    RepositorioBundle,
+    RepositorioSQLite,
+    RepositorioAssincrono,
 )
-from app.adaptadores import RepositorioJSON
+from app.adaptadores.repositorio import indexar_projetos
+from app.entidades.projeto import Projeto
+from app.entidades.experiencia import ExperienciaProfissional
+from app.controladores.compressao import (
+    CODIFICADORES_FIXOS,
+    CacheVariantes,
+    negociar_codificacao,
+)
+from app.controladores.respostas import (
+    calcular_etag,
+    etag_corresponde,
+    montar_lista,
+    resposta_json,
+    resposta_nao_modificada,
+    serializar,
+)
+from app.core.cache import CachePorVersao
+from app.core.metricas import CACHE_RESPOSTAS, MetricaFuncao, registro
+from app.core.tempos import medir
 from app.core.excecoes import ErroRecursoNaoEncontrado
+from app.configuracao import configuracoes
+
+
+def _criar_repositorio() -> RepositorioPortfolio:
+    """
+    Cria o repositório conforme REPOSITORIO_BACKEND.
+
+    Returns:
+        RepositorioPortfolio: RepositorioJSON (padrão), RepositorioBundle
+        ou RepositorioSQLite.
+    """
+    intervalo = configuracoes.repositorio_intervalo_verificacao
+    if configuracoes.repositorio_backend == "sqlite":
+        return RepositorioSQLite(configuracoes.repositorio_sqlite)
+    if configuracoes.repositorio_backend == "bundle":
+        return RepositorioBundle(
+            configuracoes.repositorio_bundle,
+            intervalo_verificacao=intervalo,
+        )
+    return RepositorioJSON(intervalo_verificacao=intervalo)
+
 
 # Dependency injection manual
-_repositorio = RepositorioJSON()
-_obter_sobre_uc = ObterSobreUseCase(_repositorio)
-_obter_projetos_uc = ObterProjetosUseCase(_repositorio)
-_obter_projeto_por_id_uc = ObterProjetoPorIdUseCase(_repositorio)
-_obter_stack_uc = ObterStackUseCase(_repositorio)
-_obter_experiencias_uc = ObterExperienciasUseCase(_repositorio)
+# Handlers são async: dados em memória são servidos no event loop e
+# só a recarga de arquivos vai para thread (via RepositorioAssincrono).
+_repositorio = RepositorioAssincrono(_criar_repositorio())
+_obter_sobre_uc = ObterSobreAssincronoUseCase(_repositorio)
+_obter_projetos_uc = ObterProjetosAssincronoUseCase(_repositorio)
+_obter_stack_uc = ObterStackAssincronoUseCase(_repositorio)
+_obter_experiencias_uc = ObterExperienciasAssincronoUseCase(_repositorio)
+_buscar_projetos_uc = BuscarProjetosAssincronoUseCase(_repositorio)
+
+# Respostas já serializadas (bytes JSON), descartadas quando os dados mudam
+_respostas = CachePorVersao()
+_cache_control = configuracoes.valor_cache_control()
+
+# Variantes gzip/br/zstd dos corpos montados por requisição (nível
+# rápido); as dos corpos fixos ficam em _respostas (ver _variante_fixa)
+_variantes = CacheVariantes()
+
+
+def _estatisticas_repositorio() -> dict[tuple[str, ...], float]:
+    """Contadores do snapshot em memória (vazio no RepositorioSQLite)."""
+    estatisticas = getattr(_repositorio.repositorio, "estatisticas", None)
+    if estatisticas is None:
+        return {}
+    return {(nome,): valor for nome, valor in estatisticas.como_dict().items()}
+
+
+registro.registrar(MetricaFuncao(
+    "repositorio_cache",
+    "Leituras do snapshot (acertos, falhas) e arquivos recarregados (recargas).",
+    "counter",
+    _estatisticas_repositorio,
+    ["evento"],
+))
+
+T = TypeVar("T")
+E = TypeVar("E")
+
+# Fragmentos por entidade: id(objeto) → (objeto, JSON). Guardar o objeto
+# mantém o id válido e permite conferir a identidade na consulta.
+Fragmentos = dict[int, tuple[E, bytes]]
+
+# Parte dos dados que cada resposta mostra (cada uma tem sua impressão)
+Parte = Literal["sobre", "projetos", "stack", "experiencias"]
+
+
+async def _por_versao(chave: str | tuple, fabrica: Callable[[], Awaitable[T]]) -> T:
+    """
+    Retorna valor derivado da versão atual dos dados, calculando uma vez.
+
+    Args:
+        chave: Identificador do valor no cache de respostas.
+        fabrica: Corrotina que calcula o valor (validação + serialização).
+    """
+    versao = await _repositorio.versao_dados()
+    valor = _respostas.valor(versao, chave)
+    if valor is None:
+        CACHE_RESPOSTAS.incrementar("falha")
+        valor = _respostas.guardar(versao, chave, await fabrica())
+    else:
+        CACHE_RESPOSTAS.incrementar("acerto")
+    return valor
+
+
+def _para_resumo(projeto: Projeto) -> ProjetoResumo:
+    """Converte entidade em ProjetoResumo (valida)."""
+    return ProjetoResumo(
+        id=projeto.id,
+        nome=projeto.nome,
+        descricao_curta=projeto.descricao_curta,
+        tecnologias=projeto.tecnologias,
+        destaque=projeto.destaque,
+    )
+
+
+def _para_detalhado(projeto: Projeto) -> ProjetoDetalhado:
+    """Converte entidade em ProjetoDetalhado (valida)."""
+    return ProjetoDetalhado(
+        id=projeto.id,
+        nome=projeto.nome,
+        descricao_curta=projeto.descricao_curta,
+        descricao_completa=projeto.descricao_completa,
+        tecnologias=projeto.tecnologias,
+        funcionalidades=projeto.funcionalidades,
+        aprendizados=projeto.aprendizados,
+        repositorio=projeto.repositorio,
+        demo=projeto.demo,
+        destaque=projeto.destaque,
+    )
+
+
+def _para_experiencia(experiencia: ExperienciaProfissional) -> Experiencia:
+    """Converte entidade em Experiencia (valida)."""
+    return Experiencia(
+        id=experiencia.id,
+        cargo=experiencia.cargo,
+        empresa=experiencia.empresa,
+        localizacao=experiencia.localizacao,
+        data_inicio=experiencia.data_inicio,
+        data_fim=experiencia.data_fim,
+        descricao=experiencia.descricao,
+        tecnologias=experiencia.tecnologias,
+        atual=experiencia.atual,
+    )
+
+
+def _fragmento(
+    fragmentos: Fragmentos[E], entidade: E, montar: Callable[[E], BaseModel]
+) -> bytes:
+    """
+    JSON pronto da entidade ou, se ela não está nos fragmentos, serializado na hora.
+
+    A busca é pela identidade do objeto, não pelo id de negócio: com IDs
+    repetidos cada ocorrência tem o próprio JSON. Também cobre a página
+    vinda de uma versão mais nova que a dos fragmentos (recarga entre as
+    duas leituras).
+    """
+    entrada = fragmentos.get(id(entidade))
+    if entrada is not None and entrada[0] is entidade:
+        return entrada[1]
+    return serializar(montar(entidade))
+
+
+async def _fragmentos_projetos() -> tuple[Fragmentos[Projeto], dict[str, bytes]]:
+    """
+    JSON de cada projeto: resumo por entidade e detalhe por id.
+
+    Os resumos saem dos mesmos objetos que a listagem pagina, então
+    projetos com ID repetido aparecem cada um com o próprio conteúdo. O
+    detalhe de /projetos/{id} segue a ordem do arquivo: vence a mesma
+    ocorrência que o repositório indexa (indexar_projetos).
+    """
+    with medir("caso_uso"):
+        projetos = await _obter_projetos_uc.executar()
+        por_id, _ = indexar_projetos(tuple(await _repositorio.obter_projetos()))
+    resumos: Fragmentos[Projeto] = {}
+    for projeto in projetos:
+        with medir("modelos"):
+            resumo = _para_resumo(projeto)
+        resumos[id(projeto)] = (projeto, serializar(resumo))
+    detalhes: dict[str, bytes] = {}
+    for projeto_id, projeto in por_id.items():
+        with medir("modelos"):
+            detalhe = _para_detalhado(projeto)
+        detalhes[projeto_id] = serializar(detalhe)
+    return resumos, detalhes
+
+
+async def _fragmentos_experiencias() -> Fragmentos[ExperienciaProfissional]:
+    """JSON de cada experiência, por entidade (IDs repetidos não se misturam)."""
+    with medir("caso_uso"):
+        experiencias = await _obter_experiencias_uc.executar()
+    with medir("modelos"):
+        modelos = [_para_experiencia(e) for e in experiencias]
+    return {
+        id(experiencia): (experiencia, serializar(modelo))
+        for experiencia, modelo in zip(experiencias, modelos)
+    }
+
+
+async def _corpo_sobre() -> bytes:
+    """JSON de RespostaSobre."""
+    with medir("caso_uso"):
+        sobre = await _obter_sobre_uc.executar()
+    with medir("modelos"):
+        resposta = RespostaSobre(**sobre)
+    return serializar(resposta)
+
+
+async def _corpo_stack(formato: str) -> bytes:
+    """JSON de RespostaStack ou RespostaStackCompacta."""
+    with medir("caso_uso"):
+        agrupado = await _obter_stack_uc.executar_agrupado()
+
+    with medir("modelos"):
+        # Cada item é validado uma vez e referenciado nos dois campos
+        itens = [ItemStack(**item) for item in agrupado.itens]
+        por_categoria = {
+            categoria: [itens[posicao] for posicao in posicoes]
+            for categoria, posicoes in agrupado.por_categoria.items()
+        }
+        if formato == "compacto":
+            resposta = RespostaStackCompacta(por_categoria=por_categoria)
+        else:
+            resposta = RespostaStack(stack=itens, por_categoria=por_categoria)
+    return serializar(resposta)
+
+
+async def _impressao(parte: Parte) -> bytes:
+    """
+    Hash dos dados de uma parte do portfólio na versão atual.
+
+    Calculado uma vez por versão a partir das entidades do repositório,
+    sem montar nem comprimir respostas: o ETag de /sobre não depende dos
+    detalhes de projetos. Como é hash do conteúdo, e não o número da
+    versão, o mesmo dado gera o mesmo ETag em qualquer worker.
+
+    Args:
+        parte: Parte dos dados que a resposta mostra.
+    """
+    leituras = {
+        "sobre": _repositorio.obter_sobre,
+        "projetos": _repositorio.obter_projetos,
+        "stack": _repositorio.obter_stack,
+        "experiencias": _repositorio.obter_experiencias,
+    }
+
+    async def calcular() -> bytes:
+        dados = await leituras[parte]()
+        return blake2b(repr(dados).encode(), digest_size=16).digest()
+
+    return await _por_versao(("impressao", parte), calcular)
+
+
+def _parametros(valores: dict[str, object]) -> list[tuple[str, str]]:
+    """Pares (nome, valor) dos parâmetros validados; listas viram um par por item."""
+    pares: list[tuple[str, str]] = []
+    for nome, valor in valores.items():
+        if valor is None:
+            continue
+        itens = valor if isinstance(valor, list) else [valor]
+        pares.extend((nome, str(item)) for item in itens)
+    return pares
+
+
+async def _validar_cache(
+    request: Request, parte: Parte, **parametros: object
+) -> tuple[dict[str, str], Response | None]:
+    """
+    Negocia Content-Encoding, calcula ETag da variante e trata If-None-Match.
+
+    Chamado depois de validar os parâmetros e resolver o recurso (404 e
+    422 vêm antes), mas antes de montar a resposta: se o cliente já tem
+    a versão atual, o 304 sai sem serializar nada. O ETag usa só os
+    parâmetros conhecidos, já com os valores padrão, então parâmetros
+    extras (ex.: `?_=123`) e a ordem da query não criam variantes novas.
+
+    Args:
+        request: Requisição recebida.
+        parte: Parte dos dados mostrada (a impressão digital do ETag).
+        **parametros: Parâmetros validados do endpoint.
+
+    Returns:
+        Cabeçalhos para a resposta e, se aplicável, o 304.
+    """
+    codificacao = negociar_codificacao(request.headers.get("accept-encoding"))
+    impressao = await _impressao(parte)
+    etag = calcular_etag(
+        impressao,
+        request.url.path,
+        _parametros(parametros),
+        codificacao,
+    )
+    cabecalhos = {
+        "ETag": etag,
+        "Cache-Control": _cache_control,
+        "Vary": "Accept-Encoding",
+    }
+    if etag_corresponde(request.headers.get("if-none-match"), etag):
+        return cabecalhos, resposta_nao_modificada(cabecalhos)
+    if codificacao:
+        cabecalhos["Content-Encoding"] = codificacao
+    return cabecalhos, None
+
+
+async def _variante_fixa(chave: str | tuple, codificacao: str, corpo: bytes) -> bytes:
+    """
+    Variante comprimida de um corpo fixo da versão atual dos dados.
+
+    Comprimida no nível máximo uma vez por versão e codificação, só
+    quando pedida e em thread (br 11 e zstd 19 custam milissegundos por
+    corpo), e guardada em _respostas: um catálogo grande não despeja
+    nada nem tem compressão jogada fora.
+    """
+    return await _por_versao(
+        ("variante", chave, codificacao),
+        lambda: anyio.to_thread.run_sync(CODIFICADORES_FIXOS[codificacao], corpo),
+    )
+
+
+async def _responder(
+    corpo: bytes, cabecalhos: dict[str, str], fixa: str | tuple | None = None
+) -> Response:
+    """
+    Resposta 200 com a variante negociada em _validar_cache.
+
+    Args:
+        corpo: JSON sem compressão.
+        cabecalhos: Retornados por _validar_cache.
+        fixa: Chave do corpo fixo na versão dos dados (ex.: "sobre");
+            None para corpo montado por requisição.
+    """
+    codificacao = cabecalhos.get("Content-Encoding")
+    if codificacao:
+        with medir("compressao"):
+            if fixa is None:
+                corpo = _variantes.obter(codificacao, corpo)
+            else:
+                corpo = await _variante_fixa(fixa, codificacao, corpo)
+    return resposta_json(corpo, headers=cabecalhos)
+
 
 roteador = APIRouter(tags=["API"])
 
 
+def encerrar() -> None:
+    """Fecha as conexões do repositório (shutdown)."""
+    _repositorio.repositorio.fechar()
+
+
 @roteador.get(
     "/sobre",
     response_model=RespostaSobre,
     summary="Informações pessoais",
     description="Retorna informações da seção 'Sobre Mim'.",
 )
-def obter_sobre() -> RespostaSobre:
+async def obter_sobre(request: Request) -> Response:
     """
     Obtém informações pessoais do desenvolvedor.
 
+    Args:
+        request: Requisição (para ETag/If-None-Match).
+
     Returns:
-        RespostaSobre: Dados pessoais validados.
+        Response: JSON de RespostaSobre, validado uma vez por versão.
 
     Example:
         GET /api/sobre
@@ -57,50 +420,173 @@ def obter_sobre() -> RespostaSobre:
             ...
         }
     """
-    dados = _obter_sobre_uc.executar()
-    return RespostaSobre(**dados)
+    cabecalhos, nao_modificada = await _validar_cache(request, "sobre")
+    if nao_modificada:
+        return nao_modificada
+
+    corpo = await _por_versao("sobre", _corpo_sobre)
+    return await _responder(corpo, cabecalhos, fixa="sobre")
 
 
 @roteador.get(
     "/projetos",
     response_model=RespostaProjetos,
     summary="Listar projetos",
-    description="Retorna lista de projetos ordenada (destacados primeiro).",
+    description="Retorna lista de projetos ordenada (destacados primeiro). "
+                "Use `limite` e `cursor` para paginar, `tecnologia` "
+                "(repetível) para filtrar e `ordenacao` para reordenar.",
 )
-def listar_projetos() -> RespostaProjetos:
+async def listar_projetos(
+    request: Request,
+    limite: int | None = Query(
+        default=None,
+        ge=1,
+        le=100,
+        description="Máximo de projetos por página (omitido: todos)",
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description="Valor de `proximo_cursor` da página anterior",
+    ),
+    tecnologia: list[str] = Query(
+        default=[],
+        description="Filtra por tecnologia (repita para várias)",
+    ),
+    modo_tecnologia: ModoFiltro = Query(
+        default="todas",
+        description="`todas` exige todas as tecnologias; `qualquer`, ao menos uma",
+    ),
+    ordenacao: OrdenacaoProjetos = Query(
+        default="destaque",
+        description="`destaque`, `nome` ou `tecnologias` (mais tecnologias primeiro)",
+    ),
+) -> Response:
     """
-    Lista todos os projetos do portfólio.
+    Lista projetos do portfólio, opcionalmente paginados.
+
+    Args:
+        request: Requisição (para ETag/If-None-Match).
+        limite: Tamanho da página (None retorna todos os restantes).
+        cursor: Cursor opaco devolvido pela página anterior.
+        tecnologia: Tecnologias exigidas (vazio sem filtro).
+        modo_tecnologia: Combinação das tecnologias ("todas" ou "qualquer").
+        ordenacao: Ordenação da lista; o cursor só vale para a mesma ordenação.
 
     Returns:
-        RespostaProjetos: Lista de projetos resumidos.
+        Response: JSON de RespostaProjetos montado com fragmentos prontos.
+
+    Raises:
+        ErroValidacao: Se o cursor é inválido.
 
     Ordenação:
         Projetos em destaque aparecem primeiro, depois ordem alfabética.
 
     Example:
-        GET /api/projetos
+        GET /api/projetos?limite=2
         → {
             "projetos": [...],
-            "total": 3
+            "total": 3,
+            "proximo_cursor": "WyJmYWxzZSIs..."
         }
     """
-    projetos = _obter_projetos_uc.executar()
-    
-    projetos_resumo = [
-        ProjetoResumo(
-            id=p.id,
-            nome=p.nome,
-            descricao_curta=p.descricao_curta,
-            tecnologias=p.tecnologias,
-            destaque=p.destaque,
+    with medir("caso_uso"):
+        await _obter_projetos_uc.validar_cursor(cursor, ordenacao)
+    cabecalhos, nao_modificada = await _validar_cache(
+        request,
+        "projetos",
+        limite=limite,
+        cursor=cursor,
+        tecnologia=tecnologia,
+        modo_tecnologia=modo_tecnologia,
+        ordenacao=ordenacao,
+    )
+    if nao_modificada:
+        return nao_modificada
+
+    with medir("caso_uso"):
+        pagina = await _obter_projetos_uc.executar_pagina(
+            limite, cursor, tecnologia, modo_tecnologia, ordenacao
         )
-        for p in projetos
-    ]
     
-    return RespostaProjetos(
-        projetos=projetos_resumo,
-        total=len(projetos_resumo),
+    resumos, _ = await _por_versao("projetos", _fragmentos_projetos)
+
+    return await _responder(montar_lista(
+        "projetos",
+        (_fragmento(resumos, p, _para_resumo) for p in pagina.itens),
+        total=pagina.total,
+        proximo_cursor=pagina.proximo_cursor,
+    ), cabecalhos)
+
+
+@roteador.get(
+    "/projetos/busca",
+    response_model=RespostaBuscaProjetos,
+    summary="Buscar projetos",
+    description="Busca textual em nome, descrições, funcionalidades e "
+                "aprendizados. Ignora acentos e caixa; ordena por relevância.",
+)
+async def buscar_projetos(
+    request: Request,
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=200,
+        description="Texto a buscar",
+    ),
+    limite: int = Query(
+        default=20,
+        ge=1,
+        le=100,
+        description="Máximo de resultados",
+    ),
+) -> Response:
+    """
+    Busca projetos por texto livre.
+
+    Args:
+        request: Requisição (para ETag/If-None-Match).
+        q: Texto buscado.
+        limite: Máximo de resultados.
+
+    Returns:
+        Response: JSON de RespostaBuscaProjetos (ordenado por relevância).
+
+    Example:
+        GET /api/projetos/busca?q=validacao
+        → {
+            "consulta": "validacao",
+            "resultados": [{"id": "portfolio-api", ..., "pontuacao": 0.71}],
+            "total": 1
+        }
+    """
+    cabecalhos, nao_modificada = await _validar_cache(
+        request, "projetos", q=q, limite=limite
     )
+    if nao_modificada:
+        return nao_modificada
+
+    with medir("caso_uso"):
+        resultados = await _buscar_projetos_uc.executar(q, limite)
+
+    with medir("modelos"):
+        encontrados = [
+            ProjetoEncontrado(
+                id=r.projeto.id,
+                nome=r.projeto.nome,
+                descricao_curta=r.projeto.descricao_curta,
+                tecnologias=r.projeto.tecnologias,
+                destaque=r.projeto.destaque,
+                pontuacao=r.pontuacao,
+            )
+            for r in resultados
+        ]
+
+        resposta = RespostaBuscaProjetos(
+            consulta=q,
+            resultados=encontrados,
+            total=len(encontrados),
+        )
+    return await _responder(serializar(resposta), cabecalhos)
 
 
 @roteador.get(
@@ -143,15 +629,16 @@ def listar_projetos() -> RespostaProjetos:
         },
     },
 )
-def obter_projeto(projeto_id: str) -> ProjetoDetalhado:
+async def obter_projeto(projeto_id: str, request: Request) -> Response:
     """
     Obtém detalhes completos de um projeto.
 
     Args:
         projeto_id: ID do projeto a buscar.
+        request: Requisição (para ETag/If-None-Match).
 
     Returns:
-        ProjetoDetalhado: Informações completas do projeto.
+        Response: JSON de ProjetoDetalhado, pré-serializado por versão.
 
     Raises:
         ErroRecursoNaoEncontrado: Se projeto não existe.
@@ -164,40 +651,48 @@ def obter_projeto(projeto_id: str) -> ProjetoDetalhado:
             ...
         }
     """
-    projeto = _obter_projeto_por_id_uc.executar(projeto_id)
-    
-    if not projeto:
+    _, detalhes = await _por_versao("projetos", _fragmentos_projetos)
+    corpo = detalhes.get(projeto_id)
+
+    if corpo is None:
         raise ErroRecursoNaoEncontrado(
             mensagem=f"Projeto '{projeto_id}' não encontrado",
             codigo="PROJETO_NAO_ENCONTRADO",
         )
-    
-    return ProjetoDetalhado(
-        id=projeto.id,
-        nome=projeto.nome,
-        descricao_curta=projeto.descricao_curta,
-        descricao_completa=projeto.descricao_completa,
-        tecnologias=projeto.tecnologias,
-        funcionalidades=projeto.funcionalidades,
-        aprendizados=projeto.aprendizados,
-        repositorio=projeto.repositorio,
-        demo=projeto.demo,
-        destaque=projeto.destaque,
-    )
+
+    cabecalhos, nao_modificada = await _validar_cache(request, "projetos")
+    if nao_modificada:
+        return nao_modificada
+
+    return await _responder(corpo, cabecalhos, fixa=("projeto", projeto_id))
 
 
 @roteador.get(
     "/stack",
-    response_model=RespostaStack,
+    response_model=RespostaStack | RespostaStackCompacta,
     summary="Stack tecnológico",
-    description="Retorna tecnologias organizadas por categoria.",
+    description="Retorna tecnologias organizadas por categoria. "
+                "`formato=compacto` omite a lista plana (cerca de metade "
+                "do tamanho).",
 )
-def obter_stack() -> RespostaStack:
+async def obter_stack(
+    request: Request,
+    formato: Literal["completo", "compacto"] = Query(
+        default="completo",
+        description="`completo` (lista e grupos) ou `compacto` (só grupos)",
+    ),
+) -> Response:
     """
     Obtém stack tecnológico organizado.
 
+    A resposta serializada é guardada por versão dos dados e formato.
+
+    Args:
+        request: Requisição (para ETag/If-None-Match).
+        formato: "completo" (padrão) ou "compacto".
+
     Returns:
-        RespostaStack: Tecnologias agrupadas por categoria.
+        Response: JSON de RespostaStack ou RespostaStackCompacta.
 
     Example:
         GET /api/stack
@@ -209,35 +704,49 @@ def obter_stack() -> RespostaStack:
             }
         }
     """
-    por_categoria = _obter_stack_uc.executar()
-    
-    # Converter para ItemStack
-    stack_completo = []
-    por_categoria_validado: dict[str, list[ItemStack]] = {}
-    
-    for categoria, itens in por_categoria.items():
-        itens_validados = [ItemStack(**item) for item in itens]
-        por_categoria_validado[categoria] = itens_validados
-        stack_completo.extend(itens_validados)
-    
-    return RespostaStack(
-        stack=stack_completo,
-        por_categoria=por_categoria_validado,
-    )
+    cabecalhos, nao_modificada = await _validar_cache(request, "stack", formato=formato)
+    if nao_modificada:
+        return nao_modificada
+
+    corpo = await _por_versao(("stack", formato), lambda: _corpo_stack(formato))
+    return await _responder(corpo, cabecalhos, fixa=("stack", formato))
 
 
 @roteador.get(
     "/experiencias",
     response_model=RespostaExperiencias,
     summary="Experiências profissionais",
-    description="Retorna lista de experiências ordenadas cronologicamente.",
+    description="Retorna lista de experiências ordenadas cronologicamente. "
+                "Use `tecnologia` (repetível) para filtrar e `ordenacao` "
+                "para reordenar.",
 )
-def listar_experiencias() -> RespostaExperiencias:
+async def listar_experiencias(
+    request: Request,
+    tecnologia: list[str] = Query(
+        default=[],
+        description="Filtra por tecnologia (repita para várias)",
+    ),
+    modo_tecnologia: ModoFiltro = Query(
+        default="todas",
+        description="`todas` exige todas as tecnologias; `qualquer`, ao menos uma",
+    ),
+    ordenacao: OrdenacaoExperiencias = Query(
+        default="cronologica",
+        description="`cronologica`, `data_inicio` (mais antigas primeiro) "
+                    "ou `tecnologias`",
+    ),
+) -> Response:
     """
     Lista experiências profissionais.
 
+    Args:
+        request: Requisição (para ETag/If-None-Match).
+        tecnologia: Tecnologias exigidas (vazio sem filtro).
+        modo_tecnologia: Combinação das tecnologias ("todas" ou "qualquer").
+        ordenacao: Ordenação da lista.
+
     Returns:
-        RespostaExperiencias: Lista ordenada de experiências.
+        Response: JSON de RespostaExperiencias montado com fragmentos prontos.
 
     Ordenação:
         Experiência atual primeiro, depois por data (mais recente primeiro).
@@ -249,24 +758,25 @@ def listar_experiencias() -> RespostaExperiencias:
             "total": 2
         }
     """
-    experiencias = _obter_experiencias_uc.executar()
-    
-    experiencias_schema = [
-        Experiencia(
-            id=e.id,
-            cargo=e.cargo,
-            empresa=e.empresa,
-            localizacao=e.localizacao,
-            data_inicio=e.data_inicio,
-            data_fim=e.data_fim,
-            descricao=e.descricao,
-            tecnologias=e.tecnologias,
-            atual=e.atual,
+    cabecalhos, nao_modificada = await _validar_cache(
+        request,
+        "experiencias",
+        tecnologia=tecnologia,
+        modo_tecnologia=modo_tecnologia,
+        ordenacao=ordenacao,
+    )
+    if nao_modificada:
+        return nao_modificada
+
+    with medir("caso_uso"):
+        experiencias = await _obter_experiencias_uc.executar(
+            tecnologia, modo_tecnologia, ordenacao
         )
-        for e in experiencias
-    ]
     
-    return RespostaExperiencias(
-        experiencias=experiencias_schema,
-        total=len(experiencias_schema),
-    )
+    fragmentos = await _por_versao("experiencias", _fragmentos_experiencias)
+
+    return await _responder(montar_lista(
+        "experiencias",
+        (_fragmento(fragmentos, e, _para_experiencia) for e in experiencias),
+        total=len(experiencias),
+    ), cabecalhos)
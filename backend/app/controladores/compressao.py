@@ -0,0 +1,158 @@
+"""
+Variantes comprimidas das respostas pré-serializadas.
+
+Corpos fixos (sobre, stack, detalhe de projeto) usam CODIFICADORES_FIXOS,
+no nível máximo: o controlador comprime cada um na primeira vez que uma
+codificação é pedida, em thread, e guarda a variante junto das respostas
+da versão dos dados (sai na troca de versão, não por limite de tamanho).
+
+Corpos montados por requisição (listas, páginas, busca) usam
+CODIFICADORES, em nível rápido, e ficam em CacheVariantes: um LRU pelo
+hash dos próprios bytes, então a mesma resposta pedida por outro prefixo
+(/api e /api/v1) reaproveita a variante pronta.
+
+gzip vem da biblioteca padrão; brotli e zstd (pacotes `brotli` e
+`zstandard`, em requirements.txt) são usados quando instalados.
+"""
+
+import gzip
+from collections import OrderedDict
+from functools import partial
+from hashlib import blake2b
+from typing import Callable, Sequence
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dependência opcional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - dependência opcional
+    zstandard = None
+
+
+# Nível por codificação: (corpo fixo, corpo montado por requisição)
+NIVEIS = {"br": (11, 5), "zstd": (19, 3), "gzip": (9, 6)}
+
+
+def _codificadores(fixo: bool) -> dict[str, Callable[[bytes], bytes]]:
+    """Codificadores disponíveis, na ordem de preferência do servidor."""
+    indice = 0 if fixo else 1
+    codificadores: dict[str, Callable[[bytes], bytes]] = {}
+    if brotli is not None:
+        codificadores["br"] = partial(brotli.compress, quality=NIVEIS["br"][indice])
+    if zstandard is not None:
+        nivel_zstd = NIVEIS["zstd"][indice]
+        # Um compressor por chamada: ZstdCompressor não pode ser usado por
+        # duas threads ao mesmo tempo (os fixos são comprimidos em thread)
+        codificadores["zstd"] = lambda corpo: zstandard.ZstdCompressor(
+            level=nivel_zstd
+        ).compress(corpo)
+    # mtime fixo: mesma entrada, mesmos bytes (o ETag da variante é forte)
+    codificadores["gzip"] = partial(
+        gzip.compress, compresslevel=NIVEIS["gzip"][indice], mtime=0
+    )
+    return codificadores
+
+
+CODIFICADORES = _codificadores(fixo=False)
+CODIFICADORES_FIXOS = _codificadores(fixo=True)
+
+
+def negociar_codificacao(
+    accept_encoding: str | None,
+    disponiveis: Sequence[str] = tuple(CODIFICADORES),
+) -> str | None:
+    """
+    Escolhe a codificação pelo Accept-Encoding (RFC 9110, seção 12.5.3).
+
+    Vence o maior q-value; empates ficam com a ordem de `disponiveis`.
+    `*` vale para codificações não citadas e q=0 exclui.
+
+    Args:
+        accept_encoding: Valor do cabeçalho (None se ausente).
+        disponiveis: Codificações suportadas, em ordem de preferência.
+
+    Returns:
+        str | None: Codificação escolhida ou None para identity.
+
+    Example:
+        >>> negociar_codificacao("gzip;q=0.5, br", ["br", "gzip"])
+        'br'
+    """
+    if not accept_encoding:
+        return None
+
+    pesos: dict[str, float] = {}
+    for parte in accept_encoding.split(","):
+        nome, _, parametros = parte.partition(";")
+        nome = nome.strip().lower()
+        if not nome:
+            continue
+        peso = 1.0
+        for parametro in parametros.split(";"):
+            chave, _, valor = parametro.partition("=")
+            if chave.strip().lower() == "q":
+                try:
+                    peso = float(valor)
+                except ValueError:
+                    peso = 0.0
+        pesos[nome] = peso
+
+    coringa = pesos.get("*", 0.0)
+    escolhida, maior_peso = None, 0.0
+    for codificacao in disponiveis:
+        peso = pesos.get(codificacao, coringa)
+        if peso > maior_peso:
+            escolhida, maior_peso = codificacao, peso
+    return escolhida
+
+
+class CacheVariantes:
+    """
+    Corpos comprimidos por hash do corpo e codificação, com descarte LRU.
+
+    Para corpos montados por requisição: corpos de versões antigas dos
+    dados deixam de ser pedidos e saem pelo limite de tamanho.
+
+    Attributes:
+        maximo: Quantidade máxima de variantes guardadas.
+        codificadores: Codificação → função de compressão (define o nível).
+    """
+
+    def __init__(
+        self,
+        maximo: int = 512,
+        codificadores: dict[str, Callable[[bytes], bytes]] = CODIFICADORES,
+    ):
+        """
+        Inicializa cache vazio.
+
+        Args:
+            maximo: Quantidade máxima de variantes guardadas.
+            codificadores: Funções de compressão (padrão: nível rápido).
+        """
+        self.maximo = maximo
+        self.codificadores = codificadores
+        self._variantes: OrderedDict[tuple[bytes, str], bytes] = OrderedDict()
+
+    def obter(self, codificacao: str, corpo: bytes) -> bytes:
+        """
+        Retorna corpo comprimido, comprimindo só na primeira vez.
+
+        Args:
+            codificacao: Chave de `codificadores`.
+            corpo: Corpo sem compressão.
+        """
+        chave = (blake2b(corpo, digest_size=16).digest(), codificacao)
+        comprimido = self._variantes.get(chave)
+        if comprimido is not None:
+            self._variantes.move_to_end(chave)
+            return comprimido
+
+        comprimido = self.codificadores[codificacao](corpo)
+        self._variantes[chave] = comprimido
+        if len(self._variantes) > self.maximo:
+            self._variantes.popitem(last=False)
+        return comprimido
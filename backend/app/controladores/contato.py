@@ -3,47 +3,198 @@ Controlador de contato.
 
 Endpoint:
 - POST /api/contato
+
+A mensagem é gravada na caixa de saída e o endpoint responde 202 na
+hora; workers em segundo plano fazem o envio ao Formspree (com
+formulário de reserva opcional) com novas tentativas.
 """
 
-from fastapi import APIRouter, HTTPException
+import httpx
+from fastapi import APIRouter
 
 from app.esquemas.contato import RequisicaoContato, RespostaContato
-from app.casos_uso import EnviarContatoUseCase
-from app.adaptadores import FormspreeEmailAdaptador, LoggerEstruturado
+from app.casos_uso import EnviarContatoUseCase, EntregarContatoUseCase
+from app.adaptadores import (
+    CaixaSaida,
+    CaixaSaidaMemoria,
+    CaixaSaidaSQLite,
+    DisjuntorEmailAdaptador,
+    EmailAdaptador,
+    FormspreeEmailAdaptador,
+    LoggerEstruturado,
+    MultiProvedorEmailAdaptador,
+)
+from app.core.disjuntor import Disjuntor, registrar_disjuntor
+from app.core.metricas import MetricaFuncao, registro
 from app.configuracao import configuracoes
 
+
+def _criar_caixa_saida() -> CaixaSaida:
+    """
+    Cria a caixa de saída conforme CONTATO_CAIXA_SAIDA.
+
+    Returns:
+        CaixaSaida: CaixaSaidaMemoria (padrão) ou CaixaSaidaSQLite.
+    """
+    if configuracoes.contato_caixa_saida == "sqlite":
+        return CaixaSaidaSQLite(
+            configuracoes.contato_sqlite,
+            maximo=configuracoes.contato_fila_maximo,
+            reserva=configuracoes.contato_reserva_segundos,
+            retencao=configuracoes.contato_retencao_dias * 86400,
+        )
+    return CaixaSaidaMemoria(configuracoes.contato_fila_maximo)
+
+
+def _criar_provedores() -> list[FormspreeEmailAdaptador]:
+    """
+    Cria os adaptadores Formspree (principal e, se configurado, reserva).
+
+    Returns:
+        list[FormspreeEmailAdaptador]: Em ordem de preferência.
+    """
+    formularios = [("formspree", configuracoes.formspree_form_id)]
+    if configuracoes.formspree_form_id_reserva:
+        formularios.append(
+            ("formspree_reserva", configuracoes.formspree_form_id_reserva)
+        )
+    return [
+        FormspreeEmailAdaptador(
+            configuracoes.formspree_url,
+            form_id,
+            limites=httpx.Limits(
+                max_connections=configuracoes.email_conexoes_max,
+                max_keepalive_connections=configuracoes.email_keepalive_max,
+                keepalive_expiry=configuracoes.email_keepalive_expira,
+            ),
+            timeout=httpx.Timeout(
+                configuracoes.email_timeout_leitura,
+                connect=configuracoes.email_timeout_conexao,
+            ),
+            http2=configuracoes.email_http2,
+            nome=nome,
+        )
+        for nome, form_id in formularios
+    ]
+
+
+def _criar_email_adaptador(provedores: list[FormspreeEmailAdaptador]) -> EmailAdaptador:
+    """
+    Protege cada provedor com um disjuntor e, havendo mais de um, compõe
+    com hedge.
+
+    Com um provedor fora, envios falham na hora e as mensagens esperam na
+    caixa de saída até o disjuntor testar o provedor de novo.
+
+    Args:
+        provedores: Adaptadores em ordem de preferência.
+
+    Returns:
+        EmailAdaptador: DisjuntorEmailAdaptador ou MultiProvedorEmailAdaptador.
+    """
+    protegidos = [
+        DisjuntorEmailAdaptador(
+            provedor,
+            registrar_disjuntor(Disjuntor(
+                provedor.nome,
+                janela=configuracoes.email_disjuntor_janela,
+                minimo=configuracoes.email_disjuntor_minimo,
+                taxa=configuracoes.email_disjuntor_taxa,
+                lento=configuracoes.email_disjuntor_lento_ms / 1000,
+                tempo_aberto=configuracoes.email_disjuntor_aberto_segundos,
+            )),
+        )
+        for provedor in provedores
+    ]
+    if len(protegidos) == 1:
+        return protegidos[0]
+    return MultiProvedorEmailAdaptador(
+        protegidos,
+        percentil=configuracoes.email_hedge_percentil,
+        atraso_inicial=configuracoes.email_hedge_atraso_inicial,
+        atraso_maximo=configuracoes.email_hedge_atraso_maximo,
+    )
+
+
 # Dependency injection manual
-_email_adaptador = FormspreeEmailAdaptador(
-    configuracoes.formspree_url,
-    configuracoes.formspree_form_id,
-)
+_provedores = _criar_provedores()
+_email_adaptador = _criar_email_adaptador(_provedores)
 _logger = LoggerEstruturado()
-_enviar_contato_uc = EnviarContatoUseCase(_email_adaptador, _logger)
+_caixa_saida = _criar_caixa_saida()
+_entregar_contato_uc = EntregarContatoUseCase(
+    _caixa_saida,
+    _email_adaptador,
+    _logger,
+    tentativas_maximas=configuracoes.contato_tentativas_maximas,
+    atraso_base=configuracoes.contato_atraso_base,
+    atraso_maximo=configuracoes.contato_atraso_maximo,
+)
+_enviar_contato_uc = EnviarContatoUseCase(_caixa_saida, _logger)
+
+registro.registrar(MetricaFuncao(
+    "contato_fila_profundidade",
+    "Mensagens de contato pendentes ou em entrega.",
+    "gauge",
+    lambda: {(): _caixa_saida.profundidade()},
+))
+registro.registrar(MetricaFuncao(
+    "contato_fila_idade_segundos",
+    "Idade da mensagem de contato mais antiga ainda não entregue.",
+    "gauge",
+    lambda: {(): _caixa_saida.idade_mais_antiga()},
+))
 
 roteador = APIRouter(tags=["Contato"])
 
 
+async def iniciar() -> None:
+    """
+    Abre o cliente HTTP do envio de email e sobe os workers (startup).
+
+    Mensagens que ficaram na caixa de saída durável (crash, redeploy)
+    são entregues pelos mesmos workers.
+    """
+    pendentes = await _caixa_saida.recuperar()
+    if pendentes:
+        _logger.info("Caixa de saída de contato recuperada", pendentes=pendentes)
+    for provedor in _provedores:
+        provedor.iniciar()
+    _entregar_contato_uc.iniciar(configuracoes.contato_trabalhadores)
+
+
+async def encerrar() -> None:
+    """Drena as mensagens vencidas e fecha o cliente HTTP (shutdown)."""
+    await _entregar_contato_uc.encerrar(configuracoes.contato_drenar_timeout)
+    await _caixa_saida.fechar()
+    for provedor in _provedores:
+        await provedor.fechar()
+
+
 @roteador.post(
     "/contato",
     response_model=RespostaContato,
+    status_code=202,
     summary="Enviar mensagem de contato",
-    description="Envia mensagem do formulário de contato via Formspree.",
+    description=(
+        "Aceita a mensagem do formulário de contato; o envio via Formspree "
+        "acontece em segundo plano, com novas tentativas em caso de falha."
+    ),
     responses={
-        500: {"description": "Erro ao enviar mensagem"},
+        503: {"description": "Caixa de saída cheia; tente novamente"},
     },
 )
 async def enviar_contato(requisicao: RequisicaoContato) -> RespostaContato:
     """
-    Envia mensagem de contato.
+    Aceita mensagem de contato para envio assíncrono.
 
     Args:
         requisicao: Dados validados do formulário.
 
     Returns:
-        RespostaContato: Resultado do envio.
+        RespostaContato: Confirmação com id de rastreamento.
 
     Raises:
-        HTTPException 500: Se falha ao enviar.
+        ErroServicoIndisponivel: Se a caixa de saída está cheia (503).
 
     Example:
         POST /api/contato
@@ -53,25 +204,21 @@ async def enviar_contato(requisicao: RequisicaoContato) -> RespostaContato:
             "assunto": "Contato",
             "mensagem": "Olá!"
         }
-        → {
+        → 202 {
             "sucesso": true,
-            "mensagem": "Mensagem enviada com sucesso!"
+            "mensagem": "Mensagem recebida! Retornarei em breve.",
+            "id": "3f2a9c1e5b7d4e0f8a6b2c4d1e3f5a7b"
         }
     """
-    sucesso = await _enviar_contato_uc.executar(
+    mensagem = await _enviar_contato_uc.executar(
         nome=requisicao.nome,
         email=requisicao.email,
         assunto=requisicao.assunto,
         mensagem=requisicao.mensagem,
     )
-    
-    if not sucesso:
-        raise HTTPException(
-            status_code=500,
-            detail="Erro ao enviar mensagem. Tente novamente mais tarde.",
-        )
-    
+
     return RespostaContato(
         sucesso=True,
-        mensagem="Mensagem enviada com sucesso! Retornarei em breve.",
+        mensagem="Mensagem recebida! Retornarei em breve.",
+        id=mensagem.id,
     )
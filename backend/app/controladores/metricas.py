@@ -0,0 +1,41 @@
+"""
+Controlador de métricas.
+
+Endpoint:
+- GET /metrics (formato de texto do Prometheus)
+
+Cada worker expõe os próprios contadores; com vários workers, o
+Prometheus deve raspar cada processo (ou somar por instância).
+"""
+
+from fastapi import APIRouter, Response
+
+from app.core.metricas import TIPO_CONTEUDO, registro
+
+roteador = APIRouter(tags=["Saúde"])
+
+
+@roteador.get(
+    "/metrics",
+    response_class=Response,
+    summary="Métricas Prometheus",
+    description="Contadores de requisições, latência por rota, cache do "
+                "repositório e envios de email.",
+    include_in_schema=False,
+)
+async def obter_metricas() -> Response:
+    """
+    Renderiza o registro de métricas do processo.
+
+    Async de propósito: as métricas só são escritas no event loop, então
+    renderizar aqui (e não no threadpool) lê conjuntos e contadores sem
+    disputa com quem os altera.
+
+    Returns:
+        Response: Texto no formato de exposição do Prometheus 0.0.4.
+
+    Example:
+        GET /metrics
+        → http_requisicoes_total{rota="/saude",metodo="GET",status="2xx"} 42
+    """
+    return Response(registro.renderizar(), media_type=TIPO_CONTEUDO)
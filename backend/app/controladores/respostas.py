@@ -0,0 +1,151 @@
+"""
+Respostas JSON pré-serializadas.
+
+Modelos de resposta são validados uma vez por versão dos dados e
+guardados como bytes. Uma requisição só consulta o cache e escreve os
+bytes, sem reconstruir modelos Pydantic nem passar por response_model.
+
+Listas são montadas a partir de fragmentos prontos (um por item), o que
+permite paginar e filtrar sem serializar de novo.
+
+ETags são fortes: combinam a impressão digital dos dados que a resposta
+mostra (hash do conteúdo da parte do portfólio, calculado uma vez por
+versão dos dados) com o caminho e os parâmetros validados. Dados e requisição iguais geram bytes iguais, então o ETag
+pode ser calculado e comparado com If-None-Match antes de montar a
+resposta.
+"""
+
+import json
+from hashlib import blake2b
+from typing import Iterable
+
+from fastapi import Response
+from pydantic import BaseModel
+
+from app.core.tempos import medir
+
+
+# Incrementar quando o formato de alguma resposta mudar sem mudança nos
+# dados, para invalidar ETags já distribuídos.
+VERSAO_FORMATO = 1
+
+
+def serializar(modelo: BaseModel) -> bytes:
+    """
+    Serializa modelo já validado em JSON compacto (UTF-8).
+
+    Args:
+        modelo: Instância do schema de resposta.
+
+    Returns:
+        bytes: Corpo JSON.
+    """
+    with medir("serializacao"):
+        return modelo.model_dump_json().encode("utf-8")
+
+
+def montar_lista(campo: str, fragmentos: Iterable[bytes], **extras: object) -> bytes:
+    """
+    Monta objeto JSON com uma lista de fragmentos já serializados.
+
+    Args:
+        campo: Nome do campo da lista.
+        fragmentos: JSON de cada item, na ordem da resposta.
+        **extras: Demais campos (serializados com json.dumps), na ordem dada.
+
+    Returns:
+        bytes: {"<campo>": [...], "<extra>": valor, ...}
+
+    Example:
+        >>> montar_lista("itens", [b'{"id":1}'], total=1)
+        b'{"itens":[{"id":1}],"total":1}'
+    """
+    with medir("serializacao"):
+        partes = [b'{"', campo.encode("utf-8"), b'":[', b",".join(fragmentos), b"]"]
+        for nome, valor in extras.items():
+            partes.append(b',"' + nome.encode("utf-8") + b'":')
+            partes.append(
+                json.dumps(valor, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            )
+        partes.append(b"}")
+        return b"".join(partes)
+
+
+def calcular_etag(
+    impressao: bytes,
+    caminho: str,
+    parametros: Iterable[tuple[str, str]],
+    codificacao: str | None = None,
+) -> str:
+    """
+    Calcula ETag forte de uma requisição.
+
+    Args:
+        impressao: Hash dos dados mostrados pela resposta, na versão atual.
+        caminho: Caminho da URL.
+        parametros: Pares (nome, valor) dos parâmetros validados do
+            endpoint (a ordem não importa).
+        codificacao: Content-Encoding da variante (None para identity);
+            cada variante tem bytes diferentes, logo ETag próprio.
+
+    Returns:
+        str: ETag entre aspas, pronto para o cabeçalho.
+    """
+    hash_ = blake2b(impressao, digest_size=16)
+    requisicao = json.dumps(
+        [VERSAO_FORMATO, caminho, sorted(parametros)],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    hash_.update(requisicao.encode("utf-8"))
+    sufixo = f"-{codificacao}" if codificacao else ""
+    return f'"{hash_.hexdigest()}{sufixo}"'
+
+
+def etag_corresponde(if_none_match: str | None, etag: str) -> bool:
+    """
+    Verifica If-None-Match contra o ETag atual (comparação fraca, RFC 9110).
+
+    Args:
+        if_none_match: Valor do cabeçalho (None se ausente).
+        etag: ETag atual.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidato.strip().removeprefix("W/") == etag
+        for candidato in if_none_match.split(",")
+    )
+
+
+def resposta_json(
+    corpo: bytes,
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """
+    Envolve bytes JSON prontos em uma Response.
+
+    Args:
+        corpo: JSON serializado.
+        status_code: Status HTTP.
+        headers: Cabeçalhos extras (ex.: ETag, Cache-Control).
+    """
+    return Response(
+        content=corpo,
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+def resposta_nao_modificada(headers: dict[str, str]) -> Response:
+    """
+    Resposta 304 sem corpo.
+
+    Args:
+        headers: ETag e Cache-Control (repetidos, como exige a RFC 9110).
+    """
+    return Response(status_code=304, headers=headers)
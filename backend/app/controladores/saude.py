@@ -10,6 +10,7 @@ from fastapi import APIRouter
 
 from app.esquemas.saude import RespostaSaude
 from app.configuracao import configuracoes
+from app.core.disjuntor import estados_disjuntores
 
 roteador = APIRouter(tags=["Saúde"])
 
@@ -22,7 +23,8 @@ _INICIO_APLICACAO = time.time()
     response_model=RespostaSaude,
     summary="Health check da API",
     description="Retorna status OK se a API está funcionando. "
-                "Inclui versão, ambiente e uptime.",
+                "Inclui versão, ambiente, uptime e disjuntores; com algum "
+                "disjuntor fora de 'fechado' o status é 'degradado' (ainda 200).",
 )
 def verificar_saude() -> RespostaSaude:
     """
@@ -38,15 +40,23 @@ def verificar_saude() -> RespostaSaude:
             "mensagem": "API funcionando normalmente",
             "versao_api": "1.0.0",
             "ambiente": "local",
-            "uptime_segundos": 3600
+            "uptime_segundos": 3600,
+            "disjuntores": {"formspree": "fechado"}
         }
     """
     uptime = int(time.time() - _INICIO_APLICACAO)
+    disjuntores = estados_disjuntores()
+    suspensos = sorted(n for n, e in disjuntores.items() if e != "fechado")
     
     return RespostaSaude(
-        status="ok",
-        mensagem="API funcionando normalmente",
+        status="degradado" if suspensos else "ok",
+        mensagem=(
+            f"Dependências suspensas: {', '.join(suspensos)}"
+            if suspensos
+            else "API funcionando normalmente"
+        ),
         versao_api="1.0.0",
         ambiente=configuracoes.ambiente,
         uptime_segundos=uptime,
+        disjuntores=disjuntores,
     )
\ No newline at end of file
@@ -15,6 +15,7 @@ from app.core.excecoes import (
     ErroRecursoNaoEncontrado,
 )
 from app.core.handlers import registrar_handlers_excecao
+from app.core.cache import CachePorVersao
 
 __all__ = [
     "ErroDominio",
@@ -22,4 +23,5 @@ __all__ = [
     "ErroInfraestrutura",
     "ErroRecursoNaoEncontrado",
     "registrar_handlers_excecao",
+    "CachePorVersao",
 ]
@@ -0,0 +1,194 @@
+"""
+Amostragem do log de acesso e resumos periódicos por rota.
+
+Em tráfego alto, uma linha por requisição domina o volume de logs. Aqui
+fica a decisão de logar ou não cada requisição, tomada antes de montar
+qualquer event dict, e a agregação de latências por rota que substitui
+as linhas individuais não amostradas.
+
+Regras:
+    - Erros (status >= status_erro) e requisições lentas: sempre logadas.
+    - Demais: fração configurável, por rota (template) ou padrão.
+    - A cada intervalo: um resumo por rota com contagem, erros e
+      p50/p95/p99/máximo.
+"""
+
+import math
+import random
+import time
+from typing import Mapping
+
+# Buckets logarítmicos de 5%: percentis com erro relativo <= 5%
+_RAZAO_BUCKET = 1.05
+_LOG_RAZAO = math.log(_RAZAO_BUCKET)
+
+
+class HistogramaLatencia:
+    """
+    Histograma de latências em buckets logarítmicos.
+
+    Registrar custa um log() e um incremento de dict, sem guardar cada
+    amostra; percentis saem do bucket que contém a posição pedida.
+
+    Attributes:
+        total: Quantidade de amostras.
+        maximo: Maior latência registrada (ms).
+    """
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.maximo = 0.0
+        self._buckets: dict[int, int] = {}
+
+    def registrar(self, duracao_ms: float) -> None:
+        """Adiciona uma amostra (ms)."""
+        indice = math.ceil(math.log(max(duracao_ms, 1e-3)) / _LOG_RAZAO)
+        self._buckets[indice] = self._buckets.get(indice, 0) + 1
+        self.total += 1
+        if duracao_ms > self.maximo:
+            self.maximo = duracao_ms
+
+    def percentil(self, p: float) -> float:
+        """
+        Retorna limite superior do bucket do percentil p (0-100).
+
+        Args:
+            p: Percentil desejado.
+        """
+        if not self.total:
+            return 0.0
+        alvo = max(1, math.ceil(self.total * p / 100))
+        acumulado = 0
+        for indice in sorted(self._buckets):
+            acumulado += self._buckets[indice]
+            if acumulado >= alvo:
+                return min(_RAZAO_BUCKET ** indice, self.maximo)
+        return self.maximo
+
+
+class AmostradorLogs:
+    """
+    Decide se uma requisição concluída vira linha de log.
+
+    Attributes:
+        fracao_padrao: Fração logada de rotas sem taxa própria.
+        fracoes_rotas: Fração por template de rota (ex.: "/saude": 0).
+        lento_ms: Requisições com duração >= lento_ms são sempre logadas.
+        status_erro: Status a partir do qual a requisição é sempre logada.
+    """
+
+    def __init__(
+        self,
+        fracao_padrao: float = 1.0,
+        fracoes_rotas: Mapping[str, float] | None = None,
+        lento_ms: float = 1000.0,
+        status_erro: int = 500,
+        aleatorio: random.Random | None = None,
+    ):
+        """
+        Inicializa amostrador.
+
+        Args:
+            fracao_padrao: Fração logada de rotas sem taxa própria (0-1).
+            fracoes_rotas: Fração por template de rota.
+            lento_ms: Limite de lentidão (ms).
+            status_erro: Menor status tratado como erro.
+            aleatorio: Gerador (injetável em testes).
+        """
+        self.fracao_padrao = fracao_padrao
+        self.fracoes_rotas = dict(fracoes_rotas or {})
+        self.lento_ms = lento_ms
+        self.status_erro = status_erro
+        self._aleatorio = aleatorio or random.Random()
+
+    def motivo(self, rota: str, status_code: int, duracao_ms: float) -> str | None:
+        """
+        Retorna por que logar a requisição, ou None para não logar.
+
+        Args:
+            rota: Template da rota.
+            status_code: Status HTTP enviado.
+            duracao_ms: Duração da requisição.
+
+        Returns:
+            "erro", "lento", "amostra" ou None.
+        """
+        if status_code >= self.status_erro:
+            return "erro"
+        if duracao_ms >= self.lento_ms:
+            return "lento"
+        fracao = self.fracoes_rotas.get(rota, self.fracao_padrao)
+        if fracao >= 1.0 or (fracao > 0.0 and self._aleatorio.random() < fracao):
+            return "amostra"
+        return None
+
+
+class ResumoRotas:
+    """
+    Agrega requisições por rota e libera um resumo a cada intervalo.
+
+    Usado só no event loop (sem trava).
+
+    Attributes:
+        intervalo: Segundos entre resumos (0 desativa).
+    """
+
+    def __init__(self, intervalo: float = 60.0, relogio=time.monotonic):
+        """
+        Inicializa agregador.
+
+        Args:
+            intervalo: Segundos entre resumos (0 desativa).
+            relogio: Função de tempo monotônico (injetável em testes).
+        """
+        self.intervalo = intervalo
+        self._relogio = relogio
+        self._inicio = relogio()
+        self._rotas: dict[str, tuple[HistogramaLatencia, list[int]]] = {}
+
+    def registrar(self, rota: str, duracao_ms: float, erro: bool) -> None:
+        """
+        Conta uma requisição concluída.
+
+        Args:
+            rota: Template da rota.
+            duracao_ms: Duração da requisição.
+            erro: Se terminou em erro.
+        """
+        if not self.intervalo:
+            return
+        entrada = self._rotas.get(rota)
+        if entrada is None:
+            entrada = self._rotas[rota] = (HistogramaLatencia(), [0])
+        entrada[0].registrar(duracao_ms)
+        if erro:
+            entrada[1][0] += 1
+
+    def coletar(self) -> list[dict] | None:
+        """
+        Retorna resumos por rota se o intervalo venceu, zerando a janela.
+
+        Returns:
+            Lista de dicts (um por rota) ou None se ainda não é hora.
+        """
+        if not self.intervalo:
+            return None
+        agora = self._relogio()
+        janela = agora - self._inicio
+        if janela < self.intervalo:
+            return None
+
+        rotas, self._rotas, self._inicio = self._rotas, {}, agora
+        return [
+            {
+                "rota": rota,
+                "requisicoes": histograma.total,
+                "erros": erros[0],
+                "janela_s": round(janela, 1),
+                "p50_ms": round(histograma.percentil(50), 2),
+                "p95_ms": round(histograma.percentil(95), 2),
+                "p99_ms": round(histograma.percentil(99), 2),
+                "max_ms": round(histograma.maximo, 2),
+            }
+            for rota, (histograma, erros) in sorted(rotas.items())
+        ]
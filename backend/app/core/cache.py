@@ -0,0 +1,83 @@
+"""
+Cache de valores derivados por versão de dados.
+
+Índices, ordenações e respostas montadas a partir de um snapshot são
+guardados aqui e descartados automaticamente quando a versão muda.
+"""
+
+from typing import Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+_SEM_VERSAO = object()
+
+
+class CachePorVersao:
+    """
+    Guarda valores derivados enquanto a versão dos dados não muda.
+
+    Ao receber uma versão diferente da atual todo o conteúdo é
+    descartado. Versão None significa "dados sem versão": nada é
+    guardado e o valor é sempre recalculado.
+
+    Operações são atômicas sob o GIL; duas requisições concorrentes
+    podem, no máximo, calcular o mesmo valor duas vezes.
+    """
+
+    def __init__(self) -> None:
+        self._versao: object = _SEM_VERSAO
+        self._valores: dict[Hashable, object] = {}
+
+    def _valores_da_versao(self, versao: Hashable) -> dict[Hashable, object]:
+        """Retorna o dicionário da versão, descartando versões anteriores."""
+        if versao != self._versao:
+            self._valores = {}
+            self._versao = versao
+        return self._valores
+
+    def valor(self, versao: Hashable | None, chave: Hashable) -> object | None:
+        """
+        Retorna valor guardado ou None se ausente.
+
+        Args:
+            versao: Versão atual dos dados.
+            chave: Identificador do valor derivado.
+        """
+        if versao is None:
+            return None
+        return self._valores_da_versao(versao).get(chave)
+
+    def guardar(self, versao: Hashable | None, chave: Hashable, valor: T) -> T:
+        """
+        Guarda valor para a versão informada.
+
+        Args:
+            versao: Versão dos dados usados para calcular o valor.
+            chave: Identificador do valor derivado.
+            valor: Valor a guardar.
+
+        Returns:
+            O próprio valor (para encadear).
+        """
+        if versao is not None:
+            self._valores_da_versao(versao)[chave] = valor
+        return valor
+
+    def obter(
+        self,
+        versao: Hashable | None,
+        chave: Hashable,
+        fabrica: Callable[[], T],
+    ) -> T:
+        """
+        Retorna valor guardado ou calcula com fabrica e guarda.
+
+        Args:
+            versao: Versão atual dos dados.
+            chave: Identificador do valor derivado.
+            fabrica: Função que calcula o valor.
+        """
+        valor = self.valor(versao, chave)
+        if valor is None:
+            valor = self.guardar(versao, chave, fabrica())
+        return valor
@@ -0,0 +1,197 @@
+"""
+Disjuntor (circuit breaker) para dependências externas.
+
+Estados:
+    fechado     → chamadas passam; os resultados entram em uma janela
+                  das últimas N chamadas.
+    aberto      → chamadas são recusadas na hora (sem I/O) até o fim do
+                  tempo de abertura.
+    meio_aberto → algumas chamadas de teste passam; sucesso rápido fecha,
+                  falha ou lentidão reabre.
+
+Abre quando, com pelo menos `minimo` chamadas na janela, a fração de
+falhas ou a fração de chamadas lentas chega à taxa configurada. Lentidão
+conta mesmo quando a chamada termina bem: um provedor que responde em
+8 s ainda prende workers e conexões.
+
+Os disjuntores registrados aparecem em /saude e em /metrics
+(`disjuntor_estado{nome,estado}` e `disjuntor_transicoes_total`).
+"""
+
+import time
+from collections import deque
+from typing import Callable, Literal
+
+from app.core.metricas import DISJUNTOR_TRANSICOES, MetricaFuncao, registro
+
+Estado = Literal["fechado", "aberto", "meio_aberto"]
+ESTADOS: tuple[Estado, ...] = ("fechado", "aberto", "meio_aberto")
+
+
+class Disjuntor:
+    """
+    Máquina de estados do disjuntor.
+
+    Feito para uso no event loop (sem trava): `permitir` antes da
+    chamada e `registrar` (ou `cancelar`) depois, sempre em par.
+
+    Attributes:
+        nome: Identificador em /saude e nas métricas.
+        estado: Estado atual.
+        janela: Quantidade de chamadas consideradas.
+        minimo: Chamadas na janela antes de poder abrir.
+        taxa: Fração de falhas (ou de lentas) que abre o disjuntor.
+        lento: Segundos a partir dos quais a chamada conta como lenta.
+        tempo_aberto: Segundos recusando chamadas antes do meio-aberto.
+        chamadas_teste: Sucessos no meio-aberto para fechar.
+    """
+
+    def __init__(
+        self,
+        nome: str,
+        janela: int = 20,
+        minimo: int = 5,
+        taxa: float = 0.5,
+        lento: float = 3.0,
+        tempo_aberto: float = 30.0,
+        chamadas_teste: int = 1,
+        relogio: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Inicializa disjuntor fechado.
+
+        Args:
+            nome: Identificador (ex.: "formspree").
+            janela: Chamadas consideradas no cálculo das taxas.
+            minimo: Chamadas mínimas na janela para abrir.
+            taxa: Fração de falhas ou de lentas que abre (0-1).
+            lento: Duração (segundos) de uma chamada lenta.
+            tempo_aberto: Segundos aberto antes de testar de novo.
+            chamadas_teste: Chamadas de teste simultâneas no meio-aberto
+                (e sucessos necessários para fechar).
+            relogio: Fonte de tempo (injetável em testes).
+        """
+        self.nome = nome
+        self.janela = janela
+        self.minimo = minimo
+        self.taxa = taxa
+        self.lento = lento
+        self.tempo_aberto = tempo_aberto
+        self.chamadas_teste = chamadas_teste
+        self.estado: Estado = "fechado"
+        self._relogio = relogio
+        self._resultados: deque[tuple[bool, bool]] = deque(maxlen=janela)
+        self._aberto_ate = 0.0
+        self._em_teste = 0
+        self._sucessos_teste = 0
+
+    def permitir(self) -> bool:
+        """
+        Decide se a chamada pode ser feita agora.
+
+        Returns:
+            bool: False enquanto aberto (ou com os testes já em curso).
+        """
+        if self.estado == "fechado":
+            return True
+        if self.estado == "aberto":
+            if self._relogio() < self._aberto_ate:
+                return False
+            self._mudar("meio_aberto")
+        if self._em_teste >= self.chamadas_teste:
+            return False
+        self._em_teste += 1
+        return True
+
+    def registrar(self, sucesso: bool, duracao: float) -> None:
+        """
+        Registra o resultado de uma chamada permitida.
+
+        Args:
+            sucesso: Se a chamada deu certo.
+            duracao: Duração da chamada em segundos.
+        """
+        lenta = duracao >= self.lento
+        if self.estado == "meio_aberto":
+            self._em_teste = max(self._em_teste - 1, 0)
+            if not sucesso or lenta:
+                self._abrir()
+                return
+            self._sucessos_teste += 1
+            if self._sucessos_teste >= self.chamadas_teste:
+                self._resultados.clear()
+                self._mudar("fechado")
+            return
+        if self.estado == "aberto":
+            # Chamada iniciada antes da abertura: não muda nada
+            return
+
+        self._resultados.append((not sucesso, lenta))
+        total = len(self._resultados)
+        if total < self.minimo:
+            return
+        falhas = sum(falha for falha, _ in self._resultados)
+        lentas = sum(lenta for _, lenta in self._resultados)
+        if falhas >= self.taxa * total or lentas >= self.taxa * total:
+            self._abrir()
+
+    def cancelar(self) -> None:
+        """Libera uma chamada permitida que foi cancelada antes do resultado."""
+        if self.estado == "meio_aberto":
+            self._em_teste = max(self._em_teste - 1, 0)
+
+    def restante(self) -> float:
+        """Segundos até o próximo teste (0 se não está aberto)."""
+        if self.estado != "aberto":
+            return 0.0
+        return max(self._aberto_ate - self._relogio(), 0.0)
+
+    def _abrir(self) -> None:
+        self._aberto_ate = self._relogio() + self.tempo_aberto
+        self._mudar("aberto")
+
+    def _mudar(self, estado: Estado) -> None:
+        self.estado = estado
+        self._em_teste = 0
+        self._sucessos_teste = 0
+        DISJUNTOR_TRANSICOES.incrementar(self.nome, estado)
+
+
+_disjuntores: dict[str, Disjuntor] = {}
+
+
+def registrar_disjuntor(disjuntor: Disjuntor) -> Disjuntor:
+    """
+    Publica o disjuntor em /saude e /metrics.
+
+    Args:
+        disjuntor: Disjuntor do processo (nome único).
+
+    Returns:
+        Disjuntor: O próprio disjuntor (para uso em atribuição).
+    """
+    _disjuntores[disjuntor.nome] = disjuntor
+    return disjuntor
+
+
+def estados_disjuntores() -> dict[str, Estado]:
+    """
+    Estado atual de cada disjuntor registrado.
+
+    Returns:
+        dict[str, Estado]: Nome → estado.
+    """
+    return {nome: d.estado for nome, d in _disjuntores.items()}
+
+
+registro.registrar(MetricaFuncao(
+    "disjuntor_estado",
+    "Estado atual de cada disjuntor (1 no estado ativo, 0 nos demais).",
+    "gauge",
+    lambda: {
+        (nome, estado): 1.0 if d.estado == estado else 0.0
+        for nome, d in _disjuntores.items()
+        for estado in ESTADOS
+    },
+    ["nome", "estado"],
+))
@@ -85,3 +85,57 @@ class ErroRecursoNaoEncontrado(ErroDominio):
         codigo: str | None = None,
     ) -> None:
         super().__init__(mensagem, codigo or "RECURSO_NAO_ENCONTRADO")
+
+
+class ErroServicoIndisponivel(ErroInfraestrutura):
+    """
+    Exceção para serviço temporariamente sem capacidade.
+
+    Mapeia para HTTP 503 Service Unavailable.
+    Usado quando a requisição pode ser repetida mais tarde
+    (ex.: fila de envio de contato cheia).
+
+    Example:
+        raise ErroServicoIndisponivel(
+            "Fila de contato cheia",
+            codigo="FILA_CONTATO_CHEIA",
+            origem="caixa_saida",
+        )
+    """
+
+    def __init__(
+        self,
+        mensagem: str,
+        codigo: str | None = None,
+        origem: str | None = None,
+    ) -> None:
+        super().__init__(mensagem, codigo or "SERVICO_INDISPONIVEL", origem)
+
+
+class ErroCircuitoAberto(ErroServicoIndisponivel):
+    """
+    Exceção para chamada recusada pelo disjuntor de uma dependência.
+
+    Mapeia para HTTP 503 Service Unavailable.
+    Nenhuma tentativa foi feita: o chamador pode adiar sem contar falha.
+
+    Attributes:
+        tentar_apos: Segundos até o disjuntor aceitar uma chamada de teste.
+
+    Example:
+        raise ErroCircuitoAberto(
+            "Envio de email suspenso",
+            origem="formspree",
+            tentar_apos=12.5,
+        )
+    """
+
+    def __init__(
+        self,
+        mensagem: str,
+        codigo: str | None = None,
+        origem: str | None = None,
+        tentar_apos: float = 0.0,
+    ) -> None:
+        super().__init__(mensagem, codigo or "CIRCUITO_ABERTO", origem)
+        self.tentar_apos = tentar_apos
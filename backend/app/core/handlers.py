@@ -18,6 +18,7 @@ from app.core.excecoes import (
     ErroValidacao,
     ErroInfraestrutura,
     ErroRecursoNaoEncontrado,
+    ErroServicoIndisponivel,
 )
 
 logger = logging.getLogger(__name__)
@@ -141,6 +142,34 @@ async def handler_erro_infraestrutura(
     )
 
 
+async def handler_servico_indisponivel(
+    request: Request,
+    exc: ErroServicoIndisponivel,
+) -> JSONResponse:
+    """
+    Trata falta temporária de capacidade.
+
+    Args:
+        request: Requisição HTTP.
+        exc: Exceção de serviço indisponível.
+
+    Returns:
+        JSONResponse: HTTP 503 com Retry-After.
+    """
+    logger.warning(
+        f"Serviço indisponível: {exc.mensagem}",
+        extra={"codigo": exc.codigo, "origem": exc.origem, "path": request.url.path},
+    )
+
+    resposta = criar_resposta_erro(
+        codigo=exc.codigo,
+        mensagem="Serviço temporariamente indisponível. Tente novamente em instantes.",
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
+    resposta.headers["Retry-After"] = "30"
+    return resposta
+
+
 async def handler_recurso_nao_encontrado(
     request: Request,
     exc: ErroRecursoNaoEncontrado,
@@ -242,6 +271,7 @@ def registrar_handlers_excecao(app: FastAPI) -> None:
         - ErroDominio → 400
         - ErroValidacao → 422
         - ErroInfraestrutura → 500
+        - ErroServicoIndisponivel → 503
         - ErroRecursoNaoEncontrado → 404
         - RequestValidationError → 422
         - Exception (fallback) → 500
@@ -249,6 +279,7 @@ def registrar_handlers_excecao(app: FastAPI) -> None:
     app.add_exception_handler(ErroDominio, handler_erro_dominio)
     app.add_exception_handler(ErroValidacao, handler_erro_validacao)
     app.add_exception_handler(ErroInfraestrutura, handler_erro_infraestrutura)
+    app.add_exception_handler(ErroServicoIndisponivel, handler_servico_indisponivel)
     app.add_exception_handler(
         ErroRecursoNaoEncontrado,
         handler_recurso_nao_encontrado,
@@ -0,0 +1,343 @@
+"""
+Métricas da aplicação no formato de texto do Prometheus.
+
+Cada processo (worker do uvicorn) mantém seus próprios contadores em
+dicionários simples, sem trava: as escritas acontecem no event loop e
+cada série é um incremento de dict. O Prometheus raspa cada worker e
+soma as séries (ou usa um único worker por instância).
+
+Tipos:
+    - Contador: só cresce (requisições, envios de email).
+    - Medidor: sobe e desce (requisições em andamento).
+    - Histograma: buckets fixos de latência.
+    - MetricaFuncao: lida na raspagem a partir de outro objeto
+      (ex.: EstatisticasCache do repositório).
+"""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Iterator, Mapping, Sequence
+
+TIPO_CONTEUDO = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latência HTTP em segundos (de 1 ms a 10 s)
+BUCKETS_LATENCIA = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+Amostra = tuple[str, tuple[tuple[str, str], ...], float]
+
+
+def _escapar(valor: str) -> str:
+    """Escapa valor de rótulo (barra invertida, aspas e quebra de linha)."""
+    return valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _formatar_numero(valor: float) -> str:
+    """Inteiros sem casa decimal; infinito como +Inf."""
+    if valor == float("inf"):
+        return "+Inf"
+    if float(valor).is_integer():
+        return str(int(valor))
+    return repr(float(valor))
+
+
+class Metrica(ABC):
+    """
+    Base das famílias de métricas.
+
+    Attributes:
+        nome: Nome da métrica no Prometheus.
+        ajuda: Texto do HELP.
+        rotulos: Nomes dos rótulos, na ordem dos valores passados.
+    """
+
+    tipo = "untyped"
+
+    def __init__(self, nome: str, ajuda: str, rotulos: Sequence[str] = ()):
+        """
+        Inicializa família sem séries.
+
+        Args:
+            nome: Nome da métrica.
+            ajuda: Descrição (linha HELP).
+            rotulos: Nomes dos rótulos.
+        """
+        self.nome = nome
+        self.ajuda = ajuda
+        self.rotulos = tuple(rotulos)
+
+    @property
+    def familia(self) -> str:
+        """Nome nas linhas HELP/TYPE: contadores levam `_total`, como as amostras."""
+        return f"{self.nome}_total" if self.tipo == "counter" else self.nome
+
+    @abstractmethod
+    def amostras(self) -> Iterator[Amostra]:
+        """Gera (sufixo, rótulos, valor) de cada série."""
+        pass
+
+    def _rotular(self, valores: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+        return tuple(zip(self.rotulos, valores))
+
+
+class Contador(Metrica):
+    """Contador monotônico com rótulos."""
+
+    tipo = "counter"
+
+    def __init__(self, nome: str, ajuda: str, rotulos: Sequence[str] = ()):
+        super().__init__(nome, ajuda, rotulos)
+        # Sem rótulos: série única exposta desde o início, com 0
+        self._valores: dict[tuple[str, ...], float] = {} if self.rotulos else {(): 0}
+
+    def incrementar(self, *valores_rotulos: str, quantidade: float = 1) -> None:
+        """
+        Soma quantidade à série dos rótulos informados.
+
+        Args:
+            *valores_rotulos: Valores na ordem de `rotulos`.
+            quantidade: Incremento (não negativo).
+        """
+        self._valores[valores_rotulos] = self._valores.get(valores_rotulos, 0) + quantidade
+
+    def valor(self, *valores_rotulos: str) -> float:
+        """Retorna valor atual da série (0 se nunca incrementada)."""
+        return self._valores.get(valores_rotulos, 0)
+
+    def amostras(self) -> Iterator[Amostra]:
+        for valores, valor in sorted(self._valores.items()):
+            yield "_total", self._rotular(valores), valor
+
+
+class Medidor(Metrica):
+    """Valor que sobe e desce (ex.: requisições em andamento)."""
+
+    tipo = "gauge"
+
+    def __init__(self, nome: str, ajuda: str, rotulos: Sequence[str] = ()):
+        super().__init__(nome, ajuda, rotulos)
+        # Sem rótulos: série única exposta desde o início, com 0
+        self._valores: dict[tuple[str, ...], float] = {} if self.rotulos else {(): 0}
+
+    def somar(self, quantidade: float, *valores_rotulos: str) -> None:
+        """
+        Soma quantidade (negativa para diminuir) à série.
+
+        Args:
+            quantidade: Variação.
+            *valores_rotulos: Valores na ordem de `rotulos`.
+        """
+        self._valores[valores_rotulos] = self._valores.get(valores_rotulos, 0) + quantidade
+
+    def valor(self, *valores_rotulos: str) -> float:
+        """Retorna valor atual da série."""
+        return self._valores.get(valores_rotulos, 0)
+
+    def amostras(self) -> Iterator[Amostra]:
+        for valores, valor in sorted(self._valores.items()):
+            yield "", self._rotular(valores), valor
+
+
+class Histograma(Metrica):
+    """
+    Histograma de buckets fixos.
+
+    Cada série guarda contagens por bucket (não acumuladas) e a soma;
+    o acúmulo `le` do Prometheus é feito só na raspagem.
+
+    Attributes:
+        limites: Limites superiores dos buckets, crescentes.
+    """
+
+    tipo = "histogram"
+
+    def __init__(
+        self,
+        nome: str,
+        ajuda: str,
+        rotulos: Sequence[str] = (),
+        limites: Sequence[float] = BUCKETS_LATENCIA,
+    ):
+        """
+        Inicializa histograma.
+
+        Args:
+            nome: Nome da métrica.
+            ajuda: Descrição (linha HELP).
+            rotulos: Nomes dos rótulos.
+            limites: Limites superiores dos buckets (sem +Inf).
+        """
+        super().__init__(nome, ajuda, rotulos)
+        self.limites = tuple(limites)
+        # Série: [contagem por bucket..., contagem +Inf, soma]
+        self._series: dict[tuple[str, ...], list[float]] = {}
+
+    def observar(self, valor: float, *valores_rotulos: str) -> None:
+        """
+        Registra uma observação.
+
+        Args:
+            valor: Valor observado (ex.: segundos).
+            *valores_rotulos: Valores na ordem de `rotulos`.
+        """
+        serie = self._series.get(valores_rotulos)
+        if serie is None:
+            serie = self._series[valores_rotulos] = [0] * (len(self.limites) + 2)
+        serie[bisect_left(self.limites, valor)] += 1
+        serie[-1] += valor
+
+    def contagem(self, *valores_rotulos: str) -> int:
+        """Retorna quantidade de observações da série."""
+        serie = self._series.get(valores_rotulos)
+        return int(sum(serie[:-1])) if serie else 0
+
+    def amostras(self) -> Iterator[Amostra]:
+        limites = [_formatar_numero(limite) for limite in self.limites] + ["+Inf"]
+        for valores, serie in sorted(self._series.items()):
+            rotulos = self._rotular(valores)
+            acumulado = 0
+            for limite, contagem in zip(limites, serie):
+                acumulado += contagem
+                yield "_bucket", rotulos + (("le", limite),), acumulado
+            yield "_sum", rotulos, serie[-1]
+            yield "_count", rotulos, acumulado
+
+
+class MetricaFuncao(Metrica):
+    """
+    Métrica lida de uma função na hora da raspagem.
+
+    Útil para contadores que já existem em outro objeto, sem duplicar
+    o incremento no caminho quente.
+    """
+
+    def __init__(
+        self,
+        nome: str,
+        ajuda: str,
+        tipo: str,
+        funcao: Callable[[], Mapping[tuple[str, ...], float]],
+        rotulos: Sequence[str] = (),
+    ):
+        """
+        Inicializa métrica.
+
+        Args:
+            nome: Nome da métrica.
+            ajuda: Descrição (linha HELP).
+            tipo: "counter" ou "gauge".
+            funcao: Retorna valores de rótulos → valor.
+            rotulos: Nomes dos rótulos.
+        """
+        super().__init__(nome, ajuda, rotulos)
+        self.tipo = tipo
+        self._funcao = funcao
+
+    def amostras(self) -> Iterator[Amostra]:
+        sufixo = "_total" if self.tipo == "counter" else ""
+        for valores, valor in sorted(self._funcao().items()):
+            yield sufixo, self._rotular(valores), valor
+
+
+class RegistroMetricas:
+    """
+    Conjunto de métricas expostas em /metrics.
+
+    Example:
+        >>> registro = RegistroMetricas()
+        >>> envios = registro.registrar(Contador("envios", "Envios.", ["resultado"]))
+        >>> envios.incrementar("sucesso")
+        >>> "envios_total{resultado=\\"sucesso\\"} 1" in registro.renderizar()
+        True
+    """
+
+    def __init__(self) -> None:
+        self._metricas: dict[str, Metrica] = {}
+
+    def registrar(self, metrica: Metrica) -> Metrica:
+        """
+        Adiciona métrica ao registro.
+
+        Args:
+            metrica: Família a expor.
+
+        Returns:
+            A própria métrica (para atribuir em constante de módulo).
+
+        Raises:
+            ValueError: Se já existe métrica com o mesmo nome.
+        """
+        if metrica.nome in self._metricas:
+            raise ValueError(f"Métrica já registrada: {metrica.nome}")
+        self._metricas[metrica.nome] = metrica
+        return metrica
+
+    def renderizar(self) -> str:
+        """
+        Renderiza todas as métricas no formato de texto do Prometheus.
+
+        Returns:
+            str: Corpo para a resposta de /metrics.
+        """
+        linhas: list[str] = []
+        for metrica in self._metricas.values():
+            linhas.append(f"# HELP {metrica.familia} {metrica.ajuda}")
+            linhas.append(f"# TYPE {metrica.familia} {metrica.tipo}")
+            for sufixo, rotulos, valor in metrica.amostras():
+                if rotulos:
+                    texto = ",".join(f'{nome}="{_escapar(str(v))}"' for nome, v in rotulos)
+                    linhas.append(f"{metrica.nome}{sufixo}{{{texto}}} {_formatar_numero(valor)}")
+                else:
+                    linhas.append(f"{metrica.nome}{sufixo} {_formatar_numero(valor)}")
+        return "\n".join(linhas) + "\n"
+
+
+# Registro do processo e métricas usadas pela aplicação
+registro = RegistroMetricas()
+
+REQUISICOES_HTTP = registro.registrar(Contador(
+    "http_requisicoes",
+    "Requisições HTTP concluídas por rota, método e classe de status.",
+    ["rota", "metodo", "status"],
+))
+DURACAO_HTTP = registro.registrar(Histograma(
+    "http_requisicao_duracao_segundos",
+    "Duração das requisições HTTP por rota.",
+    ["rota"],
+))
+EM_ANDAMENTO_HTTP = registro.registrar(Medidor(
+    "http_requisicoes_em_andamento",
+    "Requisições HTTP sendo processadas.",
+))
+CACHE_RESPOSTAS = registro.registrar(Contador(
+    "respostas_cache",
+    "Consultas ao cache de respostas serializadas por resultado.",
+    ["resultado"],
+))
+ENTREGAS_CONTATO = registro.registrar(Contador(
+    "contato_entregas",
+    "Tentativas de entrega da caixa de saída de contato por resultado.",
+    ["resultado"],
+))
+ENVIOS_EMAIL = registro.registrar(Contador(
+    "email_envios",
+    "Envios de email por provedor e resultado.",
+    ["provedor", "resultado"],
+))
+ENVIOS_REDUNDANTES = registro.registrar(Contador(
+    "email_envios_redundantes",
+    "Envios extras do adaptador multiprovedor (hedge, failover) e "
+    "reenvios evitados pela deduplicação por id.",
+    ["motivo"],
+))
+DISJUNTOR_TRANSICOES = registro.registrar(Contador(
+    "disjuntor_transicoes",
+    "Mudanças de estado dos disjuntores por nome e estado de destino.",
+    ["nome", "estado"],
+))
+
+
+def classe_status(status_code: int) -> str:
+    """Classe do status para rótulo (ex.: 404 → "4xx")."""
+    return f"{status_code // 100}xx"
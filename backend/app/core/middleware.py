@@ -6,83 +6,172 @@ Adiciona:
 - Logging estruturado com structlog
 - Medição de tempo de resposta
 - Headers customizados de resposta
+- Amostragem do log de acesso e resumos por rota
+- Métricas Prometheus por rota (contagem, status, latência, em andamento)
+- Server-Timing com o tempo de cada camada (opcional)
+- Perfilador por amostragem em requisições selecionadas (opcional)
+- Vigia que loga pilhas de requisições lentas ainda em andamento
 """
 
 import time
 import uuid
-from typing import Callable
 
 import structlog
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Configurar structlog no módulo
 from app.adaptadores.logger_adaptador import configurar_structlog
+from app.configuracao import configuracoes
+from app.core.amostragem import AmostradorLogs, ResumoRotas
+from app.core.metricas import (
+    DURACAO_HTTP,
+    EM_ANDAMENTO_HTTP,
+    REQUISICOES_HTTP,
+    classe_status,
+)
+from app.core.perfilador import PerfiladorAmostragem, obter_perfilador
+from app.core.tempos import encerrar_medicao, formatar_server_timing, iniciar_medicao
+from app.core.vigia import VigiaRequisicoesLentas, obter_vigia
 
 configurar_structlog()
 logger = structlog.get_logger(__name__)
 
 
-class MiddlewareRequisicao(BaseHTTPMiddleware):
+class MiddlewareRequisicao:
     """
-    Middleware para processar todas as requisições HTTP.
+    Middleware ASGI puro para processar todas as requisições HTTP.
 
     Funcionalidades:
         - Gera request_id único (UUID4)
         - Adiciona request_id no contexto do structlog
-        - Mede tempo de resposta
-        - Loga método, path, status e duração
+        - Mede tempo de resposta (relógio monotônico)
+        - Loga método, path, status e duração (uma linha, amostrada)
+        - Agrega latência por rota e loga resumos periódicos
+        - Atualiza métricas de /metrics (contador, histograma, em andamento)
+        - Com SERVER_TIMING ativo, mede as camadas (app.core.tempos) e as
+          envia no cabeçalho Server-Timing e no campo tempos_ms do log
+        - Com PERFIL_TOKEN/PERFIL_ROTAS, amostra pilhas das requisições
+          escolhidas (app.core.perfilador)
+        - Registra a requisição no vigia de lentidão (app.core.vigia)
         - Adiciona headers: X-Request-ID, X-Response-Time
-    """
 
-    def __init__(self, app: ASGIApp) -> None:
-        super().__init__(app)
+    A linha `resposta_enviada` sai sempre para erros e requisições lentas
+    e, nas demais, para a fração configurada da rota. A decisão vem antes
+    de montar o evento: requisição não amostrada só custa o registro no
+    histograma da rota.
+
+    Não usa BaseHTTPMiddleware: a resposta segue direto para o servidor,
+    sem task e memory stream extras por requisição, e streaming e
+    background tasks funcionam normalmente.
+    """
 
-    async def dispatch(
+    def __init__(
         self,
-        request: Request,
-        call_next: Callable,
-    ) -> Response:
+        app: ASGIApp,
+        amostrador: AmostradorLogs | None = None,
+        resumo: ResumoRotas | None = None,
+        server_timing: str | None = None,
+        perfilador: PerfiladorAmostragem | None = None,
+        vigia: VigiaRequisicoesLentas | None = None,
+    ) -> None:
         """
-        Processa requisição e adiciona metadados.
+        Inicializa middleware.
 
         Args:
-            request: Requisição HTTP recebida.
-            call_next: Próximo handler na cadeia.
+            app: Aplicação ASGI seguinte.
+            amostrador: Decide quais requisições logar (padrão: configuração).
+            resumo: Agregador por rota (padrão: configuração).
+            server_timing: "desligado", "cabecalho" ou "sempre" (padrão:
+                configuração).
+            perfilador: Perfilador de pilhas (padrão: configuração; None
+                se desligado).
+            vigia: Vigia de requisições lentas (padrão: configuração;
+                None se desligado).
+        """
+        self.app = app
+        self.amostrador = amostrador or AmostradorLogs(
+            fracao_padrao=configuracoes.log_amostragem,
+            fracoes_rotas=configuracoes.log_amostragem_rotas,
+            lento_ms=configuracoes.log_lento_ms,
+        )
+        self.resumo = resumo or ResumoRotas(configuracoes.log_resumo_intervalo)
+        self.server_timing = server_timing or configuracoes.server_timing
+        self.perfilador = perfilador or obter_perfilador()
+        self.vigia = vigia or obter_vigia()
 
-        Returns:
-            Response: Resposta com headers adicionais.
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
+        Processa requisição e adiciona metadados.
+
+        Args:
+            scope: Escopo ASGI da conexão.
+            receive: Canal de mensagens do cliente.
+            send: Canal de mensagens para o cliente.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Gerar ID único para rastreamento
         request_id = str(uuid.uuid4())
-        
-        # Adicionar request_id no state do request
-        request.state.request_id = request_id
-        
+
+        # Adicionar request_id no state do request (request.state.request_id)
+        scope.setdefault("state", {})["request_id"] = request_id
+
         # Adicionar request_id ao contexto do structlog
         structlog.contextvars.clear_contextvars()
         structlog.contextvars.bind_contextvars(
             request_id=request_id,
-            metodo=request.method,
-            path=request.url.path,
+            metodo=scope["method"],
+            path=scope["path"],
         )
-        
-        # Timestamp de início
-        inicio = time.time()
-        
-        # Log da requisição recebida
-        logger.info(
-            "requisicao_recebida",
-            query=str(request.url.query) if request.url.query else None,
-            client_ip=request.client.host if request.client else None,
-        )
-        
+
+        # Início (perf_counter: monotônico, não sofre ajustes do relógio)
+        inicio = time.perf_counter()
+
+        status_code = 500
+        duracao_ms = 0.0
+
+        # Medição por camada só quando pedida (desligada: nenhum custo)
+        tempos = token_tempos = None
+        if self.server_timing == "sempre" or (
+            self.server_timing == "cabecalho" and _pediu_server_timing(scope)
+        ):
+            tempos, token_tempos = iniciar_medicao()
+
+        sessao_perfil = None
+        if self.perfilador is not None and self.perfilador.deve_perfilar(scope):
+            sessao_perfil = self.perfilador.iniciar()
+
+        async def enviar(mensagem: Message) -> None:
+            nonlocal status_code, duracao_ms
+            if mensagem["type"] == "http.response.start":
+                status_code = mensagem["status"]
+                duracao_ms = (time.perf_counter() - inicio) * 1000
+
+                # Adicionar headers customizados
+                headers = MutableHeaders(scope=mensagem)
+                headers["X-Request-ID"] = request_id
+                headers["X-Response-Time"] = f"{duracao_ms:.2f}ms"
+                if tempos is not None:
+                    headers["Server-Timing"] = formatar_server_timing(tempos, duracao_ms)
+            await send(mensagem)
+
+        vigiada = None
+        if self.vigia is not None:
+            vigiada = self.vigia.registrar(request_id, scope["path"])
+
         # Processar requisição
+        EM_ANDAMENTO_HTTP.somar(1)
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, enviar)
         except Exception as exc:
             # Log de erro e re-raise para handlers tratarem
+            rota = _rota(scope)
+            duracao_ms = (time.perf_counter() - inicio) * 1000
+            self.resumo.registrar(rota, duracao_ms, True)
+            _registrar_metricas(rota, scope["method"], 500, duracao_ms)
             logger.error(
                 "erro_processamento_requisicao",
                 erro=str(exc),
@@ -90,22 +179,59 @@ class MiddlewareRequisicao(BaseHTTPMiddleware):
                 exc_info=True,
             )
             raise
-        
-        # Calcular tempo de resposta
-        duracao_ms = (time.time() - inicio) * 1000
-        
-        # Adicionar headers customizados
-        response.headers["X-Request-ID"] = request_id
-        response.headers["X-Response-Time"] = f"{duracao_ms:.2f}ms"
-        
-        # Log da resposta enviada
-        logger.info(
-            "resposta_enviada",
-            status_code=response.status_code,
-            duracao_ms=round(duracao_ms, 2),
-        )
-        
+        finally:
+            EM_ANDAMENTO_HTTP.somar(-1)
+            if token_tempos is not None:
+                encerrar_medicao(token_tempos)
+            if sessao_perfil is not None:
+                self.perfilador.encerrar(sessao_perfil, _rota(scope))
+            if vigiada is not None:
+                self.vigia.concluir(vigiada)
+
+        rota = _rota(scope)
+        self.resumo.registrar(rota, duracao_ms, status_code >= self.amostrador.status_erro)
+        _registrar_metricas(rota, scope["method"], status_code, duracao_ms)
+
+        # Log da resposta enviada (só se amostrada)
+        motivo = self.amostrador.motivo(rota, status_code, duracao_ms)
+        if motivo is not None:
+            query = scope.get("query_string", b"").decode("latin-1")
+            cliente = scope.get("client")
+            campos = {}
+            if tempos is not None:
+                campos["tempos_ms"] = {nome: round(ms, 2) for nome, ms in tempos.items()}
+            logger.info(
+                "resposta_enviada",
+                status_code=status_code,
+                duracao_ms=round(duracao_ms, 2),
+                rota=rota,
+                query=query or None,
+                client_ip=cliente[0] if cliente else None,
+                motivo=motivo,
+                **campos,
+            )
+
+        resumos = self.resumo.coletar()
+        if resumos:
+            for resumo in resumos:
+                logger.info("resumo_requisicoes", **resumo)
+
         # Limpar contexto
         structlog.contextvars.clear_contextvars()
-        
-        return response
+
+
+def _rota(scope: Scope) -> str:
+    """Template da rota atendida (ex.: /api/v1/projetos/{projeto_id})."""
+    rota = scope.get("route")
+    return getattr(rota, "path", None) or "<sem rota>"
+
+
+def _pediu_server_timing(scope: Scope) -> bool:
+    """Se a requisição trouxe o cabeçalho X-Server-Timing."""
+    return any(nome == b"x-server-timing" for nome, _ in scope["headers"])
+
+
+def _registrar_metricas(rota: str, metodo: str, status_code: int, duracao_ms: float) -> None:
+    """Conta a requisição e registra a duração (segundos) no histograma."""
+    REQUISICOES_HTTP.incrementar(rota, metodo, classe_status(status_code))
+    DURACAO_HTTP.observar(duracao_ms / 1000, rota)
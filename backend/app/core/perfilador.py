@@ -0,0 +1,299 @@
+"""
+Perfilador por amostragem de pilhas para requisições selecionadas.
+
+Perfila tráfego real sem redeploy: quando uma requisição é escolhida, uma
+thread de fundo lê a pilha da thread que a atende (sys._current_frames) a
+cada intervalo e conta pilhas iguais. Ao fim da requisição as contagens
+entram no agregado do template da rota (ex.: /api/v1/projetos/{projeto_id};
+caminhos sem rota caem todos em "<sem rota>"), escrito periodicamente em
+formato "collapsed stacks" (uma pilha por linha, frames separados por ";"
+e a contagem no fim), pronto para flamegraph.pl, speedscope ou inferno.
+
+Seleção (ambas opcionais):
+    - Cabeçalho `X-Perfil` com o valor de PERFIL_TOKEN.
+    - Fração por template de rota em PERFIL_ROTAS
+      (ex.: {"/api/v1/projetos/{projeto_id}": 0.01}).
+
+Sem token nem frações o perfilador não é criado e o middleware não faz
+nenhuma verificação extra.
+
+Limitação: o event loop atende várias requisições na mesma thread; as
+amostras de uma requisição async incluem o que outras corrotinas
+executaram enquanto ela estava ativa.
+"""
+
+import atexit
+import hmac
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Mapping
+
+from starlette.routing import Match
+from starlette.types import Scope
+
+from app.configuracao import configuracoes
+
+_CABECALHO = b"x-perfil"
+
+# Pilhas mais profundas são truncadas na raiz (frames do servidor/asyncio)
+_PROFUNDIDADE_MAXIMA = 128
+
+
+def pilha_colapsada(frame) -> str:
+    """
+    Converte a pilha de um frame em "raiz;...;folha".
+
+    Cada frame vira "modulo:funcao".
+
+    Args:
+        frame: Frame mais interno (de sys._current_frames()).
+    """
+    nomes: list[str] = []
+    while frame is not None and len(nomes) < _PROFUNDIDADE_MAXIMA:
+        codigo = frame.f_code
+        modulo = frame.f_globals.get("__name__", "?")
+        nomes.append(f"{modulo}:{codigo.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(nomes))
+
+
+def rota_correspondente(scope: Scope) -> str | None:
+    """
+    Template da rota que vai atender a requisição, antes do roteamento.
+
+    Args:
+        scope: Escopo ASGI (com a aplicação em scope["app"]).
+
+    Returns:
+        str | None: Ex.: "/api/v1/projetos/{projeto_id}"; None sem rota.
+    """
+    roteador = getattr(scope.get("app"), "router", None)
+    for rota in getattr(roteador, "routes", ()):
+        correspondencia, _ = rota.matches(scope)
+        if correspondencia == Match.FULL:
+            return getattr(rota, "path", None)
+    return None
+
+
+class SessaoPerfil:
+    """
+    Amostras de uma requisição perfilada.
+
+    Attributes:
+        id_thread: Thread amostrada (a que atende a requisição).
+        contagens: Pilha colapsada → amostras.
+    """
+
+    __slots__ = ("id_thread", "contagens")
+
+    def __init__(self, id_thread: int):
+        self.id_thread = id_thread
+        self.contagens: Counter[str] = Counter()
+
+
+class PerfiladorAmostragem:
+    """
+    Thread de amostragem + agregado por rota gravado em disco.
+
+    A thread só acorda enquanto há sessões ativas; entre perfis fica
+    parada em um Event.
+
+    Attributes:
+        diretorio: Onde os arquivos .folded são escritos.
+        intervalo: Segundos entre amostras.
+        intervalo_escrita: Segundos entre gravações do agregado.
+    """
+
+    def __init__(
+        self,
+        diretorio: str | Path,
+        token: str = "",
+        fracoes_rotas: Mapping[str, float] | None = None,
+        intervalo: float = 0.005,
+        intervalo_escrita: float = 10.0,
+        aleatorio: random.Random | None = None,
+    ):
+        """
+        Inicializa perfilador (a thread só sobe no primeiro perfil).
+
+        Args:
+            diretorio: Diretório dos arquivos de saída.
+            token: Valor aceito no cabeçalho X-Perfil (vazio desativa).
+            fracoes_rotas: Fração perfilada por template de rota.
+            intervalo: Segundos entre amostras.
+            intervalo_escrita: Segundos entre gravações do agregado.
+            aleatorio: Gerador (injetável em testes).
+        """
+        self.diretorio = Path(diretorio)
+        self.intervalo = intervalo
+        self.intervalo_escrita = intervalo_escrita
+        self._token = token.encode("latin-1")
+        self._fracoes = dict(fracoes_rotas or {})
+        self._aleatorio = aleatorio or random.Random()
+        self._sessoes: set[SessaoPerfil] = set()
+        self._agregado: dict[str, Counter[str]] = {}
+        self._alterados: set[str] = set()
+        self._trava = threading.Lock()
+        self._ativo = threading.Event()
+        self._parar = False
+        self._thread: threading.Thread | None = None
+
+    def deve_perfilar(self, scope: Scope) -> bool:
+        """
+        Decide se a requisição será perfilada.
+
+        As frações valem por template de rota, então
+        "/api/v1/projetos/{projeto_id}" cobre todos os projetos.
+
+        Args:
+            scope: Escopo ASGI (cabeçalhos, caminho e aplicação).
+        """
+        if self._token:
+            for nome, valor in scope["headers"]:
+                if nome == _CABECALHO:
+                    return hmac.compare_digest(valor, self._token)
+        if not self._fracoes:
+            return False
+        fracao = self._fracoes.get(rota_correspondente(scope))
+        return bool(fracao) and self._aleatorio.random() < fracao
+
+    def iniciar(self) -> SessaoPerfil:
+        """
+        Começa a amostrar a thread atual para a requisição.
+
+        Returns:
+            SessaoPerfil: Passar para `encerrar` ao fim da requisição.
+        """
+        sessao = SessaoPerfil(threading.get_ident())
+        with self._trava:
+            self._sessoes.add(sessao)
+            self._iniciar_thread()
+            self._ativo.set()
+        return sessao
+
+    def encerrar(self, sessao: SessaoPerfil, rota: str) -> None:
+        """
+        Para de amostrar a sessão e soma suas pilhas ao agregado da rota.
+
+        Args:
+            sessao: Retornada por `iniciar`.
+            rota: Template da rota atendida (chave do agregado e do
+                arquivo; número limitado, ao contrário dos caminhos).
+        """
+        with self._trava:
+            self._sessoes.discard(sessao)
+            if not self._sessoes:
+                self._ativo.clear()
+            if sessao.contagens:
+                self._agregado.setdefault(rota, Counter()).update(sessao.contagens)
+                self._alterados.add(rota)
+
+    def gravar(self) -> list[Path]:
+        """
+        Escreve os agregados alterados desde a última gravação.
+
+        Cada rota tem um arquivo por processo, reescrito por inteiro
+        (troca atômica), com o acumulado desde o início do processo.
+
+        Returns:
+            list[Path]: Arquivos escritos.
+        """
+        with self._trava:
+            alterados, self._alterados = self._alterados, set()
+            agregados = {c: dict(self._agregado[c]) for c in alterados}
+        escritos = []
+        for rota, contagens in agregados.items():
+            self.diretorio.mkdir(parents=True, exist_ok=True)
+            destino = self.diretorio / f"{_nome_arquivo(rota)}.{os.getpid()}.folded"
+            temporario = destino.with_suffix(".tmp")
+            temporario.write_text(
+                "".join(f"{pilha} {n}\n" for pilha, n in sorted(contagens.items())),
+                encoding="utf-8",
+            )
+            os.replace(temporario, destino)
+            escritos.append(destino)
+        return escritos
+
+    def encerrar_thread(self) -> None:
+        """Para a thread de amostragem e grava o que falta."""
+        with self._trava:
+            thread, self._thread = self._thread, None
+            self._parar = True
+        self._ativo.set()
+        if thread is not None:
+            thread.join(1.0)
+        self.gravar()
+
+    def _iniciar_thread(self) -> None:
+        """Sobe a thread na primeira sessão (chamado com a trava)."""
+        if self._thread is None:
+            self._parar = False
+            self._thread = threading.Thread(
+                target=self._amostrar, name="perfilador", daemon=True
+            )
+            self._thread.start()
+
+    def _amostrar(self) -> None:
+        """Laço da thread: amostra sessões ativas e grava periodicamente."""
+        proxima_escrita = time.monotonic() + self.intervalo_escrita
+        while True:
+            if not self._ativo.wait(self.intervalo_escrita):
+                self.gravar()
+                proxima_escrita = time.monotonic() + self.intervalo_escrita
+                continue
+            if self._parar:
+                return
+
+            frames = sys._current_frames()
+            with self._trava:
+                for sessao in self._sessoes:
+                    frame = frames.get(sessao.id_thread)
+                    if frame is not None:
+                        sessao.contagens[pilha_colapsada(frame)] += 1
+            del frames
+
+            if time.monotonic() >= proxima_escrita:
+                self.gravar()
+                proxima_escrita = time.monotonic() + self.intervalo_escrita
+            time.sleep(self.intervalo)
+
+
+def _nome_arquivo(rota: str) -> str:
+    """Template da rota em nome de arquivo ("/api/v1/projetos" → "api_v1_projetos")."""
+    return re.sub(r"[^A-Za-z0-9_-]+", "_", rota).strip("_") or "raiz"
+
+
+_perfilador_global: PerfiladorAmostragem | None = None
+
+
+def obter_perfilador() -> PerfiladorAmostragem | None:
+    """
+    Retorna o perfilador do processo conforme a configuração.
+
+    Returns:
+        None se PERFIL_TOKEN e PERFIL_ROTAS estão vazios (desligado).
+    """
+    global _perfilador_global
+    if not configuracoes.perfil_token and not configuracoes.perfil_rotas:
+        return None
+    if _perfilador_global is None:
+        _perfilador_global = PerfiladorAmostragem(
+            configuracoes.perfil_diretorio,
+            token=configuracoes.perfil_token,
+            fracoes_rotas=configuracoes.perfil_rotas,
+            intervalo=configuracoes.perfil_intervalo_ms / 1000,
+        )
+        atexit.register(encerrar_perfilador)
+    return _perfilador_global
+
+
+def encerrar_perfilador() -> None:
+    """Para a amostragem e grava os agregados (shutdown/atexit)."""
+    if _perfilador_global is not None:
+        _perfilador_global.encerrar_thread()
@@ -0,0 +1,88 @@
+"""
+Medição de tempo por camada para o cabeçalho Server-Timing.
+
+O middleware abre uma medição por requisição (dict em uma ContextVar) e
+cada camada marca seu trecho com `medir(nome)`. Trechos com o mesmo nome
+somam; trechos aninhados são inclusivos (caso_uso inclui repositorio).
+
+Sem medição ativa, `medir` só lê a ContextVar e devolve um context
+manager nulo compartilhado: nada é alocado nem cronometrado.
+
+Example:
+    >>> with medir("repositorio"):
+    ...     dados = repositorio.obter_projetos()
+"""
+
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar, Token
+from typing import ContextManager
+
+_tempos: ContextVar[dict[str, float] | None] = ContextVar("tempos", default=None)
+
+_NULO = nullcontext()
+
+
+class _Trecho:
+    """Cronometra um trecho e soma a duração (ms) em tempos[nome]."""
+
+    __slots__ = ("_tempos", "_nome", "_inicio")
+
+    def __init__(self, tempos: dict[str, float], nome: str):
+        self._tempos = tempos
+        self._nome = nome
+
+    def __enter__(self) -> None:
+        self._inicio = time.perf_counter()
+
+    def __exit__(self, *excecao: object) -> None:
+        duracao = (time.perf_counter() - self._inicio) * 1000
+        self._tempos[self._nome] = self._tempos.get(self._nome, 0.0) + duracao
+
+
+def medir(nome: str) -> ContextManager[None]:
+    """
+    Marca um trecho da requisição atual.
+
+    Args:
+        nome: Nome no Server-Timing (token: letras, dígitos, _ e -).
+
+    Returns:
+        Context manager que cronometra o trecho, ou nulo sem medição ativa.
+    """
+    tempos = _tempos.get()
+    if tempos is None:
+        return _NULO
+    return _Trecho(tempos, nome)
+
+
+def iniciar_medicao() -> tuple[dict[str, float], Token]:
+    """
+    Ativa a medição no contexto atual.
+
+    Returns:
+        Dict que acumula os tempos (ms) e token para `encerrar_medicao`.
+    """
+    tempos: dict[str, float] = {}
+    return tempos, _tempos.set(tempos)
+
+
+def encerrar_medicao(token: Token) -> None:
+    """Desativa a medição aberta por `iniciar_medicao`."""
+    _tempos.reset(token)
+
+
+def formatar_server_timing(tempos: dict[str, float], total_ms: float) -> str:
+    """
+    Monta o valor do cabeçalho Server-Timing.
+
+    Args:
+        tempos: Duração (ms) por trecho.
+        total_ms: Duração da requisição até o início da resposta.
+
+    Returns:
+        str: Ex.: "repositorio;dur=0.41, serializacao;dur=0.12, total;dur=1.9".
+    """
+    metricas = [f"{nome};dur={duracao:.2f}" for nome, duracao in tempos.items()]
+    metricas.append(f"total;dur={total_ms:.2f}")
+    return ", ".join(metricas)
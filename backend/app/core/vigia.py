@@ -0,0 +1,200 @@
+"""
+Vigia de requisições lentas com captura de pilhas.
+
+O middleware registra cada requisição ao começar e a remove ao terminar.
+Uma thread de fundo verifica periodicamente as requisições em andamento;
+a primeira vez que uma passa do limite, captura as pilhas da thread do
+event loop que a atende e das threads do threadpool (handlers síncronos,
+I/O via anyio.to_thread) e loga tudo uma vez, com o request_id.
+
+Como roda em thread própria, a captura acontece mesmo quando o event
+loop está travado em I/O bloqueante: a pilha mostra a chamada presa.
+"""
+
+import atexit
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+
+import structlog
+
+from app.configuracao import configuracoes
+
+logger = structlog.get_logger(__name__)
+
+# Nome das threads de trabalho do anyio (run_in_threadpool / to_thread)
+_PREFIXO_THREADPOOL = "AnyIO worker thread"
+
+
+@dataclass(eq=False)
+class RequisicaoVigiada:
+    """
+    Requisição em andamento.
+
+    Attributes:
+        request_id: ID gerado pelo MiddlewareRequisicao.
+        path: Caminho da requisição.
+        id_thread: Thread que atende a requisição (event loop).
+        inicio: Instante de início (time.monotonic).
+        reportada: Se as pilhas já foram logadas.
+    """
+
+    request_id: str
+    path: str
+    id_thread: int
+    inicio: float = field(default_factory=time.monotonic)
+    reportada: bool = False
+
+
+def _formatar_pilha(frame) -> list[str]:
+    """Pilha do frame como linhas "arquivo:linha função: código"."""
+    return [
+        f"{quadro.filename}:{quadro.lineno} {quadro.name}: {quadro.line}"
+        for quadro in traceback.extract_stack(frame)
+    ]
+
+
+def _ocioso(frame) -> bool:
+    """Se a thread do threadpool está só esperando trabalho na fila."""
+    while frame is not None and frame.f_globals.get("__name__") in ("threading", "queue"):
+        frame = frame.f_back
+    return (
+        frame is not None
+        and frame.f_globals.get("__name__", "").startswith("anyio.")
+        and frame.f_code.co_name == "run"
+    )
+
+
+class VigiaRequisicoesLentas:
+    """
+    Thread que loga pilhas de requisições acima do limite.
+
+    Attributes:
+        limite_ms: Duração a partir da qual a requisição é reportada.
+        intervalo: Segundos entre verificações.
+    """
+
+    def __init__(self, limite_ms: float, intervalo: float | None = None):
+        """
+        Inicializa vigia (a thread só sobe na primeira requisição).
+
+        Args:
+            limite_ms: Limite de lentidão (ms).
+            intervalo: Segundos entre verificações (padrão: 1/4 do limite,
+                entre 10 ms e 1 s).
+        """
+        self.limite_ms = limite_ms
+        self.intervalo = intervalo or min(max(limite_ms / 4000, 0.01), 1.0)
+        self._ativas: set[RequisicaoVigiada] = set()
+        self._trava = threading.Lock()
+        self._parar = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def registrar(self, request_id: str, path: str) -> RequisicaoVigiada:
+        """
+        Passa a vigiar uma requisição da thread atual.
+
+        Args:
+            request_id: ID da requisição.
+            path: Caminho da requisição.
+
+        Returns:
+            RequisicaoVigiada: Passar para `concluir` ao fim.
+        """
+        requisicao = RequisicaoVigiada(request_id, path, threading.get_ident())
+        with self._trava:
+            self._ativas.add(requisicao)
+            if self._thread is None:
+                self._parar.clear()
+                self._thread = threading.Thread(
+                    target=self._vigiar, name="vigia-lentas", daemon=True
+                )
+                self._thread.start()
+        return requisicao
+
+    def concluir(self, requisicao: RequisicaoVigiada) -> None:
+        """Para de vigiar a requisição."""
+        with self._trava:
+            self._ativas.discard(requisicao)
+
+    def verificar(self) -> list[RequisicaoVigiada]:
+        """
+        Reporta requisições que passaram do limite e ainda não foram logadas.
+
+        Returns:
+            list[RequisicaoVigiada]: Requisições reportadas nesta verificação.
+        """
+        limite = time.monotonic() - self.limite_ms / 1000
+        with self._trava:
+            lentas = [
+                r for r in self._ativas if not r.reportada and r.inicio <= limite
+            ]
+            for requisicao in lentas:
+                requisicao.reportada = True
+        if not lentas:
+            return []
+
+        frames = sys._current_frames()
+        nomes = {t.ident: t.name for t in threading.enumerate()}
+        threadpool = {
+            nome: _formatar_pilha(frames[ident])
+            for ident, nome in nomes.items()
+            if nome.startswith(_PREFIXO_THREADPOOL)
+            and ident in frames
+            and not _ocioso(frames[ident])
+        }
+        for requisicao in lentas:
+            frame = frames.get(requisicao.id_thread)
+            logger.warning(
+                "requisicao_lenta",
+                request_id=requisicao.request_id,
+                path=requisicao.path,
+                decorrido_ms=round((time.monotonic() - requisicao.inicio) * 1000, 2),
+                limite_ms=self.limite_ms,
+                pilha_event_loop=_formatar_pilha(frame) if frame is not None else [],
+                pilhas_threadpool=threadpool,
+            )
+        return lentas
+
+    def encerrar(self) -> None:
+        """Para a thread de verificação."""
+        with self._trava:
+            thread, self._thread = self._thread, None
+        self._parar.set()
+        if thread is not None:
+            thread.join(1.0)
+
+    def _vigiar(self) -> None:
+        """Laço da thread: verifica a cada intervalo até encerrar."""
+        while not self._parar.wait(self.intervalo):
+            try:
+                self.verificar()
+            except Exception:  # pragma: no cover - nunca derrubar a thread
+                logger.exception("erro_vigia_requisicoes")
+
+
+_vigia_global: VigiaRequisicoesLentas | None = None
+
+
+def obter_vigia() -> VigiaRequisicoesLentas | None:
+    """
+    Retorna o vigia do processo conforme a configuração.
+
+    Returns:
+        None se VIGIA_LENTO_MS é 0 (desligado).
+    """
+    global _vigia_global
+    if not configuracoes.vigia_lento_ms:
+        return None
+    if _vigia_global is None:
+        _vigia_global = VigiaRequisicoesLentas(configuracoes.vigia_lento_ms)
+        atexit.register(encerrar_vigia)
+    return _vigia_global
+
+
+def encerrar_vigia() -> None:
+    """Para a thread do vigia (shutdown/atexit)."""
+    if _vigia_global is not None:
+        _vigia_global.encerrar()
@@ -4,7 +4,8 @@ Entidade de domínio: Mensagem de contato.
 Representa uma mensagem enviada pelo formulário de contato.
 """
 
-from dataclasses import dataclass
+import uuid
+from dataclasses import dataclass, field
 
 
 @dataclass(frozen=True)
@@ -17,6 +18,8 @@ class Mensagem:
         email: Email para resposta.
         assunto: Assunto da mensagem.
         mensagem: Conteúdo da mensagem.
+        id: Identificador gerado na criação; devolvido ao cliente para
+            rastreamento e usado como chave de idempotência na entrega.
 
     A classe é imutável (frozen=True) para garantir consistência dos dados.
     """
@@ -25,6 +28,7 @@ class Mensagem:
     email: str
     assunto: str
     mensagem: str
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
 
     def para_email_texto(self) -> str:
         """
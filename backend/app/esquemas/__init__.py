@@ -13,8 +13,14 @@ Schemas são diferentes de Entidades:
 
 from app.esquemas.saude import RespostaSaude
 from app.esquemas.sobre import RespostaSobre
-from app.esquemas.projetos import ProjetoResumo, ProjetoDetalhado, RespostaProjetos
-from app.esquemas.stack import ItemStack, RespostaStack
+from app.esquemas.projetos import (
+    ProjetoResumo,
+    ProjetoDetalhado,
+    RespostaProjetos,
+    ProjetoEncontrado,
+    RespostaBuscaProjetos,
+)
+from app.esquemas.stack import ItemStack, RespostaStack, RespostaStackCompacta
 from app.esquemas.experiencias import Experiencia, RespostaExperiencias
 from app.esquemas.contato import RequisicaoContato, RespostaContato
 
@@ -24,8 +30,11 @@ __all__ = [
     "ProjetoResumo",
     "ProjetoDetalhado",
     "RespostaProjetos",
+    "ProjetoEncontrado",
+    "RespostaBuscaProjetos",
     "ItemStack",
     "RespostaStack",
+    "RespostaStackCompacta",
     "Experiencia",
     "RespostaExperiencias",
     "RequisicaoContato",
@@ -50,17 +50,23 @@ class RespostaContato(BaseModel):
     Resposta após envio de mensagem.
 
     Attributes:
-        sucesso: Se a mensagem foi enviada com sucesso.
+        sucesso: Se a mensagem foi aceita para envio.
         mensagem: Descrição do resultado.
+        id: Identificador de rastreamento da mensagem.
     """
 
     sucesso: bool = Field(
         ...,
         examples=[True],
-        description="Se o envio foi bem-sucedido",
+        description="Se a mensagem foi aceita para envio",
     )
     mensagem: str = Field(
         ...,
-        examples=["Mensagem enviada com sucesso!"],
+        examples=["Mensagem recebida! Retornarei em breve."],
         description="Descrição do resultado",
+    )
+    id: str = Field(
+        ...,
+        examples=["3f2a9c1e5b7d4e0f8a6b2c4d1e3f5a7b"],
+        description="Identificador de rastreamento da mensagem",
     )
\ No newline at end of file
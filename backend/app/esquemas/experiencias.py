@@ -80,7 +80,7 @@ class RespostaExperiencias(BaseModel):
 
     Attributes:
         experiencias: Lista de experiências ordenadas por data.
-        total: Quantidade total de experiências.
+        total: Quantidade de experiências (após filtro de tecnologia).
     """
 
     experiencias: list[Experiencia] = Field(
@@ -91,5 +91,5 @@ class RespostaExperiencias(BaseModel):
         ...,
         ge=0,
         examples=[2],
-        description="Total de experiências",
+        description="Total de experiências que atendem ao filtro",
     )
\ No newline at end of file
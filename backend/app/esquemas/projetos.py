@@ -108,8 +108,9 @@ class RespostaProjetos(BaseModel):
     Resposta da listagem de projetos.
 
     Attributes:
-        projetos: Lista de projetos resumidos.
-        total: Quantidade total de projetos.
+        projetos: Lista de projetos resumidos (página atual).
+        total: Quantidade total de projetos (após filtro de tecnologia).
+        proximo_cursor: Cursor para a próxima página (None se última).
     """
 
     projetos: list[ProjetoResumo] = Field(
@@ -120,5 +121,52 @@ class RespostaProjetos(BaseModel):
         ...,
         ge=0,
         examples=[3],
-        description="Total de projetos",
-    )
\ No newline at end of file
+        description="Total de projetos que atendem ao filtro",
+    )
+    proximo_cursor: str | None = Field(
+        default=None,
+        examples=["WyJmYWxzZSIsIlBvcnRmb2xpbyBBUEkiLCJwb3J0Zm9saW8tYXBpIl0"],
+        description="Cursor para buscar a próxima página (None se última)",
+    )
+
+
+class ProjetoEncontrado(ProjetoResumo):
+    """
+    Projeto retornado pela busca textual.
+
+    Usado no endpoint GET /api/projetos/busca.
+    """
+
+    pontuacao: float = Field(
+        ...,
+        ge=0,
+        examples=[1.2345],
+        description="Relevância BM25 (maior é mais relevante)",
+    )
+
+
+class RespostaBuscaProjetos(BaseModel):
+    """
+    Resposta da busca textual em projetos.
+
+    Attributes:
+        consulta: Texto buscado.
+        resultados: Projetos ordenados por relevância.
+        total: Quantidade de resultados retornados.
+    """
+
+    consulta: str = Field(
+        ...,
+        examples=["clean architecture"],
+        description="Texto buscado",
+    )
+    resultados: list[ProjetoEncontrado] = Field(
+        ...,
+        description="Projetos ordenados por relevância",
+    )
+    total: int = Field(
+        ...,
+        ge=0,
+        examples=[2],
+        description="Quantidade de resultados retornados",
+    )
@@ -12,16 +12,17 @@ class RespostaSaude(BaseModel):
     Schema de resposta do health check.
 
     Attributes:
-        status: Status da API ("ok" ou "erro").
+        status: Status da API ("ok", "degradado" ou "erro").
         mensagem: Descrição legível do status.
         versao_api: Versão da API.
         ambiente: Ambiente de execução.
         uptime_segundos: Tempo desde inicialização (opcional).
+        disjuntores: Estado do disjuntor de cada dependência externa.
     """
 
     status: str = Field(
         ...,
-        examples=["ok"],
+        examples=["ok", "degradado"],
         description="Status da API",
     )
     mensagem: str = Field(
@@ -43,4 +44,10 @@ class RespostaSaude(BaseModel):
         default=None,
         examples=[3600],
         description="Tempo desde inicialização em segundos",
+    )
+    disjuntores: dict[str, str] = Field(
+        default_factory=dict,
+        examples=[{"formspree": "fechado"}],
+        description="Estado do disjuntor por dependência "
+                    "(fechado, aberto ou meio_aberto)",
     )
\ No newline at end of file
@@ -73,4 +73,21 @@ class RespostaStack(BaseModel):
     por_categoria: dict[str, list[ItemStack]] = Field(
         ...,
         description="Tecnologias agrupadas por categoria",
-    )
\ No newline at end of file
+    )
+
+
+class RespostaStackCompacta(BaseModel):
+    """
+    Resposta de /api/stack?formato=compacto.
+
+    Traz só a visão agrupada; a lista completa é a concatenação dos
+    grupos, na ordem das chaves.
+
+    Attributes:
+        por_categoria: Tecnologias agrupadas por categoria.
+    """
+
+    por_categoria: dict[str, list[ItemStack]] = Field(
+        ...,
+        description="Tecnologias agrupadas por categoria",
+    )
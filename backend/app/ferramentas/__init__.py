@@ -0,0 +1,9 @@
+"""
+Ferramentas de linha de comando (build e manutenção).
+
+Responsabilidade:
+- Preparar artefatos de dados para produção
+- Rodar fora do ciclo de requisições HTTP
+
+Uso: python -m app.ferramentas.<ferramenta> --help
+"""
@@ -0,0 +1,161 @@
+"""
+Ferramenta: compilar dados/*.json em um bundle binário.
+
+Valida os quatro arquivos contra as entidades e os schemas da API e grava
+um único arquivo lido por RepositorioBundle.
+
+Uso:
+    python -m app.ferramentas.compilar_dados
+    python -m app.ferramentas.compilar_dados --dados dados --saida dados/portfolio.bundle
+"""
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from app.adaptadores.repositorio import RepositorioJSON, SnapshotPortfolio
+from app.adaptadores.repositorio_bundle import serializar_bundle
+from app.core.excecoes import ErroValidacao
+from app.esquemas.sobre import RespostaSobre
+from app.esquemas.projetos import ProjetoDetalhado
+from app.esquemas.stack import ItemStack
+from app.esquemas.experiencias import Experiencia
+
+
+def _validar_modelo(
+    modelo: type[BaseModel],
+    dados: dict,
+    origem: str,
+    erros: list[str],
+) -> None:
+    """Valida dados contra schema, acumulando mensagens de erro."""
+    try:
+        modelo.model_validate(dados)
+    except ValidationError as exc:
+        for erro in exc.errors():
+            campo = ".".join(str(loc) for loc in erro["loc"])
+            erros.append(f"{origem}: {campo}: {erro['msg']}")
+
+
+def validar_dados(diretorio_dados: str | Path) -> SnapshotPortfolio:
+    """
+    Carrega e valida todos os arquivos de dados.
+
+    Args:
+        diretorio_dados: Pasta com sobre, projetos, stack e experiencias JSON.
+
+    Returns:
+        SnapshotPortfolio: Dados convertidos em entidades.
+
+    Raises:
+        ErroValidacao: Com todas as inconsistências encontradas.
+    """
+    try:
+        snapshot = RepositorioJSON(
+            diretorio_dados,
+            intervalo_verificacao=0,
+        ).obter_snapshot()
+    except (OSError, json.JSONDecodeError, KeyError, ValueError, TypeError) as exc:
+        raise ErroValidacao(
+            f"Não foi possível ler os dados: {type(exc).__name__}: {exc}",
+            codigo="DADOS_INVALIDOS",
+        ) from exc
+
+    erros: list[str] = []
+    _validar_modelo(RespostaSobre, dict(snapshot.sobre), "sobre.json", erros)
+    for projeto in snapshot.projetos:
+        _validar_modelo(
+            ProjetoDetalhado,
+            asdict(projeto),
+            f"projetos.json[{projeto.id}]",
+            erros,
+        )
+    for indice, item in enumerate(snapshot.stack):
+        _validar_modelo(ItemStack, dict(item), f"stack.json[{indice}]", erros)
+    for experiencia in snapshot.experiencias:
+        _validar_modelo(
+            Experiencia,
+            asdict(experiencia),
+            f"experiencias.json[{experiencia.id}]",
+            erros,
+        )
+    for projeto_id in snapshot.ids_duplicados:
+        erros.append(f"projetos.json: id duplicado '{projeto_id}'")
+
+    if erros:
+        raise ErroValidacao(
+            "Dados inválidos:\n  " + "\n  ".join(erros),
+            codigo="DADOS_INVALIDOS",
+        )
+    return snapshot
+
+
+def compilar(diretorio_dados: str | Path, caminho_saida: str | Path) -> int:
+    """
+    Valida os dados e grava o bundle de forma atômica.
+
+    Args:
+        diretorio_dados: Pasta com os arquivos JSON.
+        caminho_saida: Caminho do bundle a gerar.
+
+    Returns:
+        int: Tamanho do bundle gerado em bytes.
+
+    Raises:
+        ErroValidacao: Se os dados não passam na validação.
+    """
+    snapshot = validar_dados(diretorio_dados)
+    conteudo = serializar_bundle(
+        sobre=dict(snapshot.sobre),
+        projetos=snapshot.projetos,
+        stack=tuple(dict(item) for item in snapshot.stack),
+        experiencias=snapshot.experiencias,
+    )
+
+    # Gravar em arquivo temporário e renomear: leitores nunca veem bundle parcial
+    destino = Path(caminho_saida)
+    temporario = destino.with_name(destino.name + ".tmp")
+    temporario.write_bytes(conteudo)
+    os.replace(temporario, destino)
+    return len(conteudo)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Ponto de entrada da linha de comando.
+
+    Args:
+        argv: Argumentos (padrão: sys.argv[1:]).
+
+    Returns:
+        int: Código de saída (0 sucesso, 1 dados inválidos).
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m app.ferramentas.compilar_dados",
+        description="Valida dados/*.json e gera bundle binário para RepositorioBundle.",
+    )
+    parser.add_argument("--dados", default="dados", help="Pasta com os arquivos JSON")
+    parser.add_argument(
+        "--saida",
+        default="dados/portfolio.bundle",
+        help="Caminho do bundle gerado",
+    )
+    argumentos = parser.parse_args(argv)
+
+    try:
+        tamanho = compilar(argumentos.dados, argumentos.saida)
+    except ErroValidacao as exc:
+        print(exc.mensagem, file=sys.stderr)
+        return 1
+
+    print(f"Bundle gerado: {argumentos.saida} ({tamanho} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+Ferramenta: importar dados/*.json para o banco SQLite.
+
+Valida os arquivos (mesmas regras de compilar_dados) e substitui o
+conteúdo do banco usado por RepositorioSQLite em uma única transação.
+
+Uso:
+    python -m app.ferramentas.importar_sqlite
+    python -m app.ferramentas.importar_sqlite --dados dados --banco dados/portfolio.db
+"""
+
+import argparse
+import sys
+
+from app.adaptadores.repositorio_sqlite import importar_snapshot
+from app.core.excecoes import ErroValidacao
+from app.ferramentas.compilar_dados import validar_dados
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Ponto de entrada da linha de comando.
+
+    Args:
+        argv: Argumentos (padrão: sys.argv[1:]).
+
+    Returns:
+        int: Código de saída (0 sucesso, 1 dados inválidos).
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m app.ferramentas.importar_sqlite",
+        description="Valida dados/*.json e importa para o banco de RepositorioSQLite.",
+    )
+    parser.add_argument("--dados", default="dados", help="Pasta com os arquivos JSON")
+    parser.add_argument(
+        "--banco",
+        default="dados/portfolio.db",
+        help="Arquivo SQLite de destino",
+    )
+    argumentos = parser.parse_args(argv)
+
+    try:
+        snapshot = validar_dados(argumentos.dados)
+    except ErroValidacao as exc:
+        print(exc.mensagem, file=sys.stderr)
+        return 1
+
+    versao = importar_snapshot(argumentos.banco, snapshot)
+    print(
+        f"Banco atualizado: {argumentos.banco} (versão {versao}, "
+        f"{len(snapshot.projetos)} projetos, "
+        f"{len(snapshot.experiencias)} experiências)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,16 +14,51 @@ Arquitetura: Clean Architecture simplificada
 - Controllers (HTTP) → Use Cases (lógica) → Entities (domínio) → Adapters (externos)
 """
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.adaptadores.sink_log import encerrar_sink
+from app.core.perfilador import encerrar_perfilador
+from app.core.vigia import encerrar_vigia
 from app.configuracao import configuracoes
-from app.controladores import roteador_saude, roteador_api, roteador_contato
+from app.controladores import (
+    roteador_saude,
+    roteador_api,
+    roteador_contato,
+    roteador_metricas,
+    iniciar_contato,
+    encerrar_contato,
+    encerrar_api,
+)
 from app.controladores.v1 import roteador_v1
 from app.core.middleware import MiddlewareRequisicao
 from app.core.handlers import registrar_handlers_excecao
 
 
+@asynccontextmanager
+async def _ciclo_de_vida(aplicacao: FastAPI) -> AsyncIterator[None]:
+    """
+    Inicialização e encerramento da aplicação.
+
+    Na inicialização, abre o cliente HTTP compartilhado do contato. No
+    encerramento, fecha esse cliente e as conexões do repositório, grava
+    os perfis pendentes e escreve os logs ainda na fila do sink assíncrono.
+
+    Args:
+        aplicacao: Instância FastAPI.
+    """
+    await iniciar_contato()
+    yield
+    await encerrar_contato()
+    encerrar_api()
+    encerrar_vigia()
+    encerrar_perfilador()
+    encerrar_sink()
+
+
 def criar_aplicacao() -> FastAPI:
     """
     Cria e configura a aplicação FastAPI.
@@ -49,6 +84,7 @@ def criar_aplicacao() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_tags=_obter_tags_openapi(),
+        lifespan=_ciclo_de_vida,
     )
 
     _configurar_cors(aplicacao)
@@ -102,6 +138,7 @@ def _obter_descricao_api() -> str:
     ## Headers Customizados
     - `X-Request-ID`: ID único para rastreamento
     - `X-Response-Time`: Tempo de resposta em ms
+    - `Server-Timing`: Tempo por camada (se SERVER_TIMING estiver ativo)
     """
 
 
@@ -147,6 +184,7 @@ def _configurar_cors(aplicacao: FastAPI) -> None:
         allow_credentials=False,
         allow_methods=["GET", "POST", "OPTIONS"],
         allow_headers=["*"],
+        expose_headers=["ETag", "Server-Timing"],
     )
 
 
@@ -182,11 +220,14 @@ def _registrar_rotas(aplicacao: FastAPI) -> None:
 
     Rotas registradas:
         - /saude: Health check (sem prefixo)
+        - /metrics: Métricas Prometheus (se METRICAS_HABILITADAS)
         - /api/v1/*: API versionada (recomendado)
         - /api/*: Rotas legadas (retrocompatibilidade)
     """
     # Health check (sem prefixo, usado por probes)
     aplicacao.include_router(roteador_saude)
+    if configuracoes.metricas_habilitadas:
+        aplicacao.include_router(roteador_metricas)
     
     # API v1 (recomendado)
     aplicacao.include_router(roteador_v1, prefix="/api")
@@ -0,0 +1 @@
+"""Benchmarks de desempenho (não fazem parte da suíte de testes)."""
@@ -0,0 +1,140 @@
+"""
+Benchmark: cliente HTTP compartilhado vs. um AsyncClient por envio.
+
+Sobe um servidor local que imita o Formspree (HTTP/1.1 com keep-alive,
+responde 200 a qualquer POST) e mede a latência média por envio:
+
+- legado: `async with httpx.AsyncClient()` a cada mensagem (novo pool e
+  nova conexão TCP por envio);
+- compartilhado: FormspreeEmailAdaptador com o cliente aberto uma vez.
+
+Localmente não há TLS: o legado paga a criação do cliente (que carrega
+o contexto SSL padrão) e uma conexão TCP por envio. Contra o Formspree
+real soma-se ainda o handshake TLS de cada envio.
+
+Uso (a partir de backend/):
+    python -m benchmarks.bench_email [--envios 500]
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from app.adaptadores.email_adaptador import FormspreeEmailAdaptador
+from app.entidades.mensagem import Mensagem
+
+_RESPOSTA = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: 11\r\n"
+    b"\r\n"
+    b'{"ok":true}'
+)
+
+
+class ServidorFormspreeLocal:
+    """Servidor HTTP mínimo com keep-alive; conta conexões aceitas."""
+
+    def __init__(self) -> None:
+        self.conexoes = 0
+        self._servidor: asyncio.Server | None = None
+
+    async def iniciar(self) -> str:
+        """Escuta em porta livre e retorna a URL base."""
+        self._servidor = await asyncio.start_server(self._atender, "127.0.0.1", 0)
+        porta = self._servidor.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{porta}/f"
+
+    async def encerrar(self) -> None:
+        """Para de aceitar conexões."""
+        self._servidor.close()
+        await self._servidor.wait_closed()
+
+    async def _atender(self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        self.conexoes += 1
+        try:
+            while True:
+                cabecalhos = await leitor.readuntil(b"\r\n\r\n")
+                tamanho = 0
+                for linha in cabecalhos.split(b"\r\n"):
+                    nome, _, valor = linha.partition(b":")
+                    if nome.strip().lower() == b"content-length":
+                        tamanho = int(valor)
+                await leitor.readexactly(tamanho)
+                escritor.write(_RESPOSTA)
+                await escritor.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            escritor.close()
+
+
+_MENSAGEM = Mensagem(
+    nome="Maria Silva",
+    email="maria@example.com",
+    assunto="Benchmark",
+    mensagem="Mensagem de teste do benchmark de envio.",
+)
+
+
+async def _legado(url: str) -> bool:
+    """Envio como antes: um AsyncClient novo por mensagem."""
+    async with httpx.AsyncClient() as cliente:
+        resposta = await cliente.post(
+            url,
+            json={
+                "nome": _MENSAGEM.nome,
+                "email": _MENSAGEM.email,
+                "assunto": _MENSAGEM.assunto,
+                "mensagem": _MENSAGEM.mensagem,
+            },
+            timeout=10.0,
+        )
+        return resposta.status_code in range(200, 300)
+
+
+async def _medir(enviar, envios: int) -> float:
+    """Retorna milissegundos médios por envio (sequencial)."""
+    await enviar()
+    inicio = time.perf_counter()
+    for _ in range(envios):
+        assert await enviar()
+    return (time.perf_counter() - inicio) / envios * 1000
+
+
+async def _executar(envios: int) -> None:
+    servidor = ServidorFormspreeLocal()
+    base = await servidor.iniciar()
+    adaptador = FormspreeEmailAdaptador(base, "benchmark")
+    adaptador.iniciar()
+    try:
+        antes = servidor.conexoes
+        legado = await _medir(lambda: _legado(adaptador.url_endpoint), envios)
+        conexoes_legado = servidor.conexoes - antes
+
+        antes = servidor.conexoes
+        compartilhado = await _medir(lambda: adaptador.enviar_mensagem(_MENSAGEM), envios)
+        conexoes_compartilhado = servidor.conexoes - antes
+    finally:
+        await adaptador.fechar()
+        await servidor.encerrar()
+
+    print(f"{'':<20}{'ms/envio':>10}{'conexões':>10}")
+    print(f"{'AsyncClient/envio':<20}{legado:>10.3f}{conexoes_legado:>10}")
+    print(f"{'compartilhado':<20}{compartilhado:>10.3f}{conexoes_compartilhado:>10}")
+    print(f"{'ganho':<20}{legado / compartilhado:>9.2f}x")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Executa o benchmark e imprime latência por envio e conexões abertas."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--envios", type=int, default=500)
+    args = parser.parse_args(argv)
+    asyncio.run(_executar(args.envios))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
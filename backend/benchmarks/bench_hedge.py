@@ -0,0 +1,91 @@
+"""
+Benchmark: latência de cauda do envio com e sem hedge.
+
+Dois provedores locais simulados com a mesma distribuição de latência:
+na maioria dos envios ~20 ms, mas 5% demoram ~1 s (fila do provedor,
+retransmissão TCP). Compara:
+
+- um provedor: DisjuntorEmailAdaptador só com o principal;
+- hedge: MultiProvedorEmailAdaptador com principal e reserva.
+
+Imprime p50/p95/p99 por envio e a fração de envios que foram também à
+reserva (tráfego extra).
+
+Uso (a partir de backend/):
+    python -m benchmarks.bench_hedge [--envios 400] [--concorrencia 20]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from app.adaptadores.email_adaptador import EmailAdaptador, MultiProvedorEmailAdaptador
+from app.entidades.mensagem import Mensagem
+
+
+class ProvedorSimulado(EmailAdaptador):
+    """Responde após uma latência sorteada (cauda pesada); conta envios."""
+
+    def __init__(self, semente: int) -> None:
+        self.envios = 0
+        self._aleatorio = random.Random(semente)
+
+    async def enviar_mensagem(self, mensagem: Mensagem) -> bool:
+        self.envios += 1
+        lento = self._aleatorio.random() < 0.05
+        await asyncio.sleep(1.0 if lento else self._aleatorio.uniform(0.015, 0.025))
+        return True
+
+
+def _percentil(valores: list[float], p: float) -> float:
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p / 100))]
+
+
+async def _medir(adaptador: EmailAdaptador, envios: int, concorrencia: int) -> list[float]:
+    """Latências (ms) de `envios` mensagens, `concorrencia` por vez."""
+    limite = asyncio.Semaphore(concorrencia)
+    latencias: list[float] = []
+
+    async def enviar(i: int) -> None:
+        async with limite:
+            inicio = time.perf_counter()
+            assert await adaptador.enviar_mensagem(
+                Mensagem("Maria", "maria@example.com", f"Benchmark {i}", "Olá")
+            )
+            latencias.append((time.perf_counter() - inicio) * 1000)
+
+    await asyncio.gather(*(enviar(i) for i in range(envios)))
+    return latencias
+
+
+async def _executar(envios: int, concorrencia: int) -> None:
+    unico = await _medir(ProvedorSimulado(1), envios, concorrencia)
+
+    principal, reserva = ProvedorSimulado(1), ProvedorSimulado(2)
+    # atraso_inicial baixo: o benchmark é curto para aquecer o percentil
+    composto = MultiProvedorEmailAdaptador([principal, reserva], atraso_inicial=0.05)
+    hedge = await _medir(composto, envios, concorrencia)
+
+    print(f"{'':<20}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for nome, latencias in (("um provedor", unico), ("hedge", hedge)):
+        print(
+            f"{nome:<20}"
+            + "".join(f"{_percentil(latencias, p):>10.1f}" for p in (50, 95, 99))
+        )
+    print(f"{'envios extras':<20}{reserva.envios / envios:>9.1%}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Executa o benchmark e imprime percentis de latência por envio."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--envios", type=int, default=400)
+    parser.add_argument("--concorrencia", type=int, default=20)
+    args = parser.parse_args(argv)
+    asyncio.run(_executar(args.envios, args.concorrencia))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,86 @@
+"""
+Benchmark: custo das métricas Prometheus por requisição.
+
+Mede em microssegundos de CPU:
+
+- registro: o que MiddlewareRequisicao faz por requisição (medidor em
+  andamento +1/-1, contador por rota/método/status e observação no
+  histograma de latência), espalhado por algumas rotas;
+- raspagem: renderizar o registro inteiro (feito só em GET /metrics).
+
+Usa um registro próprio com as mesmas famílias do registro da aplicação,
+para não misturar as séries do benchmark com as reais.
+
+Uso (a partir de backend/):
+    python -m benchmarks.bench_metricas [--repeticoes 200000]
+"""
+
+import argparse
+import random
+import time
+
+from app.core.metricas import (
+    Contador,
+    Histograma,
+    Medidor,
+    RegistroMetricas,
+    classe_status,
+)
+
+_ROTAS = (
+    "/saude",
+    "/api/v1/sobre",
+    "/api/v1/projetos",
+    "/api/v1/projetos/{projeto_id}",
+    "/api/v1/stack",
+    "/api/v1/experiencias",
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Executa o benchmark e imprime o custo por operação."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticoes", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    registro = RegistroMetricas()
+    requisicoes = registro.registrar(
+        Contador("http_requisicoes", "Requisições.", ["rota", "metodo", "status"])
+    )
+    duracao = registro.registrar(
+        Histograma("http_requisicao_duracao_segundos", "Duração.", ["rota"])
+    )
+    em_andamento = registro.registrar(Medidor("http_requisicoes_em_andamento", "Em andamento."))
+
+    aleatorio = random.Random(0)
+    entradas = [
+        (
+            aleatorio.choice(_ROTAS),
+            aleatorio.choice((200, 200, 200, 304, 404, 500)),
+            aleatorio.lognormvariate(-5, 1),
+        )
+        for _ in range(1024)
+    ]
+
+    inicio = time.process_time()
+    for i in range(args.repeticoes):
+        rota, status_code, segundos = entradas[i & 1023]
+        em_andamento.somar(1)
+        requisicoes.incrementar(rota, "GET", classe_status(status_code))
+        duracao.observar(segundos, rota)
+        em_andamento.somar(-1)
+    por_requisicao = (time.process_time() - inicio) / args.repeticoes * 1e6
+
+    raspagens = max(1, args.repeticoes // 1000)
+    inicio = time.process_time()
+    for _ in range(raspagens):
+        corpo = registro.renderizar()
+    por_raspagem = (time.process_time() - inicio) / raspagens * 1e6
+
+    print(f"{'registro/requisição':<22}{por_requisicao:>10.2f} µs")
+    print(f"{'raspagem /metrics':<22}{por_raspagem:>10.0f} µs ({len(corpo)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,128 @@
+"""
+Benchmark: MiddlewareRequisicao ASGI puro vs. BaseHTTPMiddleware.
+
+Monta duas aplicações mínimas idênticas (uma rota JSON), uma com o
+middleware atual e outra com a cópia da implementação anterior baseada
+em BaseHTTPMiddleware, e mede requisições por segundo de cada uma via
+httpx.ASGITransport (sem rede, isolando o custo do middleware).
+
+Os logs são descartados (/dev/null) para não medir a escrita em stdout.
+
+Uso (a partir de backend/):
+    python -m benchmarks.bench_middleware [--requisicoes 5000]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+import uuid
+from typing import Callable
+
+import httpx
+import structlog
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.middleware import MiddlewareRequisicao, logger
+
+
+class MiddlewareRequisicaoLegado(BaseHTTPMiddleware):
+    """Cópia da implementação anterior, mantida só para comparação."""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        request_id = str(uuid.uuid4())
+        request.state.request_id = request_id
+        structlog.contextvars.clear_contextvars()
+        structlog.contextvars.bind_contextvars(
+            request_id=request_id,
+            metodo=request.method,
+            path=request.url.path,
+        )
+        inicio = time.time()
+        logger.info(
+            "requisicao_recebida",
+            query=str(request.url.query) if request.url.query else None,
+            client_ip=request.client.host if request.client else None,
+        )
+        try:
+            response = await call_next(request)
+        except Exception as exc:
+            logger.error(
+                "erro_processamento_requisicao",
+                erro=str(exc),
+                tipo_erro=type(exc).__name__,
+                exc_info=True,
+            )
+            raise
+        duracao_ms = (time.time() - inicio) * 1000
+        response.headers["X-Request-ID"] = request_id
+        response.headers["X-Response-Time"] = f"{duracao_ms:.2f}ms"
+        logger.info(
+            "resposta_enviada",
+            status_code=response.status_code,
+            duracao_ms=round(duracao_ms, 2),
+        )
+        structlog.contextvars.clear_contextvars()
+        return response
+
+
+def _criar_app(middleware: type) -> FastAPI:
+    """Aplicação mínima com uma rota e o middleware informado."""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping() -> Response:
+        return Response(content=b'{"ok":true}', media_type="application/json")
+
+    app.add_middleware(middleware)
+    return app
+
+
+async def _medir(app: FastAPI, requisicoes: int, concorrencia: int) -> float:
+    """Retorna requisições por segundo."""
+    transporte = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transporte, base_url="http://bench") as cliente:
+        for _ in range(100):
+            await cliente.get("/ping")
+
+        async def trabalhador(quantidade: int) -> None:
+            for _ in range(quantidade):
+                resposta = await cliente.get("/ping")
+                assert "x-request-id" in resposta.headers
+
+        inicio = time.perf_counter()
+        await asyncio.gather(*(
+            trabalhador(requisicoes // concorrencia) for _ in range(concorrencia)
+        ))
+        return requisicoes / (time.perf_counter() - inicio)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Executa o benchmark e imprime requisições/s de cada implementação."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requisicoes", type=int, default=5000)
+    parser.add_argument("--concorrencia", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    structlog.configure(
+        logger_factory=structlog.PrintLoggerFactory(open(os.devnull, "w"))
+    )
+
+    resultados = {}
+    for nome, middleware in (
+        ("BaseHTTPMiddleware", MiddlewareRequisicaoLegado),
+        ("ASGI puro", MiddlewareRequisicao),
+    ):
+        resultados[nome] = asyncio.run(
+            _medir(_criar_app(middleware), args.requisicoes, args.concorrencia)
+        )
+        print(f"{nome:<20}{resultados[nome]:>10.0f} req/s")
+
+    ganho = resultados["ASGI puro"] / resultados["BaseHTTPMiddleware"]
+    print(f"{'ganho':<20}{ganho:>10.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
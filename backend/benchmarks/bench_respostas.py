@@ -0,0 +1,122 @@
+"""
+Benchmark: respostas pré-serializadas vs. montagem por requisição.
+
+Mede o custo de CPU por requisição de montar a resposta de cada
+endpoint de leitura nos dois caminhos:
+
+- legado: constrói os modelos Pydantic a partir das entidades e passa
+  pelo equivalente ao response_model do FastAPI (validar de novo,
+  converter para tipos JSON e json.dumps);
+- pré-serializado: consulta os bytes guardados por versão dos dados e,
+  em listas, junta fragmentos prontos.
+
+Uso (a partir de backend/):
+    python -m benchmarks.bench_respostas [--repeticoes 2000]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from functools import lru_cache
+from typing import Callable
+
+from pydantic import TypeAdapter
+
+from app.controladores import api
+from app.controladores.respostas import montar_lista
+from app.esquemas.experiencias import RespostaExperiencias
+from app.esquemas.projetos import ProjetoDetalhado, RespostaProjetos
+from app.esquemas.sobre import RespostaSobre
+
+
+@lru_cache
+def _adaptador(modelo_resposta: type) -> TypeAdapter:
+    """TypeAdapter criado uma vez, como o campo de resposta do FastAPI."""
+    return TypeAdapter(modelo_resposta)
+
+
+def _como_fastapi(modelo_resposta: type, conteudo: object) -> bytes:
+    """Equivalente a serialize_response + JSONResponse do FastAPI."""
+    adaptador = _adaptador(modelo_resposta)
+    valor = adaptador.validate_python(conteudo, from_attributes=True)
+    return json.dumps(
+        adaptador.dump_python(valor, mode="json"),
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _medir(funcao: Callable[[], object], repeticoes: int) -> float:
+    """Retorna microssegundos de CPU por chamada."""
+    funcao()
+    inicio = time.process_time()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.process_time() - inicio) / repeticoes * 1e6
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Executa o benchmark e imprime uma tabela por endpoint."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticoes", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    executar = asyncio.run
+    sobre = executar(api._obter_sobre_uc.executar())
+    projetos = executar(api._obter_projetos_uc.executar())
+    experiencias = executar(api._obter_experiencias_uc.executar())
+    resumos, detalhes = executar(api._fragmentos_projetos())
+    fragmentos_exp = executar(api._fragmentos_experiencias())
+    corpo_sobre = api.serializar(RespostaSobre(**sobre))
+    primeiro = projetos[0]
+
+    casos = {
+        "/sobre": (
+            lambda: _como_fastapi(RespostaSobre, RespostaSobre(**sobre)),
+            lambda: corpo_sobre,
+        ),
+        "/projetos": (
+            lambda: _como_fastapi(RespostaProjetos, RespostaProjetos(
+                projetos=[api._para_resumo(p) for p in projetos],
+                total=len(projetos),
+                proximo_cursor=None,
+            )),
+            lambda: montar_lista(
+                "projetos",
+                (resumos[p.id] for p in projetos),
+                total=len(projetos),
+                proximo_cursor=None,
+            ),
+        ),
+        "/projetos/{id}": (
+            lambda: _como_fastapi(ProjetoDetalhado, api._para_detalhado(primeiro)),
+            lambda: detalhes[primeiro.id],
+        ),
+        "/experiencias": (
+            lambda: _como_fastapi(RespostaExperiencias, RespostaExperiencias(
+                experiencias=[api._para_experiencia(e) for e in experiencias],
+                total=len(experiencias),
+            )),
+            lambda: montar_lista(
+                "experiencias",
+                (fragmentos_exp[e.id] for e in experiencias),
+                total=len(experiencias),
+            ),
+        ),
+    }
+
+    print(f"{'endpoint':<16}{'legado (µs)':>14}{'pronto (µs)':>14}{'ganho':>9}")
+    for endpoint, (legado, pronto) in casos.items():
+        assert json.loads(legado()) == json.loads(pronto()), endpoint
+        t_legado = _medir(legado, args.repeticoes)
+        t_pronto = _medir(pronto, args.repeticoes)
+        print(
+            f"{endpoint:<16}{t_legado:>14.1f}{t_pronto:>14.2f}"
+            f"{t_legado / t_pronto:>8.0f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,13 +4,16 @@ Configurações compartilhadas de pytest.
 Define fixtures reutilizáveis para testes.
 """
 
+import shutil
 import pytest
 from datetime import date
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 from app.entidades.projeto import Projeto
 from app.entidades.experiencia import ExperienciaProfissional
 from app.adaptadores.repositorio import RepositorioPortfolio
+from app.adaptadores.repositorio_assincrono import RepositorioPortfolioAssincrono
 from app.adaptadores.email_adaptador import EmailAdaptador
 from app.adaptadores.logger_adaptador import LoggerAdaptador
 
@@ -111,6 +114,27 @@ def repositorio_mock() -> RepositorioPortfolio:
     return mock
 
 
+@pytest.fixture
+def repositorio_assincrono_mock(repositorio_mock) -> RepositorioPortfolioAssincrono:
+    """
+    Mock de RepositorioPortfolioAssincrono com os mesmos dados de repositorio_mock.
+
+    Returns:
+        AsyncMock configurado com dados de exemplo.
+    """
+    mock = AsyncMock(spec=RepositorioPortfolioAssincrono)
+    mock.obter_sobre.return_value = repositorio_mock.obter_sobre.return_value
+    mock.obter_projetos.return_value = repositorio_mock.obter_projetos.return_value
+    mock.obter_projeto_por_id.side_effect = (
+        repositorio_mock.obter_projeto_por_id.side_effect
+    )
+    mock.obter_stack.return_value = repositorio_mock.obter_stack.return_value
+    mock.obter_experiencias.return_value = (
+        repositorio_mock.obter_experiencias.return_value
+    )
+    return mock
+
+
 @pytest.fixture
 def email_adaptador_mock() -> EmailAdaptador:
     """
@@ -134,3 +158,16 @@ def logger_mock() -> LoggerAdaptador:
     """
     mock = MagicMock(spec=LoggerAdaptador)
     return mock
+
+
+@pytest.fixture
+def diretorio_dados(tmp_path: Path) -> Path:
+    """
+    Cópia temporária de backend/dados/ que pode ser alterada pelo teste.
+
+    Returns:
+        Caminho do diretório copiado.
+    """
+    destino = tmp_path / "dados"
+    shutil.copytree(Path(__file__).parent.parent / "dados", destino)
+    return destino
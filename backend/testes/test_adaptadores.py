@@ -0,0 +1,621 @@
+"""
+Testes dos adaptadores.
+
+Testa implementações concretas usando arquivos temporários.
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import date
+from unittest.mock import AsyncMock
+
+import anyio.to_thread
+import pytest
+import structlog
+
+from app.adaptadores.caixa_saida_sqlite import CaixaSaidaSQLite
+from app.adaptadores.email_adaptador import (
+    DisjuntorEmailAdaptador,
+    EmailAdaptador,
+    FormspreeEmailAdaptador,
+    MultiProvedorEmailAdaptador,
+)
+from app.adaptadores.repositorio import RepositorioJSON
+from app.adaptadores.repositorio_assincrono import RepositorioAssincrono
+from app.adaptadores.repositorio_bundle import RepositorioBundle, serializar_bundle
+from app.adaptadores.repositorio_sqlite import (
+    ESQUEMA,
+    RepositorioSQLite,
+    importar_snapshot,
+)
+from app.adaptadores.sink_log import (
+    FabricaLoggerFila,
+    SinkLogEmLote,
+    encaminhar_para_fila,
+)
+from app.core.disjuntor import Disjuntor
+from app.core.excecoes import (
+    ErroCircuitoAberto,
+    ErroInfraestrutura,
+    ErroServicoIndisponivel,
+    ErroValidacao,
+)
+from app.core.metricas import ENVIOS_EMAIL
+from app.entidades.mensagem import Mensagem
+from app.ferramentas import compilar_dados, importar_sqlite
+
+
+def _alterar_json(caminho, alteracao) -> None:
+    """Reescreve arquivo JSON aplicando alteração e avança seu mtime."""
+    dados = json.loads(caminho.read_text(encoding="utf-8"))
+    alteracao(dados)
+    caminho.write_text(json.dumps(dados, ensure_ascii=False), encoding="utf-8")
+    info = os.stat(caminho)
+    os.utime(caminho, ns=(info.st_atime_ns, info.st_mtime_ns + 1_000_000_000))
+
+
+def test_repositorio_json_serve_snapshot_em_memoria(diretorio_dados):
+    """Testa que leituras repetidas não reparseiam os arquivos."""
+    repo = RepositorioJSON(diretorio_dados, intervalo_verificacao=60)
+
+    primeiro = repo.obter_snapshot()
+    repo.obter_projetos()
+    repo.obter_stack()
+
+    assert repo.obter_snapshot() is primeiro
+    assert repo.estatisticas.como_dict() == {
+        "acertos": 3,
+        "falhas": 1,
+        "recargas": 0,
+    }
+
+
+def test_repositorio_json_recarrega_apenas_arquivo_alterado(diretorio_dados):
+    """Testa que alteração de mtime recarrega somente o arquivo alterado."""
+    repo = RepositorioJSON(diretorio_dados, intervalo_verificacao=0)
+    anterior = repo.obter_snapshot()
+
+    _alterar_json(
+        diretorio_dados / "sobre.json",
+        lambda dados: dados.update(nome="Nome Alterado"),
+    )
+    atual = repo.obter_snapshot()
+
+    assert atual.versao == anterior.versao + 1
+    assert repo.obter_sobre()["nome"] == "Nome Alterado"
+    assert atual.projetos is anterior.projetos
+    assert repo.estatisticas.recargas == 1
+
+
+def test_repositorio_json_mantem_snapshot_se_recarga_falha(diretorio_dados):
+    """Testa que JSON inválido não derruba leituras: serve o último snapshot bom."""
+    repo = RepositorioJSON(diretorio_dados, intervalo_verificacao=0)
+    anterior = repo.obter_snapshot()
+    caminho = diretorio_dados / "sobre.json"
+    conteudo = caminho.read_text(encoding="utf-8")
+
+    caminho.write_text('{"nome": "pela met', encoding="utf-8")
+    with structlog.testing.capture_logs() as logs:
+        assert repo.obter_snapshot() is anterior
+    assert logs[0]["event"] == "recarga_snapshot_falhou"
+
+    caminho.write_text(conteudo.replace("{", '{"extra": 1, ', 1), encoding="utf-8")
+    assert repo.obter_snapshot().versao == anterior.versao + 1
+
+
+def test_repositorio_json_respeita_intervalo_verificacao(diretorio_dados):
+    """Testa que alterações só são vistas após o intervalo configurado."""
+    repo = RepositorioJSON(diretorio_dados, intervalo_verificacao=60)
+    repo.obter_snapshot()
+
+    _alterar_json(
+        diretorio_dados / "sobre.json",
+        lambda dados: dados.update(nome="Nome Alterado"),
+    )
+
+    assert repo.obter_sobre()["nome"] != "Nome Alterado"
+    assert repo.estatisticas.recargas == 0
+
+
+def test_repositorio_json_busca_projeto_por_indice(diretorio_dados):
+    """Testa busca por ID via índice montado na carga do snapshot."""
+    repo = RepositorioJSON(diretorio_dados)
+    snapshot = repo.obter_snapshot()
+
+    projeto = repo.obter_projeto_por_id("portfolio-api")
+
+    assert projeto is snapshot.projetos_por_id["portfolio-api"]
+    assert repo.obter_projeto_por_id("inexistente") is None
+    assert snapshot.ids_duplicados == ()
+
+
+def test_repositorio_json_reporta_ids_duplicados(diretorio_dados):
+    """Testa que IDs repetidos são reportados e a primeira ocorrência vence."""
+    def duplicar_primeiro(projetos):
+        copia = dict(projetos[0], nome="Cópia")
+        projetos.append(copia)
+
+    _alterar_json(diretorio_dados / "projetos.json", duplicar_primeiro)
+    repo = RepositorioJSON(diretorio_dados)
+
+    snapshot = repo.obter_snapshot()
+    primeiro = snapshot.projetos[0]
+
+    assert snapshot.ids_duplicados == (primeiro.id,)
+    assert repo.obter_projeto_por_id(primeiro.id).nome != "Cópia"
+
+
+@pytest.mark.asyncio
+async def test_repositorio_assincrono_serve_da_memoria_apos_carga(
+    diretorio_dados,
+    monkeypatch,
+):
+    """Testa que só a carga inicial é enviada para thread."""
+    repo = RepositorioJSON(diretorio_dados, intervalo_verificacao=60)
+    repo_async = RepositorioAssincrono(repo)
+    chamadas_thread = []
+
+    original = anyio.to_thread.run_sync
+
+    async def run_sync_contado(funcao, *args, **kwargs):
+        chamadas_thread.append(funcao)
+        return await original(funcao, *args, **kwargs)
+
+    monkeypatch.setattr(anyio.to_thread, "run_sync", run_sync_contado)
+
+    projetos = await repo_async.obter_projetos()
+    projeto = await repo_async.obter_projeto_por_id(projetos[0].id)
+    await repo_async.obter_stack()
+
+    assert projeto is projetos[0]
+    assert len(chamadas_thread) == 1
+    assert repo.dados_em_memoria() is True
+
+
+@pytest.mark.asyncio
+async def test_formspree_sem_form_id_conta_envio_nao_configurado():
+    """Testa que o resultado do envio é contado em email_envios_total."""
+    adaptador = FormspreeEmailAdaptador("https://formspree.io/f", "")
+    antes = ENVIOS_EMAIL.valor("formspree", "nao_configurado")
+
+    enviado = await adaptador.enviar_mensagem(
+        Mensagem(
+            nome="Maria",
+            email="maria@example.com",
+            assunto="Contato",
+            mensagem="Olá, tudo bem?",
+        )
+    )
+
+    assert enviado is False
+    assert ENVIOS_EMAIL.valor("formspree", "nao_configurado") == antes + 1
+
+
+@pytest.mark.asyncio
+async def test_formspree_reaproveita_conexao_entre_envios():
+    """Testa que envios seguidos usam o mesmo cliente e a mesma conexão."""
+    conexoes = []
+
+    async def atender(leitor, escritor):
+        conexoes.append(escritor)
+        try:
+            while True:
+                cabecalhos = await leitor.readuntil(b"\r\n\r\n")
+                tamanho = next(
+                    int(linha.split(b":")[1])
+                    for linha in cabecalhos.split(b"\r\n")
+                    if linha.lower().startswith(b"content-length")
+                )
+                await leitor.readexactly(tamanho)
+                escritor.write(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n")
+                await escritor.drain()
+        except asyncio.IncompleteReadError:
+            escritor.close()
+
+    servidor = await asyncio.start_server(atender, "127.0.0.1", 0)
+    porta = servidor.sockets[0].getsockname()[1]
+    adaptador = FormspreeEmailAdaptador(f"http://127.0.0.1:{porta}/f", "abc")
+    adaptador.iniciar()
+    mensagem = Mensagem(
+        nome="Maria",
+        email="maria@example.com",
+        assunto="Contato",
+        mensagem="Olá, tudo bem?",
+    )
+    try:
+        resultados = [await adaptador.enviar_mensagem(mensagem) for _ in range(3)]
+    finally:
+        await adaptador.fechar()
+        servidor.close()
+        await servidor.wait_closed()
+
+    assert resultados == [True, True, True]
+    assert len(conexoes) == 1
+
+
+@pytest.mark.asyncio
+async def test_disjuntor_email_falha_na_hora_com_provedor_fora():
+    """Testa que, aberto o disjuntor, o provedor não é mais chamado."""
+    provedor = AsyncMock(spec=EmailAdaptador)
+    provedor.enviar_mensagem.return_value = False
+    adaptador = DisjuntorEmailAdaptador(provedor, Disjuntor("fora", minimo=3, tempo_aberto=30))
+    mensagem = Mensagem("Maria", "maria@example.com", "Contato", "Olá, tudo bem?")
+    
+    resultados = [await adaptador.enviar_mensagem(mensagem) for _ in range(3)]
+    with pytest.raises(ErroCircuitoAberto) as erro:
+        await adaptador.enviar_mensagem(mensagem)
+    
+    assert resultados == [False, False, False]
+    assert provedor.enviar_mensagem.call_count == 3
+    assert 29 < erro.value.tentar_apos <= 30
+
+
+class ProvedorLocal(EmailAdaptador):
+    """Provedor de email de teste: responde após `latencia` segundos."""
+
+    def __init__(self, latencia: float = 0.0, sucesso: bool = True):
+        self.latencia = latencia
+        self.sucesso = sucesso
+        self.recebidas: list[str] = []
+        self.canceladas = 0
+
+    async def enviar_mensagem(self, mensagem: Mensagem) -> bool:
+        self.recebidas.append(mensagem.id)
+        try:
+            await asyncio.sleep(self.latencia)
+        except asyncio.CancelledError:
+            self.canceladas += 1
+            raise
+        return self.sucesso
+
+
+@pytest.mark.asyncio
+async def test_multiprovedor_hedge_quando_principal_demora():
+    """Testa hedge: principal lento, reserva responde e o principal é cancelado."""
+    principal, reserva = ProvedorLocal(latencia=5.0), ProvedorLocal(latencia=0.01)
+    adaptador = MultiProvedorEmailAdaptador([principal, reserva], atraso_inicial=0.05)
+    mensagem = Mensagem("Maria", "maria@example.com", "Contato", "Olá, tudo bem?")
+    
+    inicio = time.perf_counter()
+    assert await adaptador.enviar_mensagem(mensagem) is True
+    
+    assert time.perf_counter() - inicio < 1.0
+    assert principal.recebidas == reserva.recebidas == [mensagem.id]
+    assert principal.canceladas == 1
+    # Mesmo id de novo (ex.: reserva da caixa de saída venceu): sem reenvio
+    assert await adaptador.enviar_mensagem(mensagem) is True
+    assert len(principal.recebidas) + len(reserva.recebidas) == 2
+
+
+@pytest.mark.asyncio
+async def test_multiprovedor_sem_hedge_quando_principal_rapido_e_failover_na_falha():
+    """Testa que envio rápido não duplica tráfego e falha vai direto à reserva."""
+    principal, reserva = ProvedorLocal(latencia=0.0), ProvedorLocal()
+    adaptador = MultiProvedorEmailAdaptador(
+        [principal, reserva], atraso_inicial=1.0, minimo_amostras=5
+    )
+    mensagens = [
+        Mensagem("Maria", "maria@example.com", f"Contato {i}", "Olá") for i in range(5)
+    ]
+    
+    resultados = await asyncio.gather(*(adaptador.enviar_mensagem(m) for m in mensagens))
+    assert resultados == [True] * 5
+    assert reserva.recebidas == []
+    assert adaptador.atraso_hedge(0) == adaptador.atraso_minimo  # p95 ~0 s
+    
+    principal.sucesso = False
+    falha = Mensagem("Maria", "maria@example.com", "Falha", "Olá")
+    assert await adaptador.enviar_mensagem(falha) is True
+    assert reserva.recebidas == [falha.id]
+
+
+@pytest.mark.asyncio
+async def test_multiprovedor_todos_com_circuito_aberto_levanta():
+    """Testa que, com todos os disjuntores abertos, o erro chega à caixa de saída."""
+    provedores = [
+        DisjuntorEmailAdaptador(ProvedorLocal(), Disjuntor(f"p{i}", minimo=1, tempo_aberto=t))
+        for i, t in enumerate((30, 10))
+    ]
+    for provedor in provedores:
+        provedor.disjuntor.registrar(False, 0.0)
+    adaptador = MultiProvedorEmailAdaptador(provedores)
+    
+    with pytest.raises(ErroCircuitoAberto) as erro:
+        await adaptador.enviar_mensagem(Mensagem("Maria", "m@example.com", "Oi", "Olá"))
+    
+    assert 9 < erro.value.tentar_apos <= 10
+
+
+def test_repositorio_bundle_equivale_ao_json(diretorio_dados, tmp_path):
+    """Testa que o bundle compilado reproduz os dados dos arquivos JSON."""
+    caminho = tmp_path / "portfolio.bundle"
+    argumentos = ["--dados", str(diretorio_dados), "--saida", str(caminho)]
+    assert compilar_dados.main(argumentos) == 0
+
+    bundle = RepositorioBundle(caminho).obter_snapshot()
+    json_ = RepositorioJSON(diretorio_dados).obter_snapshot()
+
+    assert bundle.projetos == json_.projetos
+    assert bundle.experiencias == json_.experiencias
+    assert isinstance(bundle.experiencias[0].data_inicio, date)
+    assert dict(bundle.sobre) == dict(json_.sobre)
+    assert bundle.projetos_por_id.keys() == json_.projetos_por_id.keys()
+
+
+def test_compilar_dados_rejeita_dados_invalidos(diretorio_dados, tmp_path):
+    """Testa que a compilação falha com item de stack fora do schema."""
+    _alterar_json(
+        diretorio_dados / "stack.json",
+        lambda stack: stack[0].update(nivel=9),
+    )
+
+    with pytest.raises(ErroValidacao, match=r"stack.json\[0\]: nivel"):
+        compilar_dados.compilar(diretorio_dados, tmp_path / "portfolio.bundle")
+    assert not (tmp_path / "portfolio.bundle").exists()
+
+
+def test_repositorio_bundle_rejeita_arquivo_corrompido(tmp_path):
+    """Testa que checksum inválido gera ErroInfraestrutura."""
+    caminho = tmp_path / "portfolio.bundle"
+    conteudo = bytearray(serializar_bundle({}, (), (), ()))
+    conteudo[-1] ^= 0xFF
+    caminho.write_bytes(bytes(conteudo))
+
+    with pytest.raises(ErroInfraestrutura) as exc:
+        RepositorioBundle(caminho).obter_snapshot()
+    assert exc.value.codigo == "BUNDLE_INVALIDO"
+
+
+def test_repositorio_sqlite_equivale_ao_json(diretorio_dados, tmp_path):
+    """Testa importação e leitura pelo RepositorioSQLite."""
+    banco = tmp_path / "portfolio.db"
+    argumentos = ["--dados", str(diretorio_dados), "--banco", str(banco)]
+    assert importar_sqlite.main(argumentos) == 0
+
+    repo = RepositorioSQLite(banco)
+    json_ = RepositorioJSON(diretorio_dados)
+    try:
+        assert repo.obter_projetos() == json_.obter_projetos()
+        assert repo.obter_experiencias() == json_.obter_experiencias()
+        assert repo.obter_sobre() == json_.obter_sobre()
+        assert repo.obter_stack() == json_.obter_stack()
+        assert repo.obter_projeto_por_id("portfolio-api").nome == "Portfolio API"
+        assert repo.obter_projeto_por_id("inexistente") is None
+    finally:
+        repo.fechar()
+
+
+def test_repositorio_sqlite_vazio_tem_versao_zero(tmp_path):
+    """Testa versão 0 (não None) em banco sem importação, para o cache valer."""
+    banco = tmp_path / "portfolio.db"
+    with sqlite3.connect(banco) as conexao:
+        conexao.executescript(ESQUEMA)
+    conexao.close()
+
+    repo = RepositorioSQLite(banco)
+    try:
+        assert repo.versao_dados() == 0
+        assert repo.obter_projetos() == []
+    finally:
+        repo.fechar()
+
+
+def test_repositorio_sqlite_usa_wal_e_conexao_por_thread(diretorio_dados, tmp_path):
+    """Testa modo WAL, versão incrementada e conexões separadas por thread."""
+    banco = tmp_path / "portfolio.db"
+    snapshot = RepositorioJSON(diretorio_dados).obter_snapshot()
+    assert importar_snapshot(banco, snapshot) == 1
+    assert importar_snapshot(banco, snapshot) == 2
+
+    repo = RepositorioSQLite(banco)
+    conexoes = []
+    thread = threading.Thread(target=lambda: conexoes.append(repo._conexao()))
+    thread.start()
+    thread.join()
+    try:
+        principal = repo._conexao()
+        assert principal.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conexoes[0] is not principal
+    finally:
+        repo.fechar()
+
+
+class _SaidaLenta:
+    """Stream que segura a primeira escrita até ser liberado."""
+
+    def __init__(self):
+        self.linhas: list[str] = []
+        self.escritas = 0
+        self.escrevendo = threading.Event()
+        self.liberar = threading.Event()
+
+    def write(self, texto: str) -> None:
+        self.escrevendo.set()
+        self.liberar.wait(5)
+        self.escritas += 1
+        self.linhas.extend(texto.splitlines())
+
+    def flush(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_caixa_saida_sqlite_recupera_mensagens_apos_crash(tmp_path):
+    """Testa que pendentes e reservas vencidas sobrevivem a um novo processo."""
+    banco = tmp_path / "contato.db"
+    anterior = CaixaSaidaSQLite(banco, reserva=0.05)
+    mensagens = [
+        Mensagem("Maria", "maria@example.com", f"Assunto {i}", "Mensagem") for i in range(3)
+    ]
+    for mensagem in mensagens:
+        await anterior.adicionar(mensagem)
+    await anterior.adicionar(mensagens[0])  # mesmo id: não duplica
+    reservado, = await anterior.reservar(1)
+    await anterior.reagendar((await anterior.reservar(1))[0], atraso=0)
+    # "crash": sem concluir nem fechar; a reserva de `reservado` vence
+    await asyncio.sleep(0.06)
+
+    caixa = CaixaSaidaSQLite(banco, reserva=0.05)
+    assert await caixa.recuperar() == 3
+    itens = await caixa.reservar(10)
+
+    assert {item.mensagem.id for item in itens} == {m.id for m in mensagens}
+    assert reservado.mensagem.id in {item.mensagem.id for item in itens}
+    assert sorted(item.tentativas for item in itens) == [0, 0, 1]
+    for item in itens:
+        await caixa.concluir(item)
+    assert caixa.profundidade() == 0
+    await caixa.fechar()
+
+
+@pytest.mark.asyncio
+async def test_caixa_saida_sqlite_limita_e_devolve_reservas_no_fechar(tmp_path):
+    """Testa capacidade (503) e devolução imediata das reservas no shutdown."""
+    banco = tmp_path / "contato.db"
+    caixa = CaixaSaidaSQLite(banco, maximo=2, reserva=3600)
+    await caixa.adicionar(Mensagem("Maria", "maria@example.com", "Um", "Mensagem"))
+    await caixa.adicionar(Mensagem("Maria", "maria@example.com", "Dois", "Mensagem"))
+    with pytest.raises(ErroServicoIndisponivel):
+        await caixa.adicionar(Mensagem("Maria", "maria@example.com", "Três", "Mensagem"))
+
+    assert len(await caixa.reservar(10)) == 2
+    assert await caixa.reservar(10) == []
+    await caixa.fechar()
+
+    # Reserva longa, mas devolvida no fechar: outro processo pega na hora
+    assert len(await CaixaSaidaSQLite(banco).reservar(10)) == 2
+
+
+@pytest.mark.asyncio
+async def test_caixa_saida_sqlite_resumo_sem_io_no_event_loop(tmp_path, monkeypatch):
+    """Testa profundidade/idade do resumo guardado, relido só em `aguardar`."""
+    banco = tmp_path / "contato.db"
+    caixa = CaixaSaidaSQLite(banco)
+    outro_processo = CaixaSaidaSQLite(banco)
+    await caixa.adicionar(Mensagem("Maria", "maria@example.com", "Um", "Mensagem"))
+    await outro_processo.adicionar(
+        Mensagem("Maria", "maria@example.com", "Dois", "Mensagem")
+    )
+
+    def sem_banco():
+        raise AssertionError("leitura não deveria abrir o banco")
+
+    monkeypatch.setattr(caixa, "_abrir", sem_banco)
+    assert caixa.profundidade() == 1
+    assert caixa.idade_mais_antiga() >= 0
+    monkeypatch.undo()
+
+    await caixa.aguardar(1.0)  # há item vencido: relê e volta na hora
+    assert caixa.profundidade() == 2
+    await caixa.fechar()
+    await outro_processo.fechar()
+
+
+@pytest.mark.asyncio
+async def test_caixa_saida_sqlite_aguardar_nao_perde_item_da_releitura(tmp_path, monkeypatch):
+    """Testa que um item adicionado durante a releitura acorda o `aguardar`."""
+    caixa = CaixaSaidaSQLite(tmp_path / "contato.db")
+    loop = asyncio.get_running_loop()
+    ler_resumo = caixa._ler_resumo
+
+    def ler_com_item_novo():
+        resumo = ler_resumo()
+        loop.call_soon_threadsafe(caixa._novo.set)  # `adicionar` concorrente
+        return resumo
+
+    monkeypatch.setattr(caixa, "_ler_resumo", ler_com_item_novo)
+
+    await asyncio.wait_for(caixa.aguardar(60), timeout=1)
+    await caixa.fechar()
+
+
+@pytest.mark.asyncio
+async def test_caixa_saida_sqlite_reserva_lote_com_prazo_por_item(tmp_path):
+    """Testa que cada item do lote tem o prazo contado a partir da vez dele."""
+    banco = tmp_path / "contato.db"
+    caixa = CaixaSaidaSQLite(banco, reserva=0.1)
+    for assunto in ("Um", "Dois", "Três"):
+        await caixa.adicionar(Mensagem("Maria", "maria@example.com", assunto, "Mensagem"))
+    inicio = time.time()
+    itens = await caixa.reservar(10)
+    await asyncio.sleep(0.15)  # venceu só a reserva do primeiro
+
+    outro = CaixaSaidaSQLite(banco, reserva=3600)
+    assumido, = await outro.reservar(10)
+    await caixa.concluir(itens[0])  # perdeu a reserva: ignorado
+    for item in itens[1:]:
+        await caixa.concluir(item)
+
+    assert [item.mensagem.assunto for item in itens] == ["Um", "Dois", "Três"]
+    prazos = [item.proxima_tentativa for item in itens]
+    assert inicio + 0.1 <= prazos[0] < inicio + 0.15
+    assert [round(b - a, 3) for a, b in zip(prazos, prazos[1:])] == [0.1, 0.1]
+    assert assumido.mensagem.id == itens[0].mensagem.id
+    assert await outro.recuperar() == 1  # só o assumido segue em entrega
+    await caixa.fechar()
+    await outro.fechar()
+
+
+@pytest.mark.asyncio
+async def test_caixa_saida_sqlite_ignora_conclusao_de_reserva_perdida(tmp_path):
+    """Testa que quem perdeu a reserva vencida não sobrescreve o novo dono."""
+    banco = tmp_path / "contato.db"
+    lento = CaixaSaidaSQLite(banco, reserva=0.05)
+    await lento.adicionar(Mensagem("Maria", "maria@example.com", "Um", "Mensagem"))
+    perdido, = await lento.reservar(1)
+    await asyncio.sleep(0.06)
+
+    outro = CaixaSaidaSQLite(banco, reserva=3600)
+    assumido, = await outro.reservar(1)
+    await lento.reagendar(perdido, atraso=0)
+    await lento.concluir(perdido)
+
+    assert await outro.reservar(1) == []  # continua em entrega pelo novo dono
+    await outro.concluir(assumido)
+    assert await outro.recuperar() == 0
+    await lento.fechar()
+    await outro.fechar()
+
+
+def test_sink_log_escreve_em_lote_fora_da_thread_que_loga():
+    """Testa integração com structlog e escrita em lote pela thread de fundo."""
+    saida = _SaidaLenta()
+    saida.liberar.set()
+    sink = SinkLogEmLote(structlog.processors.JSONRenderer(), saida)
+    logger = structlog.wrap_logger(
+        FabricaLoggerFila(sink)(),
+        processors=[structlog.stdlib.add_log_level, encaminhar_para_fila],
+    )
+
+    for i in range(50):
+        logger.info("evento", i=i)
+    assert sink.esvaziar()
+    sink.encerrar()
+
+    eventos = [json.loads(linha) for linha in saida.linhas]
+    assert [e["i"] for e in eventos] == list(range(50))
+    assert eventos[0]["level"] == "info"
+    assert saida.escritas < 50
+
+
+def test_sink_log_descarta_com_fila_cheia_e_avisa():
+    """Testa política "descartar": conta descartes sem bloquear quem loga."""
+    saida = _SaidaLenta()
+    sink = SinkLogEmLote(
+        structlog.processors.JSONRenderer(), saida, tamanho_fila=1
+    )
+
+    sink.enfileirar("info", {"event": "primeiro"})
+    assert saida.escrevendo.wait(5)  # thread presa escrevendo o primeiro
+    sink.enfileirar("info", {"event": "segundo"})
+    sink.enfileirar("info", {"event": "terceiro"})
+    saida.liberar.set()
+    sink.encerrar()
+
+    eventos = [json.loads(linha)["event"] for linha in saida.linhas]
+    assert sink.descartados == 1
+    assert eventos == ["primeiro", "segundo", "logs_descartados"]
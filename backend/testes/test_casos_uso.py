@@ -4,9 +4,15 @@ Testes dos casos de uso.
 Testa lógica de negócio isoladamente, sem dependências de HTTP.
 """
 
+import time
+
 import pytest
 from unittest.mock import AsyncMock
 
+from app.core.excecoes import ErroCircuitoAberto, ErroServicoIndisponivel, ErroValidacao
+from app.adaptadores import CaixaSaidaMemoria, CaixaSaidaSQLite
+from app.entidades.mensagem import Mensagem
+
 from app.casos_uso import (
     ObterSobreUseCase,
     ObterProjetosUseCase,
@@ -14,7 +20,14 @@ from app.casos_uso import (
     ObterStackUseCase,
     ObterExperienciasUseCase,
     EnviarContatoUseCase,
+    EntregarContatoUseCase,
+    ObterProjetosAssincronoUseCase,
+    ObterProjetoPorIdAssincronoUseCase,
+    ObterStackAssincronoUseCase,
+    ObterExperienciasAssincronoUseCase,
+    BuscarProjetosUseCase,
 )
+from app.casos_uso.buscar_projetos import tokenizar
 
 
 def test_obter_sobre_retorna_dados_corretos(repositorio_mock):
@@ -40,6 +53,85 @@ def test_obter_projetos_ordena_por_destaque(repositorio_mock):
     repositorio_mock.obter_projetos.assert_called_once()
 
 
+def test_obter_projetos_pagina_por_cursor(repositorio_mock):
+    """Testa paginação por chave percorrendo todas as páginas."""
+    uc = ObterProjetosUseCase(repositorio_mock)
+
+    primeira = uc.executar_pagina(limite=1)
+    segunda = uc.executar_pagina(limite=1, cursor=primeira.proximo_cursor)
+
+    assert [p.id for p in primeira.itens] == ["projeto-1"]
+    assert [p.id for p in segunda.itens] == ["projeto-2"]
+    assert primeira.total == segunda.total == 2
+    assert segunda.proximo_cursor is None
+    # Índice ordenado é montado uma vez por versão dos dados
+    repositorio_mock.obter_projetos.assert_called_once()
+
+
+def test_obter_projetos_pagina_rejeita_cursor_invalido(repositorio_mock):
+    """Testa que cursor malformado gera ErroValidacao."""
+    uc = ObterProjetosUseCase(repositorio_mock)
+
+    with pytest.raises(ErroValidacao):
+        uc.executar_pagina(limite=1, cursor="nao-e-um-cursor")
+
+
+def test_obter_projetos_materializa_ordenacoes_uma_vez(repositorio_mock):
+    """Testa ordenações alternativas sem reler nem reordenar a cada chamada."""
+    repositorio_mock.versao_dados.return_value = 1
+    uc = ObterProjetosUseCase(repositorio_mock)
+
+    por_nome = uc.executar("nome")
+    uc.executar("nome")
+    uc.executar()
+    primeira = uc.executar_pagina(limite=1)
+
+    assert [p.id for p in por_nome] == ["projeto-1", "projeto-2"]
+    assert uc._indice("nome") is uc._indice("nome")
+    repositorio_mock.obter_projetos.assert_called_once()
+    with pytest.raises(ErroValidacao):
+        uc.executar_pagina(cursor=primeira.proximo_cursor, ordenacao="nome")
+
+
+def test_obter_projetos_filtra_por_tecnologia(repositorio_mock):
+    """Testa filtro por tecnologia nos modos todas/qualquer."""
+    uc = ObterProjetosUseCase(repositorio_mock)
+
+    so_python = uc.executar_pagina(tecnologias=["python"])
+    ambas = uc.executar_pagina(tecnologias=["Python", "JavaScript"])
+    qualquer = uc.executar_pagina(
+        tecnologias=["Python", "JavaScript"], modo="qualquer"
+    )
+
+    assert [p.id for p in so_python.itens] == ["projeto-1"]
+    assert so_python.total == 1
+    assert ambas.itens == () and ambas.total == 0
+    assert [p.id for p in qualquer.itens] == ["projeto-1", "projeto-2"]
+
+
+def test_tokenizar_ignora_acentos_caixa_e_palavras_vazias():
+    """Testa normalização de termos em português."""
+    assert tokenizar("Integração com a API de Pagamentos") == [
+        "integracao",
+        "api",
+        "pagamentos",
+    ]
+
+
+def test_buscar_projetos_ordena_por_relevancia(repositorio_mock):
+    """Testa busca sem acento encontrando texto acentuado e ranking."""
+    uc = BuscarProjetosUseCase(repositorio_mock)
+
+    resultados = uc.executar("DESCRICAO completa a")
+    so_a = uc.executar("projeto destaque")
+
+    assert {r.projeto.id for r in resultados} == {"projeto-1", "projeto-2"}
+    assert so_a[0].projeto.id == "projeto-1"
+    assert so_a[0].pontuacao > so_a[1].pontuacao
+    assert uc.executar("inexistente") == []
+    repositorio_mock.obter_projetos.assert_called_once()
+
+
 def test_obter_projeto_por_id_encontrado(repositorio_mock):
     """Testa busca de projeto existente por ID."""
     uc = ObterProjetoPorIdUseCase(repositorio_mock)
@@ -73,6 +165,22 @@ def test_obter_stack_agrupa_por_categoria(repositorio_mock):
     repositorio_mock.obter_stack.assert_called_once()
 
 
+def test_obter_stack_agrupa_uma_vez_por_versao(repositorio_mock):
+    """Testa que o agrupamento é reaproveitado e refeito ao mudar a versão."""
+    repositorio_mock.versao_dados.return_value = 1
+    uc = ObterStackUseCase(repositorio_mock)
+
+    agrupado = uc.executar_agrupado()
+    uc.executar()["backend"].clear()
+    assert uc.executar_agrupado() is agrupado
+    assert len(uc.executar()["backend"]) == 1
+    repositorio_mock.obter_stack.assert_called_once()
+
+    repositorio_mock.versao_dados.return_value = 2
+    uc.executar()
+    assert repositorio_mock.obter_stack.call_count == 2
+
+
 def test_obter_experiencias_ordena_cronologicamente(repositorio_mock):
     """Testa que experiências são ordenadas (atual primeiro)."""
     uc = ObterExperienciasUseCase(repositorio_mock)
@@ -85,37 +193,187 @@ def test_obter_experiencias_ordena_cronologicamente(repositorio_mock):
     repositorio_mock.obter_experiencias.assert_called_once()
 
 
+def test_obter_experiencias_ordena_por_data_inicio(repositorio_mock):
+    """Testa ordenação alternativa (mais antigas primeiro)."""
+    uc = ObterExperienciasUseCase(repositorio_mock)
+
+    experiencias = uc.executar(ordenacao="data_inicio")
+
+    assert [e.id for e in experiencias] == ["exp-2", "exp-1"]
+
+
+def test_obter_experiencias_filtra_por_tecnologia(repositorio_mock):
+    """Testa filtro por tecnologia mantendo a ordem cronológica."""
+    uc = ObterExperienciasUseCase(repositorio_mock)
+
+    java = uc.executar(tecnologias=["Java"])
+    qualquer = uc.executar(tecnologias=["Java", "Python"], modo="qualquer")
+
+    assert [e.id for e in java] == ["exp-2"]
+    assert [e.id for e in qualquer] == [e.id for e in uc.executar()]
+    assert uc.executar(tecnologias=["Cobol"]) == []
+
+
 @pytest.mark.asyncio
-async def test_enviar_contato_sucesso(email_adaptador_mock, logger_mock):
-    """Testa envio de mensagem com sucesso."""
-    uc = EnviarContatoUseCase(email_adaptador_mock, logger_mock)
-    email_adaptador_mock.enviar_mensagem.return_value = True
+async def test_obter_projetos_assincrono_ordena_por_destaque(
+    repositorio_assincrono_mock,
+):
+    """Testa versão assíncrona: destacados primeiro."""
+    uc = ObterProjetosAssincronoUseCase(repositorio_assincrono_mock)
+
+    projetos = await uc.executar()
+
+    assert [p.id for p in projetos] == ["projeto-1", "projeto-2"]
+    repositorio_assincrono_mock.obter_projetos.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_obter_projeto_por_id_assincrono(repositorio_assincrono_mock):
+    """Testa busca assíncrona de projeto existente e inexistente."""
+    uc = ObterProjetoPorIdAssincronoUseCase(repositorio_assincrono_mock)
+
+    assert (await uc.executar("projeto-2")).nome == "Projeto B"
+    assert await uc.executar("projeto-inexistente") is None
+
+
+@pytest.mark.asyncio
+async def test_obter_stack_e_experiencias_assincronos(repositorio_assincrono_mock):
+    """Testa agrupamento e ordenação nas versões assíncronas."""
+    stack = await ObterStackAssincronoUseCase(repositorio_assincrono_mock).executar()
+    experiencias = await ObterExperienciasAssincronoUseCase(
+        repositorio_assincrono_mock
+    ).executar()
+
+    assert set(stack) == {"backend", "frontend"}
+    assert experiencias[0].atual is True
+
+
+@pytest.mark.asyncio
+async def test_enviar_contato_grava_na_caixa_de_saida(email_adaptador_mock, logger_mock):
+    """Testa que o envio só enfileira: nenhum email sai na requisição."""
+    caixa = CaixaSaidaMemoria()
+    uc = EnviarContatoUseCase(caixa, logger_mock)
     
-    sucesso = await uc.executar(
+    mensagem = await uc.executar(
         nome="Maria",
         email="maria@example.com",
         assunto="Teste",
         mensagem="Mensagem de teste",
     )
     
-    assert sucesso is True
-    email_adaptador_mock.enviar_mensagem.assert_called_once()
+    assert caixa.profundidade() == 1
+    assert (await caixa.reservar(10))[0].mensagem.id == mensagem.id
+    email_adaptador_mock.enviar_mensagem.assert_not_called()
     logger_mock.info.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_enviar_contato_caixa_cheia_levanta_indisponivel(logger_mock):
+    """Testa que caixa de saída cheia vira ErroServicoIndisponivel (503)."""
+    uc = EnviarContatoUseCase(CaixaSaidaMemoria(maximo=1), logger_mock)
+    await uc.executar("Maria", "maria@example.com", "Teste", "Mensagem de teste")
     
+    with pytest.raises(ErroServicoIndisponivel):
+        await uc.executar("Maria", "maria@example.com", "Teste", "Mensagem de teste")
+
 
 @pytest.mark.asyncio
-async def test_enviar_contato_falha(email_adaptador_mock, logger_mock):
-    """Testa envio de mensagem com falha."""
-    uc = EnviarContatoUseCase(email_adaptador_mock, logger_mock)
-    email_adaptador_mock.enviar_mensagem.return_value = False
+async def test_entregar_contato_reagenda_falha_e_entrega_depois(
+    email_adaptador_mock, logger_mock
+):
+    """Testa nova tentativa após falha e conclusão após sucesso."""
+    caixa = CaixaSaidaMemoria()
+    uc = EntregarContatoUseCase(caixa, email_adaptador_mock, logger_mock, atraso_base=0)
+    email_adaptador_mock.enviar_mensagem.side_effect = [False, True]
+    await EnviarContatoUseCase(caixa, logger_mock).executar(
+        "Maria", "maria@example.com", "Teste", "Mensagem de teste"
+    )
     
-    sucesso = await uc.executar(
-        nome="Maria",
-        email="maria@example.com",
-        assunto="Teste",
-        mensagem="Mensagem de teste",
+    assert await uc.executar_lote() == 1
+    assert caixa.profundidade() == 1  # reagendada
+    assert await uc.executar_lote() == 1
+    assert caixa.profundidade() == 0
+    assert email_adaptador_mock.enviar_mensagem.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_entregar_contato_descarta_apos_tentativas_maximas(
+    email_adaptador_mock, logger_mock
+):
+    """Testa que a mensagem é descartada ao esgotar as tentativas."""
+    caixa = CaixaSaidaMemoria()
+    uc = EntregarContatoUseCase(
+        caixa, email_adaptador_mock, logger_mock, tentativas_maximas=3, atraso_base=0
     )
+    email_adaptador_mock.enviar_mensagem.return_value = False
+    await caixa.adicionar(Mensagem("Maria", "maria@example.com", "Teste", "Mensagem"))
     
-    assert sucesso is False
-    email_adaptador_mock.enviar_mensagem.assert_called_once()
+    resultados = [await uc.entregar((await caixa.reservar(1))[0]) for _ in range(3)]
+    
+    assert resultados == ["nova_tentativa", "nova_tentativa", "descartada"]
+    assert caixa.profundidade() == 0
     logger_mock.erro.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_entregar_contato_adia_sem_gastar_tentativa_com_circuito_aberto(
+    email_adaptador_mock, logger_mock
+):
+    """Testa que envio recusado pelo disjuntor não conta como tentativa."""
+    caixa = CaixaSaidaMemoria()
+    uc = EntregarContatoUseCase(caixa, email_adaptador_mock, logger_mock)
+    email_adaptador_mock.enviar_mensagem.side_effect = ErroCircuitoAberto(
+        "suspenso", tentar_apos=20.0
+    )
+    await caixa.adicionar(Mensagem("Maria", "maria@example.com", "Teste", "Mensagem"))
+    item = (await caixa.reservar(1))[0]
+    
+    assert await uc.entregar(item) == "adiada"
+    assert item.tentativas == 0
+    assert item.proxima_tentativa >= time.time() + 19
+    assert caixa.profundidade() == 1
+
+
+def test_entregar_contato_atraso_exponencial_com_teto(email_adaptador_mock, logger_mock):
+    """Testa backoff: dobra a cada falha, limitado ao teto, jitter 50-100%."""
+    uc = EntregarContatoUseCase(
+        CaixaSaidaMemoria(), email_adaptador_mock, logger_mock,
+        atraso_base=2.0, atraso_maximo=10.0,
+    )
+    
+    for tentativas, teto in [(1, 2.0), (2, 4.0), (3, 8.0), (6, 10.0)]:
+        assert teto / 2 <= uc.atraso(tentativas) <= teto
+
+
+@pytest.mark.asyncio
+async def test_entregar_contato_encerrar_drena_caixa(email_adaptador_mock, logger_mock):
+    """Testa que o shutdown espera os workers entregarem o que está na caixa."""
+    caixa = CaixaSaidaMemoria()
+    uc = EntregarContatoUseCase(caixa, email_adaptador_mock, logger_mock)
+    uc.iniciar(2)
+    for i in range(5):
+        await caixa.adicionar(Mensagem("Maria", "maria@example.com", f"Teste {i}", "Mensagem"))
+    
+    assert await uc.encerrar(timeout=1.0) == 0
+    assert email_adaptador_mock.enviar_mensagem.call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_entregar_contato_encerrar_nao_espera_backoff(
+    email_adaptador_mock, logger_mock, tmp_path
+):
+    """Testa que mensagem em backoff não segura o shutdown e fica adiada."""
+    caixa = CaixaSaidaSQLite(tmp_path / "contato.db")
+    uc = EntregarContatoUseCase(caixa, email_adaptador_mock, logger_mock, atraso_base=60)
+    email_adaptador_mock.enviar_mensagem.return_value = False
+    await caixa.adicionar(Mensagem("Maria", "maria@example.com", "Teste", "Mensagem"))
+    uc.iniciar(2)
+    inicio = time.monotonic()
+
+    assert await uc.encerrar(timeout=10.0) == 1
+
+    assert time.monotonic() - inicio < 5
+    assert email_adaptador_mock.enviar_mensagem.call_count == 1
+    assert "adiadas" in logger_mock.aviso.call_args_list[-1].args[0]
+    logger_mock.erro.assert_not_called()
+    await caixa.fechar()
@@ -4,10 +4,26 @@ Testes dos controladores (endpoints HTTP).
 Testa integração entre rotas FastAPI e casos de uso.
 """
 
+import gzip
+import json
+import random
+import threading
+import time
+
 import pytest
 from fastapi.testclient import TestClient
+from structlog.testing import capture_logs
 
-from app.principal import app
+from app.controladores.compressao import CacheVariantes, negociar_codificacao
+from app.controladores.respostas import montar_lista
+from app.core import disjuntor as modulo_disjuntor
+from app.core.amostragem import AmostradorLogs, ResumoRotas
+from app.core.disjuntor import Disjuntor
+from app.core.metricas import Histograma, RegistroMetricas
+from app.core.perfilador import PerfiladorAmostragem
+from app.core.vigia import VigiaRequisicoesLentas
+from app.configuracao import configuracoes
+from app.principal import app, criar_aplicacao
 
 client = TestClient(app)
 
@@ -20,6 +36,58 @@ def test_saude_retorna_ok():
     data = response.json()
     assert data["status"] == "ok"
     assert "mensagem" in data
+    assert data["disjuntores"]["formspree"] == "fechado"
+
+
+def test_disjuntor_abre_por_falhas_e_fecha_apos_teste():
+    """Testa fechado → aberto (taxa de falhas) → meio_aberto → fechado."""
+    agora = [0.0]
+    disjuntor = Disjuntor("teste", minimo=4, taxa=0.5, tempo_aberto=10, relogio=lambda: agora[0])
+    for sucesso in (True, False, True, False):
+        assert disjuntor.permitir()
+        disjuntor.registrar(sucesso, 0.01)
+    
+    assert disjuntor.estado == "aberto"
+    assert not disjuntor.permitir()
+    assert disjuntor.restante() == 10
+    
+    agora[0] = 10.0
+    assert disjuntor.permitir()  # chamada de teste
+    assert not disjuntor.permitir()  # só uma por vez
+    disjuntor.registrar(True, 0.01)
+    assert disjuntor.estado == "fechado"
+
+
+def test_disjuntor_abre_por_lentidao_e_reabre_se_teste_lento():
+    """Testa que chamadas lentas, mesmo bem-sucedidas, abrem o disjuntor."""
+    agora = [0.0]
+    disjuntor = Disjuntor("teste", minimo=2, lento=3.0, tempo_aberto=5, relogio=lambda: agora[0])
+    for _ in range(2):
+        disjuntor.permitir()
+        disjuntor.registrar(True, 8.0)
+    assert disjuntor.estado == "aberto"
+    
+    agora[0] = 5.0
+    assert disjuntor.permitir()
+    disjuntor.registrar(True, 4.0)
+    assert disjuntor.estado == "aberto"
+    assert disjuntor.restante() == 5
+
+
+def test_saude_degradada_com_disjuntor_aberto(monkeypatch):
+    """Testa que /saude mostra o disjuntor aberto sem deixar de responder 200."""
+    disjuntor = Disjuntor("provedor_teste", minimo=1)
+    disjuntor.registrar(False, 0.01)
+    monkeypatch.setitem(modulo_disjuntor._disjuntores, "provedor_teste", disjuntor)
+    
+    response = client.get("/saude")
+    
+    assert response.status_code == 200
+    assert response.json()["status"] == "degradado"
+    assert response.json()["disjuntores"]["provedor_teste"] == "aberto"
+    assert 'disjuntor_estado{nome="provedor_teste",estado="aberto"} 1' in client.get(
+        "/metrics"
+    ).text
 
 
 def test_obter_sobre_retorna_200():
@@ -44,6 +112,82 @@ def test_listar_projetos_retorna_200():
     assert isinstance(data["projetos"], list)
 
 
+def test_listar_projetos_paginado_por_cursor():
+    """Testa GET /api/v1/projetos com limite e cursor."""
+    completa = client.get("/api/v1/projetos").json()
+    vistos = []
+    cursor = None
+
+    while True:
+        params = {"limite": 1}
+        if cursor:
+            params["cursor"] = cursor
+        data = client.get("/api/v1/projetos", params=params).json()
+        vistos.extend(p["id"] for p in data["projetos"])
+        assert data["total"] == completa["total"]
+        cursor = data["proximo_cursor"]
+        if cursor is None:
+            break
+
+    assert vistos == [p["id"] for p in completa["projetos"]]
+
+
+def test_listar_projetos_cursor_invalido_retorna_422():
+    """Testa GET /api/v1/projetos com cursor malformado."""
+    response = client.get("/api/v1/projetos", params={"cursor": "@@@"})
+
+    assert response.status_code == 422
+    assert response.json()["erro"]["codigo"] == "CURSOR_INVALIDO"
+
+
+def test_listar_projetos_por_nome_rejeita_cursor_de_outra_ordenacao():
+    """Testa ?ordenacao= e cursor preso à ordenação que o gerou."""
+    por_nome = client.get(
+        "/api/v1/projetos", params={"ordenacao": "nome", "limite": 1}
+    ).json()
+    misturado = client.get(
+        "/api/v1/projetos", params={"cursor": por_nome["proximo_cursor"]}
+    )
+
+    nomes = [
+        p["nome"]
+        for p in client.get("/api/v1/projetos", params={"ordenacao": "nome"}).json()[
+            "projetos"
+        ]
+    ]
+    assert nomes == sorted(nomes, key=str.casefold)
+    assert por_nome["projetos"][0]["nome"] == nomes[0]
+    assert misturado.status_code == 422
+
+
+def test_listar_projetos_e_experiencias_filtram_por_tecnologia():
+    """Testa parâmetro `tecnologia` repetido em projetos e experiências."""
+    projetos = client.get(
+        "/api/v1/projetos",
+        params={"tecnologia": ["fastapi", "docker"], "limite": 1},
+    ).json()
+    experiencias = client.get(
+        "/api/v1/experiencias",
+        params={"tecnologia": ["SQL", "MongoDB"], "modo_tecnologia": "qualquer"},
+    ).json()
+
+    assert projetos["total"] == 2
+    assert len(projetos["projetos"]) == 1
+    assert projetos["proximo_cursor"] is not None
+    assert experiencias["total"] == 2
+
+
+def test_buscar_projetos_retorna_resultados_ranqueados():
+    """Testa GET /api/v1/projetos/busca sem acentos encontrando texto acentuado."""
+    response = client.get("/api/v1/projetos/busca", params={"q": "VALIDACAO"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == len(data["resultados"]) > 0
+    pontuacoes = [r["pontuacao"] for r in data["resultados"]]
+    assert pontuacoes == sorted(pontuacoes, reverse=True)
+
+
 def test_obter_projeto_existente_retorna_200():
     """Testa GET /api/projetos/{id} com projeto existente."""
     response = client.get("/api/projetos/portfolio-api")
@@ -55,6 +199,322 @@ def test_obter_projeto_existente_retorna_200():
     assert "tecnologias" in data
 
 
+def test_montar_lista_equivale_a_json_dumps():
+    """Testa que fragmentos prontos + extras formam o JSON esperado."""
+    fragmentos = [json.dumps({"id": "á"}, ensure_ascii=False).encode(), b'{"id":"b"}']
+
+    corpo = montar_lista("itens", fragmentos, total=2, proximo_cursor=None)
+
+    assert json.loads(corpo) == {
+        "itens": [{"id": "á"}, {"id": "b"}],
+        "total": 2,
+        "proximo_cursor": None,
+    }
+    assert montar_lista("itens", []) == b'{"itens":[]}'
+
+
+def test_get_condicional_retorna_304_sem_executar_caso_de_uso(monkeypatch):
+    """Testa ETag forte, Cache-Control e 304 antes do caso de uso."""
+    from app.controladores import api
+
+    primeira = client.get("/api/v1/projetos", params={"limite": 1})
+    etag = primeira.headers["etag"]
+    outras = {
+        client.get("/api/v1/projetos").headers["etag"],
+        client.get("/api/v1/sobre").headers["etag"],
+    }
+
+    def falhar(*args, **kwargs):
+        raise AssertionError("caso de uso não deveria executar")
+
+    monkeypatch.setattr(api._obter_projetos_uc, "executar_pagina", falhar)
+    segunda = client.get(
+        "/api/v1/projetos",
+        params={"limite": 1},
+        headers={"If-None-Match": f'"outro", W/{etag}'},
+    )
+
+    assert etag.startswith('"') and not etag.startswith("W/")
+    assert "stale-while-revalidate=" in primeira.headers["cache-control"]
+    assert segunda.status_code == 304
+    assert segunda.content == b""
+    assert segunda.headers["etag"] == etag
+    assert etag not in outras and len(outras) == 2
+
+
+def test_etag_por_parte_sem_montar_outras_respostas(monkeypatch):
+    """Testa ETag de /sobre sem fragmentos de projetos e estável entre workers."""
+    from app.controladores import api
+    from app.core.cache import CachePorVersao
+
+    antes = client.get("/api/v1/sobre").headers["etag"]
+    monkeypatch.setattr(api, "_respostas", CachePorVersao())  # "outro worker"
+
+    async def sem_projetos():
+        raise AssertionError("ETag de /sobre não deveria montar projetos")
+
+    monkeypatch.setattr(api, "_fragmentos_projetos", sem_projetos)
+    resposta = client.get("/api/v1/sobre", headers={"If-None-Match": antes})
+
+    assert resposta.status_code == 304
+    assert resposta.headers["etag"] == antes
+
+
+def test_get_condicional_valida_recurso_e_parametros_antes_do_etag():
+    """Testa 404/422 mesmo com If-None-Match: * e ETag sem parâmetros extras."""
+    coringa = {"If-None-Match": "*"}
+
+    inexistente = client.get("/api/v1/projetos/nao-existe", headers=coringa)
+    cursor_invalido = client.get(
+        "/api/v1/projetos", params={"cursor": "zzz"}, headers=coringa
+    )
+    etags = {
+        client.get("/api/v1/projetos", params=params).headers["etag"]
+        for params in ({}, {"_": "1"}, {"_": "2", "ordenacao": "destaque"})
+    }
+
+    assert inexistente.status_code == 404
+    assert cursor_invalido.status_code == 422
+    assert client.get("/api/v1/projetos", headers=coringa).status_code == 304
+    assert len(etags) == 1
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, esperado",
+    [
+        (None, None),
+        ("gzip", "gzip"),
+        ("gzip;q=0.4, br;q=0.8", "br"),
+        ("br, gzip", "br"),
+        ("*;q=0.5, br;q=0", "gzip"),
+        ("gzip;q=0, identity", None),
+        ("deflate", None),
+    ],
+)
+def test_negociar_codificacao(accept_encoding, esperado):
+    """Testa q-values, coringa e exclusão com q=0."""
+    assert negociar_codificacao(accept_encoding, ["br", "gzip"]) == esperado
+
+
+def test_variantes_comprimidas_uma_vez_por_corpo():
+    """Testa que a compressão roda só na primeira vez e é determinística."""
+    chamadas = []
+
+    def comprimir(corpo):
+        chamadas.append(corpo)
+        return gzip.compress(corpo, mtime=0)
+
+    variantes = CacheVariantes(maximo=1, codificadores={"gzip": comprimir})
+    corpo = b'{"projetos":[]}' * 50
+
+    variantes.obter("gzip", corpo)
+
+    assert variantes.obter("gzip", bytes(corpo)) == gzip.compress(corpo, mtime=0)
+    assert len(chamadas) == 1
+    variantes.obter("gzip", b"outro")
+    variantes.obter("gzip", corpo)
+    assert len(chamadas) == 3
+
+
+def test_resposta_comprimida_negociada_por_accept_encoding():
+    """Testa variante gzip com Vary e ETag próprios, e 304 da variante."""
+    identidade = client.get("/api/v1/projetos", headers={"Accept-Encoding": "identity"})
+    comprimida = client.get("/api/v1/projetos", headers={"Accept-Encoding": "gzip"})
+    nao_modificada = client.get(
+        "/api/v1/projetos",
+        headers={
+            "Accept-Encoding": "gzip",
+            "If-None-Match": comprimida.headers["etag"],
+        },
+    )
+
+    assert "content-encoding" not in identidade.headers
+    assert comprimida.headers["content-encoding"] == "gzip"
+    assert comprimida.headers["vary"] == "Accept-Encoding"
+    assert comprimida.content == identidade.content
+    assert comprimida.headers["etag"] != identidade.headers["etag"]
+    assert int(comprimida.headers["content-length"]) < len(identidade.content)
+    assert nao_modificada.status_code == 304
+    assert "content-encoding" not in nao_modificada.headers
+
+
+def test_middleware_adiciona_request_id_e_tempo_de_resposta():
+    """Testa headers do middleware ASGI em respostas de sucesso e erro."""
+    ok = client.get("/saude")
+    erro = client.get("/api/v1/projetos/inexistente")
+
+    assert ok.headers["x-request-id"] != erro.headers["x-request-id"]
+    assert erro.status_code == 404
+    for response in (ok, erro):
+        assert len(response.headers["x-request-id"]) == 36
+        assert response.headers["x-response-time"].endswith("ms")
+        assert float(response.headers["x-response-time"][:-2]) >= 0
+
+
+def test_amostrador_sempre_loga_erro_e_lentidao():
+    """Testa amostragem: erro e lentidão sempre, fração por rota no resto."""
+    amostrador = AmostradorLogs(
+        fracao_padrao=0.5,
+        fracoes_rotas={"/saude": 0.0},
+        lento_ms=100,
+        aleatorio=random.Random(42),
+    )
+
+    assert amostrador.motivo("/saude", 503, 1) == "erro"
+    assert amostrador.motivo("/saude", 200, 150) == "lento"
+    assert amostrador.motivo("/saude", 200, 1) is None
+    amostras = [amostrador.motivo("/api/v1/sobre", 200, 1) for _ in range(1000)]
+    assert 400 < amostras.count("amostra") < 600
+
+
+def test_resumo_rotas_libera_percentis_por_intervalo():
+    """Testa janela do resumo e percentis aproximados (erro <= 5%)."""
+    agora = [0.0]
+    resumo = ResumoRotas(intervalo=60, relogio=lambda: agora[0])
+    for duracao in range(1, 101):
+        resumo.registrar("/api/v1/projetos", float(duracao), erro=duracao > 98)
+
+    assert resumo.coletar() is None
+    agora[0] = 60.0
+    (item,) = resumo.coletar()
+
+    assert item["rota"] == "/api/v1/projetos"
+    assert (item["requisicoes"], item["erros"], item["max_ms"]) == (100, 2, 100)
+    assert item["p50_ms"] == pytest.approx(50, rel=0.05)
+    assert item["p99_ms"] == pytest.approx(99, rel=0.05)
+    agora[0] = 120.0
+    assert resumo.coletar() == []
+
+
+def test_histograma_renderiza_buckets_acumulados():
+    """Testa formato Prometheus: buckets `le` acumulados, soma e contagem."""
+    registro = RegistroMetricas()
+    duracao = registro.registrar(Histograma("duracao", "Duração.", ["rota"], [0.1, 1]))
+    for valor in (0.05, 0.1, 0.5, 3):
+        duracao.observar(valor, "/x")
+
+    linhas = registro.renderizar().splitlines()
+
+    assert "# TYPE duracao histogram" in linhas
+    assert 'duracao_bucket{rota="/x",le="0.1"} 2' in linhas
+    assert 'duracao_bucket{rota="/x",le="1"} 3' in linhas
+    assert 'duracao_bucket{rota="/x",le="+Inf"} 4' in linhas
+    assert 'duracao_sum{rota="/x"} 3.65' in linhas
+    assert 'duracao_count{rota="/x"} 4' in linhas
+
+
+def test_metrics_expoe_requisicoes_por_rota():
+    """Testa /metrics após requisições com rota parametrizada e 404."""
+    client.get("/api/v1/projetos/inexistente")
+    client.get("/api/v1/sobre")
+
+    response = client.get("/metrics")
+    corpo = response.text
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert (
+        'http_requisicoes_total{rota="/api/v1/projetos/{projeto_id}",'
+        'metodo="GET",status="4xx"}'
+    ) in corpo
+    assert 'http_requisicao_duracao_segundos_count{rota="/api/v1/sobre"}' in corpo
+    assert "http_requisicoes_em_andamento 1" in corpo
+    assert 'repositorio_cache_total{evento="acertos"}' in corpo
+    linhas = corpo.splitlines()
+    assert "# TYPE http_requisicoes_total counter" in linhas
+    assert "# TYPE repositorio_cache_total counter" in linhas
+    assert "# TYPE http_requisicoes_em_andamento gauge" in linhas
+    assert 'respostas_cache_total{resultado="acerto"}' in corpo
+
+
+def test_server_timing_por_cabecalho_detalha_camadas(monkeypatch):
+    """Testa modo "cabecalho": Server-Timing só quando a requisição pede."""
+    monkeypatch.setattr(configuracoes, "server_timing", "cabecalho")
+    cliente = TestClient(criar_aplicacao())
+
+    com_tempos = cliente.get(
+        "/api/v1/projetos?limite=1", headers={"X-Server-Timing": "1"}
+    )
+    sem_tempos = cliente.get("/api/v1/projetos?limite=1")
+
+    trechos = {
+        item.split(";")[0] for item in com_tempos.headers["server-timing"].split(", ")
+    }
+    assert {"repositorio", "caso_uso", "serializacao", "total"} <= trechos
+    assert "server-timing" not in sem_tempos.headers
+
+
+def _ocupar_cpu(segundos: float) -> None:
+    """Laço de CPU para aparecer nas amostras do perfilador."""
+    fim = time.perf_counter() + segundos
+    while time.perf_counter() < fim:
+        pass
+
+
+def test_perfilador_por_token_grava_pilhas_colapsadas(tmp_path):
+    """Testa seleção por X-Perfil e arquivo .folded com a função amostrada."""
+    perfilador = PerfiladorAmostragem(tmp_path, token="segredo", intervalo=0.001)
+    escopo = {"path": "/api/v1/projetos", "headers": [(b"x-perfil", b"segredo")]}
+
+    assert perfilador.deve_perfilar(escopo)
+    assert not perfilador.deve_perfilar({**escopo, "headers": [(b"x-perfil", b"x")]})
+    assert not perfilador.deve_perfilar({**escopo, "headers": []})
+
+    sessao = perfilador.iniciar()
+    _ocupar_cpu(0.1)
+    perfilador.encerrar(sessao, "/api/v1/projetos")
+    perfilador.encerrar_thread()
+
+    (arquivo,) = tmp_path.glob("api_v1_projetos.*.folded")
+    linhas = arquivo.read_text(encoding="utf-8").splitlines()
+    assert any("test_controladores:_ocupar_cpu" in linha for linha in linhas)
+    assert all(linha.rsplit(" ", 1)[1].isdigit() for linha in linhas)
+
+
+def test_perfilador_seleciona_fracao_por_template_de_rota():
+    """Testa PERFIL_ROTAS com template: qualquer id da rota é elegível."""
+    perfilador = PerfiladorAmostragem(
+        "perfis", fracoes_rotas={"/api/v1/projetos/{projeto_id}": 1.0}
+    )
+
+    def escopo(caminho):
+        return {"type": "http", "method": "GET", "path": caminho, "headers": [], "app": app}
+
+    assert perfilador.deve_perfilar(escopo("/api/v1/projetos/portfolio-api"))
+    assert perfilador.deve_perfilar(escopo("/api/v1/projetos/outro"))
+    assert not perfilador.deve_perfilar(escopo("/api/v1/projetos"))
+    assert not perfilador.deve_perfilar(escopo("/nao-existe"))
+
+
+def test_vigia_loga_pilha_da_requisicao_lenta_uma_vez():
+    """Testa captura da pilha de uma thread bloqueada, com request_id."""
+    vigia = VigiaRequisicoesLentas(limite_ms=20, intervalo=60)
+    registrada, liberar = threading.Event(), threading.Event()
+
+    def _handler_bloqueado():
+        vigiada = vigia.registrar("req-lenta", "/api/v1/projetos")
+        registrada.set()
+        liberar.wait(5)
+        vigia.concluir(vigiada)
+
+    thread = threading.Thread(target=_handler_bloqueado)
+    thread.start()
+    registrada.wait(5)
+    time.sleep(0.05)
+    with capture_logs() as logs:
+        vigia.verificar()
+        vigia.verificar()
+    liberar.set()
+    thread.join()
+    vigia.encerrar()
+
+    (evento,) = logs
+    assert evento["event"] == "requisicao_lenta"
+    assert evento["request_id"] == "req-lenta"
+    assert evento["decorrido_ms"] >= 20
+    assert any("_handler_bloqueado" in linha for linha in evento["pilha_event_loop"])
+
+
 def test_obter_projeto_inexistente_retorna_404():
     """Testa GET /api/projetos/{id} com projeto inexistente."""
     response = client.get("/api/projetos/projeto-inexistente")
@@ -66,6 +526,71 @@ def test_obter_projeto_inexistente_retorna_404():
     assert "mensagem" in data["erro"]
 
 
+def test_listagens_com_id_repetido_mostram_cada_ocorrencia(diretorio_dados, monkeypatch):
+    """Testa que itens com ID repetido não herdam o JSON do primeiro."""
+    from app.adaptadores import RepositorioJSON
+    from app.controladores import api
+    from app.core.cache import CachePorVersao
+
+    repetidos = {}
+    for arquivo, campo in (("projetos.json", "nome"), ("experiencias.json", "cargo")):
+        caminho = diretorio_dados / arquivo
+        itens = json.loads(caminho.read_text(encoding="utf-8"))
+        itens.append(dict(itens[0], **{campo: "Outra ocorrência"}))
+        repetidos[arquivo] = itens[0]
+        caminho.write_text(json.dumps(itens, ensure_ascii=False), encoding="utf-8")
+    monkeypatch.setattr(api._repositorio, "repositorio", RepositorioJSON(diretorio_dados))
+    monkeypatch.setattr(api, "_respostas", CachePorVersao())
+    monkeypatch.setattr(api._obter_projetos_uc, "_cache", CachePorVersao())
+    monkeypatch.setattr(api._obter_experiencias_uc, "_cache", CachePorVersao())
+
+    projetos = client.get("/api/v1/projetos").json()["projetos"]
+    experiencias = client.get("/api/v1/experiencias").json()["experiencias"]
+    primeiro = repetidos["projetos.json"]
+    detalhe = client.get(f"/api/v1/projetos/{primeiro['id']}").json()
+    cargos = [e["cargo"] for e in experiencias]
+
+    assert sorted(p["nome"] for p in projetos if p["id"] == primeiro["id"]) == sorted(
+        [primeiro["nome"], "Outra ocorrência"]
+    )
+    assert cargos.count("Outra ocorrência") == 1
+    assert cargos.count(repetidos["experiencias.json"]["cargo"]) == 1
+    assert detalhe["nome"] == primeiro["nome"]  # detalhe: primeira do arquivo
+
+
+def test_detalhes_comprimidos_uma_vez_com_catalogo_grande(diretorio_dados, monkeypatch):
+    """Testa que mais de 512 projetos não despejam variantes já comprimidas."""
+    from app.adaptadores import RepositorioJSON
+    from app.controladores import api
+    from app.core.cache import CachePorVersao
+
+    caminho = diretorio_dados / "projetos.json"
+    base = json.loads(caminho.read_text(encoding="utf-8"))[0]
+    projetos = [dict(base, id=f"projeto-{i}") for i in range(600)]
+    caminho.write_text(json.dumps(projetos, ensure_ascii=False), encoding="utf-8")
+    monkeypatch.setattr(api._repositorio, "repositorio", RepositorioJSON(diretorio_dados))
+    monkeypatch.setattr(api, "_respostas", CachePorVersao())
+    monkeypatch.setattr(api._obter_projetos_uc, "_cache", CachePorVersao())
+    chamadas = []
+
+    def comprimir(corpo):
+        chamadas.append(corpo)
+        return gzip.compress(corpo, mtime=0)
+
+    monkeypatch.setitem(api.CODIFICADORES_FIXOS, "gzip", comprimir)
+    cabecalhos = {"Accept-Encoding": "gzip"}
+
+    assert chamadas == []  # nada comprimido antes de ser pedido
+    for projeto in projetos:
+        client.get(f"/api/v1/projetos/{projeto['id']}", headers=cabecalhos)
+    primeiro = client.get("/api/v1/projetos/projeto-0", headers=cabecalhos)
+    client.get("/api/sobre", headers=cabecalhos)
+
+    assert len(chamadas) == len(projetos) + 1
+    assert primeiro.headers["content-encoding"] == "gzip"
+    assert primeiro.json()["id"] == "projeto-0"
+
+
 def test_obter_stack_retorna_200():
     """Testa endpoint GET /api/stack retorna tecnologias."""
     response = client.get("/api/stack")
@@ -77,6 +602,18 @@ def test_obter_stack_retorna_200():
     assert isinstance(data["stack"], list)
 
 
+def test_obter_stack_compacto_traz_so_grupos():
+    """Testa GET /api/stack?formato=compacto contra o formato completo."""
+    completo = client.get("/api/stack")
+    compacto = client.get("/api/stack", params={"formato": "compacto"})
+
+    assert compacto.status_code == 200
+    assert compacto.headers["content-type"] == "application/json"
+    assert compacto.json() == {"por_categoria": completo.json()["por_categoria"]}
+    assert len(compacto.content) < len(completo.content) * 0.6
+    assert client.get("/api/stack").content == completo.content
+
+
 def test_listar_experiencias_retorna_200():
     """Testa endpoint GET /api/experiencias retorna lista."""
     response = client.get("/api/experiencias")
@@ -88,12 +625,12 @@ def test_listar_experiencias_retorna_200():
     assert isinstance(data["experiencias"], list)
 
 
-def test_enviar_contato_com_dados_validos_retorna_200():
-    """Testa POST /api/contato com dados válidos (sem form_id real).
+def test_enviar_contato_com_dados_validos_retorna_202():
+    """Testa POST /api/contato com dados válidos.
     
-    Nota: Como não há FORMSPREE_FORM_ID configurado no ambiente de testes,
-    o endpoint retorna 500 (falha ao enviar). Em produção com form_id válido,
-    retornaria 200 com sucesso=true.
+    Nota: O envio acontece em segundo plano; o endpoint só grava na caixa
+    de saída e responde 202 com o id de rastreamento, mesmo sem
+    FORMSPREE_FORM_ID configurado no ambiente de testes.
     """
     payload = {
         "nome": "Maria Silva",
@@ -104,8 +641,10 @@ def test_enviar_contato_com_dados_validos_retorna_200():
     
     response = client.post("/api/contato", json=payload)
     
-    # Como não há form_id configurado, deve retornar 500
-    assert response.status_code == 500
+    assert response.status_code == 202
+    data = response.json()
+    assert data["sucesso"] is True
+    assert len(data["id"]) == 32
 
 
 def test_enviar_contato_com_dados_invalidos_retorna_422():